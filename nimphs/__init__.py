@@ -3,7 +3,7 @@ import bpy
 from bpy.utils import previews
 from bpy.props import PointerProperty
 from bpy.app import version as bl_version
-from bpy.app.handlers import frame_change_pre, frame_change_post, save_pre
+from bpy.app.handlers import frame_change_pre, frame_change_post, save_pre, load_pre
 from bpy.types import Scene, Object, TOPBAR_MT_file_import, VIEW3D_MT_editor_menus, VIEW3D_HT_tool_header
 
 import os
@@ -72,6 +72,10 @@ if LOAD_INSTALLER is False:
         update_openfoam_streaming_sequences,
         update_telemac_streaming_sequences,
         update_telemac_mesh_sequences,
+        follow_telemac_streaming_sequences,
+        clear_mesh_caches_on_load,
+        FOLLOW_INTERVAL,
+        stop_prefetcher,
     )
 
     auto_load.init()
@@ -109,6 +113,10 @@ def register() -> None:  # noqa: D103
         frame_change_pre.append(update_telemac_streaming_sequences)
         frame_change_post.append(update_telemac_mesh_sequences)
         save_pre.append(nimphs_on_save_pre)
+        load_pre.append(clear_mesh_caches_on_load)
+
+        # Check files followed by TELEMAC streaming sequences (running simulations)
+        bpy.app.timers.register(follow_telemac_streaming_sequences, first_interval=FOLLOW_INTERVAL, persistent=True)
 
         # Add custom icons
         icons = previews.new()
@@ -159,6 +167,14 @@ def unregister() -> None:  # noqa: D103
         frame_change_pre.remove(update_telemac_streaming_sequences)
         frame_change_post.remove(update_telemac_mesh_sequences)
         save_pre.remove(nimphs_on_save_pre)
+        load_pre.remove(clear_mesh_caches_on_load)
+
+        if bpy.app.timers.is_registered(follow_telemac_streaming_sequences):
+            bpy.app.timers.unregister(follow_telemac_streaming_sequences)
+
+        # Stop background reads of 'streaming sequence' objects
+        for file_data in bpy.context.scene.nimphs.file_data.values():
+            stop_prefetcher(file_data)
 
         # Remove custom import operators from 'File > Import'
         TOPBAR_MT_file_import.remove(import_openfoam_menu_draw)
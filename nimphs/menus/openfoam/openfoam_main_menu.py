@@ -21,3 +21,4 @@ class NIMPHS_MT_OpenfoamMainMenu(Menu):
 
         self.layout.menu("NIMPHS_MT_OpenfoamCreateSequenceMenu")
         self.layout.menu("NIMPHS_MT_OpenfoamPointDataMenu")
+        self.layout.operator("nimphs.optimize_result", text="Optimize result")
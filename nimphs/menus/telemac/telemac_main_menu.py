@@ -22,3 +22,4 @@ class NIMPHS_MT_TelemacMainMenu(Menu):
         self.layout.menu("NIMPHS_MT_TelemacCreateSequenceMenu")
         self.layout.menu("NIMPHS_MT_TelemacPointDataMenu")
         self.layout.menu("NIMPHS_MT_TelemacVolumeMenu")
+        self.layout.operator("nimphs.optimize_result", text="Optimize result")
@@ -118,6 +118,8 @@ class NIMPHS_OT_OpenfoamCreateMeshSequence(NIMPHS_CreateMeshSequence):
         row.prop(self.import_settings, "triangulate", text="Triangulate")
         row = box.row()
         row.prop(self.import_settings, "case_type", text="Case")
+        row = box.row()
+        row.prop(self.import_settings, "load_required_fields", text="Load required fields")
 
         # Clip settings
         draw_clip_settings(self.layout, self.clip)
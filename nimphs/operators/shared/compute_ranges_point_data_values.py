@@ -6,8 +6,12 @@ import logging
 log = logging.getLogger(__name__)
 
 import numpy as np
+from typing import Generator
 
 from nimphs.properties.utils.point_data import PointDataManager
+from nimphs.properties.utils.histogram import StreamingHistogram
+from nimphs.properties.utils.preferences import get_preference
+from nimphs.properties.telemac.file_data import TelemacFileData
 from nimphs.panels.utils import draw_point_data, get_selected_object
 from nimphs.operators.shared.modal_operator import NIMPHS_ModalOperator
 from nimphs.properties.shared.point_data_settings import NIMPHS_PointDataSettings
@@ -33,8 +37,12 @@ class NIMPHS_OT_ComputeRangesPointDataValues(Operator, NIMPHS_ModalOperator):
     minima: list = []
     #: list: List of maxima for each selected variable
     maxima: list = []
+    #: list: Histogram of all the values of each selected variable (OpenFOAM)
+    histograms: list = []
     #: Object: Selected object
     obj: Object = None
+    #: Generator: Computation of the statistics index (TELEMAC)
+    steps: Generator = None
 
     @classmethod
     def poll(cls, context: Context) -> bool:
@@ -121,7 +129,7 @@ class NIMPHS_OT_ComputeRangesPointDataValues(Operator, NIMPHS_ModalOperator):
 
     def execute(self, context: Context) -> set:
         """
-        Compute ranges of point data values ('GLOBAL' scope).
+        Compute ranges of point data values ('GLOBAL' and 'PERCENTILE' scopes).
 
         Args:
             context (Context): context
@@ -133,6 +141,8 @@ class NIMPHS_OT_ComputeRangesPointDataValues(Operator, NIMPHS_ModalOperator):
         # Clear data
         self.minima.clear()
         self.maxima.clear()
+        self.histograms.clear()
+        self.steps = None
 
         # Add chosen point data in minima and maxima dictionaries
         if self.mode == 'TEST':
@@ -150,6 +160,7 @@ class NIMPHS_OT_ComputeRangesPointDataValues(Operator, NIMPHS_ModalOperator):
         for id in range(vars.length()):
             self.minima.append([])
             self.maxima.append([])
+            self.histograms.append(StreamingHistogram())
 
         if self.mode == 'MODAL':
             self.time_point = 0
@@ -185,6 +196,10 @@ class NIMPHS_OT_ComputeRangesPointDataValues(Operator, NIMPHS_ModalOperator):
         """
 
         if event is not None and event.type == 'ESC':
+            # Cancel pending chunks of the computation of the statistics index
+            if self.steps is not None:
+                self.steps.close()
+                self.steps = None
             super().stop(context, canceled=True)
             return {'CANCELLED'}
 
@@ -195,37 +210,90 @@ class NIMPHS_OT_ComputeRangesPointDataValues(Operator, NIMPHS_ModalOperator):
             if self.time_point <= self.end:
 
                 file_data = context.scene.nimphs.file_data["ops"]
-                file_data.update_data(self.time_point)
 
-                # Compute local minima and maxima
-                for name, id in zip(vars.names, range(vars.length())):
+                if file_data.module == 'TELEMAC':
+                    # Compute the statistics index of the file (if needed) and read local minima and maxima from it
+                    if not self.step_statistics(context, file_data):
+                        return {'PASS_THROUGH'}
 
-                    data = file_data.get_point_data(name)
-                    self.minima[id].append(float(np.min(data)))
-                    self.maxima[id].append(float(np.max(data)))
+                    for name, id in zip(vars.names, range(vars.length())):
+                        var_id = file_data.statistics.names.index(name)
+                        self.minima[id] = file_data.statistics.minima[:, var_id].min(axis=1).tolist()
+                        self.maxima[id] = file_data.statistics.maxima[:, var_id].max(axis=1).tolist()
 
-            else:
-                file_data = context.scene.nimphs.file_data.get(self.obj.nimphs.uid, None)
+                    self.time_point = self.end + 1
 
-                if file_data is None:
-                    self.report({'ERROR'}, "File data not found. Can't update.")
-                    super().stop(context)
-                    return {'CANCELLED'}
+                else:
+                    file_data.update_data(self.time_point)
 
-                # Compute global minima and maxima from list of local values
-                for name, id in zip(vars.names, range(vars.length())):
+                    # Compute local minima and maxima
+                    for name, id in zip(vars.names, range(vars.length())):
 
-                    mini = float(np.min(self.minima[id]))
-                    maxi = float(np.max(self.maxima[id]))
+                        data = file_data.get_point_data(name)
+                        self.minima[id].append(float(np.min(data)))
+                        self.maxima[id].append(float(np.max(data)))
+                        self.histograms[id].update(data)
 
-                    # Update point data information
-                    file_data.update_var_range(name, scope='GLOBAL', data={"min": mini, "max": maxi})
+                    self.update_progress(context, self.time_point, self.end + 1)
+                    self.time_point += 1
+                    return {'PASS_THROUGH'}
 
-                self.report({'INFO'}, "Compute ranges finished")
+            file_data = context.scene.nimphs.file_data.get(self.obj.nimphs.uid, None)
+
+            if file_data is None:
+                self.report({'ERROR'}, "File data not found. Can't update.")
                 super().stop(context)
-                return {'FINISHED'}
+                return {'CANCELLED'}
+
+            # Compute global minima and maxima from list of local values
+            percentile = float(get_preference("percentile", 1.0))
+            for name, id in zip(vars.names, range(vars.length())):
+
+                mini = float(np.min(self.minima[id]))
+                maxi = float(np.max(self.maxima[id]))
+
+                # Update point data information
+                file_data.update_var_range(name, scope='GLOBAL', data={"min": mini, "max": maxi})
+
+                # Value range without outliers, from the histogram of all the values of the variable
+                if file_data.module == 'TELEMAC':
+                    low, high = file_data.statistics.get_percentile_range(name, percentile)
+                else:
+                    # Note: values of the histogram are approximated, keep them in the actual value range
+                    low, high = np.clip(self.histograms[id].get_range(percentile), mini, maxi)
+                file_data.update_var_range(name, scope='PERCENTILE', data={"min": low, "max": high})
 
-            self.update_progress(context, self.time_point, self.end + 1)
-            self.time_point += 1
+            self.report({'INFO'}, "Compute ranges finished")
+            super().stop(context)
+            return {'FINISHED'}
 
         return {'PASS_THROUGH'}
+
+    def step_statistics(self, context: Context, file_data: TelemacFileData) -> bool:
+        """
+        Run one step of the computation of the statistics index (single pass over the file, saved on disk).
+
+        The index is computed by worker threads, each step only reports their progress.
+
+        Args:
+            context (Context): context
+            file_data (TelemacFileData): file data
+
+        Returns:
+            bool: ``True`` if the statistics index is available
+        """
+
+        if file_data.statistics.is_ok():
+            return True
+
+        if self.steps is None:
+            self.steps = file_data.statistics.compute(file_data.file)
+
+        processed = next(self.steps, None)
+        if processed is None:
+            self.steps = None
+            file_data.statistics.save()
+            return True
+
+        self.update_progress(context, processed, file_data.nb_time_points)
+        return False
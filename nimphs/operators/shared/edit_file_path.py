@@ -7,6 +7,8 @@ import logging
 log = logging.getLogger(__name__)
 
 from nimphs.panels.utils import get_selected_object
+from nimphs.operators.utils.sequence import stop_prefetcher
+from nimphs.operators.utils.object import clear_mesh_caches
 from nimphs.properties.telemac.file_data import TelemacFileData
 from nimphs.properties.openfoam.file_data import OpenfoamFileData
 
@@ -86,6 +88,8 @@ class NIMPHS_OT_EditFilePath(Operator, ImportHelper):
             return {'CANCELLED'}
 
         # Update file data
+        stop_prefetcher(context.scene.nimphs.file_data[obj.nimphs.uid])
+        clear_mesh_caches()
         file_data.copy(context.scene.nimphs.file_data[obj.nimphs.uid])
         context.scene.nimphs.file_data[obj.nimphs.uid] = file_data
 
@@ -0,0 +1,183 @@
+# <pep8 compliant>
+from bpy.types import Operator, Context, Event, Object
+from bpy.props import BoolProperty, IntProperty
+
+import logging
+log = logging.getLogger(__name__)
+
+import time
+from typing import Generator
+
+from nimphs.panels.utils import get_selected_object
+from nimphs.operators.utils.columnar import get_conversion_steps
+from nimphs.operators.shared.modal_operator import NIMPHS_ModalOperator
+
+
+class NIMPHS_OT_OptimizeResult(Operator, NIMPHS_ModalOperator):
+    """Operator to convert the file of the selected object to a chunked columnar store."""
+
+    register_cls = True
+    is_custom_base_cls = False
+
+    bl_idname = "nimphs.optimize_result"
+    bl_label = "Optimize result"
+    bl_description = "Convert the file of the selected object to a chunked columnar store (faster random access)"
+
+    #: bpy.props.IntProperty: Number of time points per block.
+    block_size: IntProperty(
+        name="Block size",
+        description="Number of time points per block",
+        default=16,
+        min=1,
+        soft_max=256,
+    )
+
+    #: bpy.props.BoolProperty: Compress blocks (smaller on disk, slower to read).
+    compress: BoolProperty(
+        name="Compress",  # noqa: F821
+        description="Compress blocks (smaller on disk, slower to read)",
+        default=False,
+    )
+
+    #: Object: Selected object
+    obj: Object = None
+    #: Generator: Steps of the conversion
+    steps: Generator = None
+    #: int: Number of time points to convert
+    nb_time_points: int = 0
+    #: float: Start time of the conversion
+    start: float = 0.0
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        """
+        If false, locks the button of the operator.
+
+        Args:
+            context (Context): context
+
+        Returns:
+            bool: state of the operator
+        """
+
+        obj = get_selected_object(context)
+        if obj is None or context.scene.nimphs.m_op_running:
+            return False
+
+        return obj.nimphs.module in ['OpenFOAM', 'TELEMAC']
+
+    def invoke(self, context: Context, _event: Event) -> set:
+        """
+        Prepare operator settings. Function triggered before the user can edit settings.
+
+        Args:
+            context (Context): context
+            _event (Event): event
+
+        Returns:
+            set: state of the operator
+        """
+
+        self.obj = get_selected_object(context)
+        if self.obj is None:
+            return {'CANCELLED'}
+
+        file_data = context.scene.nimphs.file_data.get(self.obj.nimphs.uid, None)
+        if file_data is None:
+            self.report({'ERROR'}, "Reload file data first")
+            return {'CANCELLED'}
+
+        self.nb_time_points = file_data.nb_time_points
+
+        if self.mode == 'TEST':
+            return {'FINISHED'}
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, _context: Context) -> None:
+        """
+        Layout of the popup window.
+
+        Args:
+            _context (Context): context
+        """
+
+        box = self.layout.box()
+        row = box.row()
+        row.prop(self, "block_size", text="Block size")
+        row = box.row()
+        row.prop(self, "compress", text="Compress")
+
+    def execute(self, context: Context) -> set:
+        """
+        Prepare the conversion of the file of the selected object.
+
+        Args:
+            context (Context): context
+
+        Returns:
+            set: state of the operator
+        """
+
+        # -------------------------------- #
+        # /!\ For testing purpose only /!\ #
+        # -------------------------------- #
+        if self.mode == 'TEST':
+            state = self.invoke(context, None)
+            if state != {'FINISHED'}:
+                return state
+
+        self.start = time.time()
+        module = self.obj.nimphs.module
+        settings = self.obj.nimphs.settings
+        io_settings = settings.openfoam.import_settings if module == 'OpenFOAM' else None
+        self.steps = get_conversion_steps(settings.file_path, module, settings=io_settings,
+                                          block_size=self.block_size, compress=self.compress)
+
+        if self.mode == 'TEST':
+            for _processed in self.steps:
+                pass
+
+            return {'FINISHED'}
+
+        super().prepare(context, "Optimizing result...")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context: Context, event: Event) -> set:
+        """
+        Run one step of the conversion (one block of time points).
+
+        Args:
+            context (Context): context
+            event (Event): event
+
+        Returns:
+            set: state of the operator
+        """
+
+        if event.type == 'ESC':
+            # Stop the conversion, the incomplete store is removed
+            if self.steps is not None:
+                self.steps.close()
+                self.steps = None
+            super().stop(context, canceled=True)
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+            try:
+                processed = next(self.steps, None)
+            except Exception:
+                log.error("Error when optimizing result", exc_info=1)
+                self.report({'ERROR'}, "Error when optimizing result")
+                super().stop(context)
+                return {'CANCELLED'}
+
+            if processed is None:
+                super().stop(context)
+                elapsed = time.time() - self.start
+                self.report({'INFO'}, f"Optimize result finished ({elapsed:.1f}s). Reload file data to use it.")
+                return {'FINISHED'}
+
+            self.update_progress(context, processed, self.nb_time_points)
+
+        return {'PASS_THROUGH'}
@@ -5,6 +5,8 @@ from bpy.props import EnumProperty, IntProperty, StringProperty
 import logging
 log = logging.getLogger(__name__)
 
+import numpy as np
+
 from nimphs.panels.utils import get_selected_object
 from nimphs.properties.utils.point_data import PointDataManager
 from nimphs.properties.utils.properties import available_point_data
@@ -31,6 +33,9 @@ class NIMPHS_OT_TelemacExtractPointData(Operator, NIMPHS_ModalOperator):
     #: bpy.types.Object: Selected object
     obj: Object = None
 
+    #: np.ndarray: Extracted values (one value per time point, from start to end)
+    values: np.ndarray = None
+
     #: bpy.props.IntProperty: Index of the vertex from which extract data.
     vertex_id: IntProperty(
         name="Vertex id",
@@ -216,6 +221,7 @@ class NIMPHS_OT_TelemacExtractPointData(Operator, NIMPHS_ModalOperator):
 
         if self.mode == 'MODAL':
             self.chosen_variable = PointDataManager(self.point_data).get(0, prop='NAME')
+            self.extract(context)
             super().prepare(context, "Extracting...")
             return {'RUNNING_MODAL'}
 
@@ -225,6 +231,7 @@ class NIMPHS_OT_TelemacExtractPointData(Operator, NIMPHS_ModalOperator):
         if self.mode == 'TEST':
             self.invoke(context, None)
             self.chosen_variable = PointDataManager(self.test_data).get(0, prop='NAME')
+            self.extract(context)
 
             while self.time_point <= self.end:
 
@@ -274,6 +281,20 @@ class NIMPHS_OT_TelemacExtractPointData(Operator, NIMPHS_ModalOperator):
 
         return {'PASS_THROUGH'}
 
+    def extract(self, context: Context) -> None:
+        """
+        Read values of the selected vertex for all the time points in one pass.
+
+        Args:
+            context (Context): context
+        """
+
+        file_data = context.scene.nimphs.file_data["ops"]
+
+        vertex_id = self.vertex_id + file_data.nb_vertices * self.plane_id
+        data = file_data.get_time_series([self.chosen_variable], [vertex_id], start=self.start, end=self.end + 1)
+        self.values = data[:, 0, 0]
+
     def run_one_step(self, context: Context) -> set:
         """
         Run one step of the process.
@@ -285,12 +306,8 @@ class NIMPHS_OT_TelemacExtractPointData(Operator, NIMPHS_ModalOperator):
             set: state of the operation. Enum in ['PASS_THROUGH', 'CANCELLED'].
         """
 
-        # Get and update file data
-        file_data = context.scene.nimphs.file_data["ops"]
-        file_data.update_data(self.time_point)
-
         # Get value of the selected vertex
-        value = file_data.get_point_data(self.chosen_variable)[self.vertex_id + file_data.nb_vertices * self.plane_id]
+        value = float(self.values[self.time_point - self.start])
 
         # Insert new keyframe in custom property
         context.scene.nimphs.op_target[self.chosen_variable] = value
@@ -7,7 +7,9 @@ log = logging.getLogger(__name__)
 import time
 
 from nimphs.panels.utils import get_selected_object
+from nimphs.operators.utils.mesh import TelemacMeshUtils
 from nimphs.operators.utils.object import TelemacObjectUtils
+from nimphs.operators.utils.vertex_color import TelemacVertexColorUtils
 from nimphs.operators.utils.material import TelemacMaterialUtils
 
 
@@ -40,7 +42,12 @@ class NIMPHS_OT_TelemacPreview(Operator):
         file_data = context.scene.nimphs.file_data.get(obj.nimphs.uid, None)
 
         try:
-            file_data.update_data(time_point)
+            # Only read variables used for z-values and vertex colors
+            names = TelemacVertexColorUtils.required_point_data(point_data)
+            for type in ['BOTTOM', 'WATER_DEPTH']:
+                names += TelemacMeshUtils.required_point_data(file_data, type=type)
+
+            file_data.update_data(time_point, names=names)
             children = TelemacObjectUtils.base(file_data, obj.name, point_data)
 
             for child, id in zip(children, range(len(children))):
@@ -7,6 +7,8 @@ log = logging.getLogger(__name__)
 import time
 
 from nimphs.panels.utils import get_selected_object
+from nimphs.operators.utils.sequence import stop_prefetcher
+from nimphs.operators.utils.object import clear_mesh_caches
 from nimphs.properties.utils.point_data import PointDataManager
 from nimphs.properties.telemac.file_data import TelemacFileData
 
@@ -48,6 +50,8 @@ class NIMPHS_OT_TelemacReloadFile(Operator):
             obj.nimphs.uid = str(time.time())
 
         # Load saved information
+        stop_prefetcher(context.scene.nimphs.file_data.get(obj.nimphs.uid, None))
+        clear_mesh_caches()
         context.scene.nimphs.file_data[obj.nimphs.uid] = file_data
         if obj.nimphs.settings.point_data.save != "":
             context.scene.nimphs.file_data[obj.nimphs.uid].vars = PointDataManager(obj.nimphs.settings.point_data.save)
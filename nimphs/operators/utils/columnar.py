@@ -0,0 +1,65 @@
+# <pep8 compliant>
+import logging
+log = logging.getLogger(__name__)
+
+import time
+from pathlib import Path
+from typing import Generator, Union
+
+from nimphs.properties.shared.columnar_store import get_store_path
+from nimphs.properties.telemac.columnar_file import convert_telemac_file
+from nimphs.properties.openfoam.columnar_case import convert_openfoam_case
+from nimphs.properties.openfoam.import_settings import NIMPHS_OpenfoamImportSettings
+
+
+def get_conversion_steps(file_path: str, module: str, settings: Union[NIMPHS_OpenfoamImportSettings, None] = None,
+                         block_size: int = 16, compress: bool = False) -> Generator[int, None, None]:
+    """
+    Get the steps of the conversion of a result file to a columnar store.
+
+    Args:
+        file_path (str): path to the result file
+        module (str): name of the module. Enum in ['OpenFOAM', 'TELEMAC'].
+        settings (Union[NIMPHS_OpenfoamImportSettings, None], optional): OpenFOAM import settings. Defaults to None.
+        block_size (int, optional): number of time points per block. Defaults to 16.
+        compress (bool, optional): compress blocks. Defaults to False.
+
+    Raises:
+        ValueError: if the module is unknown
+
+    Returns:
+        Generator[int, None, None]: generator which yields the number of converted time points
+    """
+
+    if module == 'TELEMAC':
+        return convert_telemac_file(file_path, block_size=block_size, compress=compress)
+    if module == 'OpenFOAM':
+        return convert_openfoam_case(file_path, settings=settings, block_size=block_size, compress=compress)
+
+    raise ValueError(f"Unknown module {module}")
+
+
+def convert_result(file_path: str, module: str, settings: Union[NIMPHS_OpenfoamImportSettings, None] = None,
+                   block_size: int = 16, compress: bool = False) -> Path:
+    """
+    Convert a result file to a columnar store (headless version of the 'optimize result' operator).
+
+    Args:
+        file_path (str): path to the result file
+        module (str): name of the module. Enum in ['OpenFOAM', 'TELEMAC'].
+        settings (Union[NIMPHS_OpenfoamImportSettings, None], optional): OpenFOAM import settings. Defaults to None.
+        block_size (int, optional): number of time points per block. Defaults to 16.
+        compress (bool, optional): compress blocks. Defaults to False.
+
+    Returns:
+        Path: path to the columnar store
+    """
+
+    start = time.time()
+
+    for _processed in get_conversion_steps(file_path, module, settings=settings, block_size=block_size,
+                                           compress=compress):
+        pass
+
+    log.info(f"Converted {file_path}: " + "{:.4f}".format(time.time() - start) + "s")
+    return get_store_path(file_path)
@@ -5,6 +5,8 @@ from bpy.types import Object
 import logging
 log = logging.getLogger(__name__)
 
+import json
+
 
 class MaterialUtils():
     """Utility functions to generate materials for the both modules."""
@@ -20,12 +22,19 @@ class MaterialUtils():
 
             {Vertex color}[color] >>> [image]{Separate RBG}[R, G, B] >>> [color]{Principled BSDF}
 
+        When point data are written as attributes (see 'point data output' preference), it generates:
+
+        .. code-block:: text
+
+            {Attribute}[fac] >>> [color]{Principled BSDF}
+
         Args:
             obj (Object): object on which to apply the material
             name (str, optional): name of the material. Defaults to "NIMPHS_preview_material".
         """
 
-        if len(obj.data.vertex_colors) <= 0:
+        attributes = json.loads(obj.data.get("nimphs_attributes", "[]"))
+        if len(obj.data.vertex_colors) <= 0 and len(attributes) <= 0:
             log.warning("No vertex color layer")
             return
 
@@ -35,10 +44,27 @@ class MaterialUtils():
             material = bpy.data.materials.new(name=name)
             material.use_nodes = True
 
-        layer_name = obj.data.vertex_colors[0].name
-
         # Get node tree
         tree = material.node_tree
+        principled_bsdf = tree.nodes.get("Principled BSDF")
+
+        if len(obj.data.vertex_colors) <= 0:
+            attribute = tree.nodes.get(f"{name}_attribute")
+            if attribute is None:
+                attribute = tree.nodes.new(type="ShaderNodeAttribute")
+                attribute.name = f"{name}_attribute"
+                attribute.location = (-250, 0)
+
+            # No need to remove old links thanks to the 'verify limits' argument
+            tree.links.new(attribute.outputs["Fac"], principled_bsdf.inputs[0])
+
+            # Update attribute to preview
+            attribute.attribute_name = attributes[0]
+            # Make sure it is the active material
+            obj.active_material = material
+            return
+
+        layer_name = obj.data.vertex_colors[0].name
 
         vertex_color = tree.nodes.get(f"{name}_vertex_color")
         if vertex_color is None:
@@ -53,7 +79,6 @@ class MaterialUtils():
             separate_rgb.location = (-250, 250)
             tree.links.new(vertex_color.outputs[0], separate_rgb.inputs[0])
 
-        principled_bsdf = tree.nodes.get("Principled BSDF")
         # No need to remove old links thanks to the 'verify limits' argument
         tree.links.new(separate_rgb.outputs[0], principled_bsdf.inputs[0])
 
@@ -1,5 +1,4 @@
 # <pep8 compliant>
-from copy import deepcopy
 from bpy.types import Object
 
 import logging
@@ -7,7 +6,7 @@ log = logging.getLogger(__name__)
 
 import numpy as np
 from typing import Union
-from pyvista import PolyData, UnstructuredGrid
+from pyvista import PolyData, UnstructuredGrid, convert_array
 from nimphs.properties.utils.interpolation import InterpInfo
 from nimphs.properties.utils.point_data import PointDataInformation
 from nimphs.properties.telemac.file_data import TelemacFileData
@@ -18,6 +17,28 @@ from nimphs.properties.openfoam.file_data import OpenfoamFileData
 class TelemacMeshUtils():
     """Utility functions for generating meshes for the TELEMAC module."""
 
+    @classmethod
+    def required_point_data(cls, file_data: TelemacFileData, type: str = 'BOTTOM') -> list[str]:
+        """
+        Get the names of the variables needed to generate vertices of the mesh.
+
+        Args:
+            file_data (NIMPHS_TelemacFileData): file data
+            type (str, optional): name of the variable to use as z-values. Defaults to 'BOTTOM'.
+
+        Returns:
+            list[str]: names of the variables
+        """
+
+        if file_data.is_3d():
+            names = ["ELEVATION Z", "COTE Z"]
+        elif type == 'WATER_DEPTH':
+            names = ["WATER DEPTH", "HAUTEUR D'EAU", "FREE SURFACE", "SURFACE LIBRE", "BOTTOM", "FOND"]
+        else:
+            names = ["BOTTOM", "FOND"]
+
+        return [name for name in names if name in file_data.vars.names]
+
     @classmethod
     def vertices(cls, file_data: TelemacFileData, offset: int = 0,
                  type: str = 'BOTTOM') -> Union[np.ndarray, None]:
@@ -65,7 +86,8 @@ class TelemacMeshUtils():
                 if name in ["WATER DEPTH", "HAUTEUR D'EAU"]:
                     # Get data for z-values
                     bottom, name = file_data.get_point_data_from_list(["BOTTOM", "FOND"])
-                    data += bottom
+                    # Note: do not add in-place, data is a read-only view on the file
+                    data = data + bottom
 
                 vertices = np.hstack((file_data.vertices, data))
 
@@ -87,16 +109,19 @@ class TelemacMeshUtils():
             np.ndarray: vertices
         """
 
+        names = cls.required_point_data(file_data, type=obj.nimphs.settings.telemac.z_name)
+
         # Get data from left time point
-        file_data.update_data(time_info.left)
+        file_data.update_data(time_info.left, names=names)
         left = cls.vertices(file_data, offset=offset, type=obj.nimphs.settings.telemac.z_name)
 
         if not time_info.exists:
             # Get data from right time point
-            file_data.update_data(time_info.right)
+            file_data.update_data(time_info.right, names=names)
             right = cls.vertices(file_data, offset=offset, type=obj.nimphs.settings.telemac.z_name)
 
-            percentage = np.abs(time_info.frame - time_info.left_frame) / (time_info.time_steps + 1)
+            # Note: python float, so that float32 data are not promoted
+            percentage = abs(time_info.frame - time_info.left_frame) / (time_info.time_steps + 1)
 
             return (left.T + (right.T - left.T) * percentage).T
 
@@ -108,6 +133,24 @@ class TelemacMeshUtils():
 class OpenfoamMeshUtils():
     """Utility functions for generating meshes for the OpenFOAM module."""
 
+    @classmethod
+    def required_point_data(cls, clip: Union[NIMPHS_OpenfoamClipProperty, None] = None) -> list[str]:
+        """
+        Get the names of the variables needed to generate the mesh.
+
+        Args:
+            clip (Union[NIMPHS_OpenfoamClipProperty, None], optional): clip settings. Defaults to None.
+
+        Returns:
+            list[str]: names of the variables
+        """
+
+        if clip is None or clip.type != 'SCALAR':
+            return []
+
+        info = PointDataInformation(json_string=clip.scalar.name)
+        return [] if info.name == "None" else [info.name]
+
     @classmethod
     def vertices(cls, file_data: OpenfoamFileData,
                  clip: NIMPHS_OpenfoamClipProperty = None) -> tuple[Union[np.ndarray, None],
@@ -115,6 +158,9 @@ class OpenfoamMeshUtils():
         """
         Generate vertices and extracted surface of the given OpenFOAM file.
 
+        The raw mesh is not modified: clips are applied on a shallow copy (point and cell arrays are shared, not\
+        copied). Without clip, the surface is reused while the mesh does not change (see OpenfoamSurfaceCache).
+
         Args:
             file_data (NIMPHS_OpenfoamFileData): file data
             clip (NIMPHS_OpenfoamClipProperty, optional): clip settings. Defaults to None.
@@ -124,10 +170,19 @@ class OpenfoamMeshUtils():
         """
 
         # Get raw mesh
-        mesh = deepcopy(file_data.raw_mesh)
-        if mesh is None:
+        if file_data.raw_mesh is None:
             return None, None
 
+        mesh = file_data.raw_mesh.copy(deep=False)
+        use_cache = clip is None or clip.type != 'SCALAR'
+
+        # Fixed mesh: reuse the surface, only sample point data again
+        if use_cache:
+            surface = file_data.surface_cache.get(mesh, file_data.triangulate)
+            if surface is not None:
+                # Points are shared with the cached surface, do not return a view on them
+                return np.array(surface.points), surface
+
         # Apply clip
         if clip is not None:
             surface = cls.clip(mesh, clip)
@@ -139,41 +194,54 @@ class OpenfoamMeshUtils():
             surface.triangulate(inplace=True)
             surface.compute_normals(inplace=True, consistent_normals=False, split_vertices=True)
 
-        return np.array(surface.points), surface
+        if use_cache:
+            file_data.surface_cache.put(mesh, surface, file_data.triangulate)
+
+        return np.asarray(surface.points), surface
 
     @classmethod
-    def faces(cls, surface: PolyData) -> Union[np.ndarray, None]:
+    def faces(cls, surface: PolyData) -> Union[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray], None]:
         """
         Get faces array of an extracted surface.
 
+        Triangulated surfaces give an array of shape (n, 3). Other surfaces give flat arrays (see 'polygons').
+
         Args:
             surface (PolyData): extracted surface
 
         Returns:
-            np.ndarray: faces array
+            Union[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray], None]: faces array
         """
 
         if surface is None:
             return None
 
         if surface.is_all_triangles:
-            faces = np.array(surface.faces).reshape(-1, 4)[:, 1:4]
+            return np.array(surface.faces).reshape(-1, 4)[:, 1:4]
 
-        else:
-            faces_indices = np.array(surface.faces)
-            padding, padding_id = 0, 0
-            faces = []
+        return cls.polygons(surface)
 
-            for id in range(surface.n_faces):
+    @classmethod
+    def polygons(cls, surface: PolyData) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decode polygons of an extracted surface as flat arrays, with no work per polygon.
 
-                if padding_id >= faces_indices.size:
-                    break
+        Uses the offsets and connectivity arrays of the VTK cell array (VTK >= 9, the only versions available for the\
+        Python versions shipped with Blender >= 3.0).
+
+        Args:
+            surface (PolyData): extracted surface
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: vertex index of each face corner, first corner of each polygon,\
+                number of corners of each polygon
+        """
 
-                padding = faces_indices[padding_id]
-                faces.append(faces_indices[padding_id + 1: padding_id + 1 + padding])
-                padding_id = padding_id + (padding + 1)
+        cells = surface.GetPolys()
+        offsets = convert_array(cells.GetOffsetsArray()).astype(np.int32)
+        connectivity = convert_array(cells.GetConnectivityArray()).astype(np.int32)
 
-        return faces
+        return connectivity, offsets[:-1], np.diff(offsets)
 
     @classmethod
     def clip(cls, mesh: UnstructuredGrid, clip: NIMPHS_OpenfoamClipProperty) -> Union[PolyData, None]:
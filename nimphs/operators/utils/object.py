@@ -8,23 +8,114 @@ log = logging.getLogger(__name__)
 import time
 import numpy as np
 from typing import Union
+from collections import OrderedDict
+from pyvista import UnstructuredGrid
 from nimphs.properties.utils.point_data import PointDataManager
 from nimphs.properties.telemac.file_data import TelemacFileData
 from nimphs.properties.openfoam.file_data import OpenfoamFileData
+from nimphs.properties.openfoam.clip import NIMPHS_OpenfoamClipProperty
+from nimphs.properties.openfoam.import_settings import NIMPHS_OpenfoamImportSettings
 from nimphs.operators.utils.mesh import OpenfoamMeshUtils, TelemacMeshUtils
 from nimphs.properties.shared.point_data_settings import NIMPHS_PointDataSettings
 from nimphs.operators.shared.create_streaming_sequence import NIMPHS_CreateStreamingSequence
 from nimphs.properties.utils.interpolation import InterpInfo, InterpInfoStreamingSequence
-from nimphs.operators.utils.vertex_color import OpenfoamVertexColorUtils, TelemacVertexColorUtils
+from nimphs.operators.utils.vertex_color import OpenfoamVertexColorUtils, TelemacVertexColorUtils, LoopVertexIndices
 from nimphs.operators.telemac.telemac_create_mesh_sequence import NIMPHS_OT_TelemacCreateMeshSequence
 from nimphs.operators.openfoam.openfoam_create_mesh_sequence import NIMPHS_OT_OpenfoamCreateMeshSequence
 
 
+def clear_mesh_caches() -> None:
+    """
+    Clear caches indexed by mesh pointers (loop vertex indices, coordinates of meshes updated in place).
+
+    Call it when file data are replaced (reload, new file path) or when a blend file is loaded: Blender reuses the
+    pointers of freed meshes, and new data can change coordinates without changing the number of vertices.
+    """
+
+    LoopVertexIndices.clear()
+    ObjectUtils.coordinates.clear()
+
+
 class ObjectUtils():
     """Utility functions for generating objects for both modules."""
 
+    #: int: Maximum number of cached coordinate buffers (the least recently used ones are removed first)
+    MAX_ENTRIES: int = 64
+
+    #: OrderedDict: Coordinates of the vertices of meshes updated in place, indexed by mesh pointer, shape is (n, 3)
+    coordinates: OrderedDict = OrderedDict()
+
+    @classmethod
+    def polygons(cls, faces: Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]
+                 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert the given faces to flat arrays: vertex index of each face corner (loop), first loop and number of\
+        loops of each polygon.
+
+        Args:
+            faces (Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]): faces, either an\
+                array of shape (n, k) (polygons of k vertices), a list of arrays (one per polygon) or flat arrays\
+                (returned as is)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: loop vertex indices, polygon loop starts, polygon loop totals
+        """
+
+        if isinstance(faces, tuple):
+            return faces
+
+        if isinstance(faces, np.ndarray) and faces.ndim == 2:
+            nb_polygons, size = faces.shape
+            totals = np.full(nb_polygons, size, dtype=np.int32)
+            indices = faces.ravel()
+        elif len(faces) > 0:
+            totals = np.fromiter((len(face) for face in faces), dtype=np.int32, count=len(faces))
+            indices = np.concatenate(faces)
+        else:
+            totals = np.zeros(0, dtype=np.int32)
+            indices = np.zeros(0, dtype=np.int32)
+
+        starts = np.zeros(len(totals), dtype=np.int32)
+        np.cumsum(totals[:-1], out=starts[1:])
+
+        return indices.astype(np.int32, copy=False), starts, totals
+
     @classmethod
-    def generate(cls, vertices: np.ndarray, faces: np.ndarray, name: str, new: bool = False) -> Object:
+    def build(cls, bmesh: Mesh, vertices: np.ndarray,
+              faces: Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]) -> None:
+        """
+        Fill the given (empty) mesh with the given vertices and faces.
+
+        Elements are added in bulk and filled from flat arrays with 'foreach_set' (no iteration over python\
+        sequences, unlike 'from_pydata').
+
+        Args:
+            bmesh (Mesh): empty mesh
+            vertices (np.ndarray): vertices, must have the following shape: (n, 3)
+            faces (Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]): faces (see\
+                'polygons')
+        """
+
+        indices, starts, totals = cls.polygons(faces)
+
+        bmesh.vertices.add(len(vertices))
+        bmesh.vertices.foreach_set("co", np.ascontiguousarray(vertices, dtype=np.float32).ravel())
+
+        bmesh.loops.add(len(indices))
+        bmesh.loops.foreach_set("vertex_index", np.ascontiguousarray(indices, dtype=np.int32))
+
+        bmesh.polygons.add(len(starts))
+        bmesh.polygons.foreach_set("loop_start", np.ascontiguousarray(starts, dtype=np.int32))
+        # Note: from Blender 4.0, loop totals are computed from loop starts (read-only)
+        if bpy.app.version < (4, 0, 0):
+            bmesh.polygons.foreach_set("loop_total", np.ascontiguousarray(totals, dtype=np.int32))
+
+        bmesh.update(calc_edges=True)
+
+    @classmethod
+    def generate(cls, vertices: np.ndarray,
+                 faces: Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]], name: str,
+                 new: bool = False) -> Object:
         """
         Generate an object and its mesh using the given vertices and faces.
 
@@ -32,7 +123,8 @@ class ObjectUtils():
 
         Args:
             vertices (np.ndarray): vertices, must have the following shape: (n, 3)
-            faces (np.ndarray): faces, must have the following shape: (n, 3)
+            faces (Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]): faces (see\
+                'polygons')
             name (str): name of the object
             new (bool): force to generate a new object
 
@@ -52,10 +144,79 @@ class ObjectUtils():
 
         obj.shape_key_clear()
         bmesh.clear_geometry()
-        bmesh.from_pydata(vertices, [], faces)
+        cls.build(bmesh, vertices, faces)
+        LoopVertexIndices.invalidate(bmesh)
+        cls.coordinates.pop(bmesh.as_pointer(), None)
 
         return obj
 
+    @classmethod
+    def update(cls, vertices: np.ndarray, faces: np.ndarray, name: str, z_only: bool = False) -> tuple[Object, bool]:
+        """
+        Update the vertices of the given object in place when its topology matches the given faces.
+
+        Otherwise (or if the object does not exist yet), generate it (see 'generate'). In place updates keep faces,
+        smooth shading and point data layers of the mesh: only coordinates are copied.
+
+        Args:
+            vertices (np.ndarray): vertices, must have the following shape: (n, 3)
+            faces (np.ndarray): faces, must have the following shape: (n, 3)
+            name (str): name of the object
+            z_only (bool, optional): only z-values changed since the last update (x and y values are not copied).\
+                Defaults to False.
+
+        Returns:
+            tuple[Object, bool]: object, ``True`` if the mesh has been generated again
+        """
+
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.data.shape_keys is not None or not cls.same_topology(obj.data, vertices, faces):
+            return cls.generate(vertices, faces, name), True
+
+        bmesh = obj.data
+        key = bmesh.as_pointer()
+
+        if z_only:
+            buffer = cls.coordinates.get(key, None)
+            if buffer is None or len(buffer) != len(vertices):
+                # Read x and y values once, from the mesh
+                buffer = np.empty((len(bmesh.vertices), 3), dtype=np.float32)
+                bmesh.vertices.foreach_get("co", buffer.ravel())
+                cls.coordinates[key] = buffer
+                if len(cls.coordinates) > cls.MAX_ENTRIES:
+                    cls.coordinates.popitem(last=False)
+
+            cls.coordinates.move_to_end(key)
+            buffer[:, 2] = vertices[:, 2]
+        else:
+            cls.coordinates.pop(key, None)
+            buffer = np.ascontiguousarray(vertices, dtype=np.float32)
+
+        bmesh.vertices.foreach_set("co", buffer.ravel())
+        bmesh.update()
+
+        return obj, False
+
+    @classmethod
+    def same_topology(cls, bmesh: Mesh, vertices: np.ndarray, faces: np.ndarray) -> bool:
+        """
+        Check if the given mesh has the given number of vertices and faces (the vertex index of each face corner is\
+        cached, see LoopVertexIndices).
+
+        Args:
+            bmesh (Mesh): mesh
+            vertices (np.ndarray): vertices, must have the following shape: (n, 3)
+            faces (np.ndarray): faces, must have the following shape: (n, 3)
+
+        Returns:
+            bool: ``True`` if the topology is the same
+        """
+
+        if len(bmesh.vertices) != len(vertices) or len(bmesh.polygons) != len(faces) or len(bmesh.loops) != faces.size:
+            return False
+
+        return np.array_equal(LoopVertexIndices.get(bmesh), np.ravel(faces))
+
     @classmethod
     def setup_streaming_sequence(cls, obj: Object, op: NIMPHS_CreateStreamingSequence, file_path: str) -> None:
         """
@@ -242,7 +403,11 @@ class TelemacObjectUtils(ObjectUtils):
             obj = bpy.data.objects[op.name]
             file_data = context.scene.nimphs.file_data.get(obj.nimphs.uid, None)
 
-            file_data.update_data(op.time_point)
+            names = []
+            for type in ['BOTTOM', 'WATER_DEPTH']:
+                names += TelemacMeshUtils.required_point_data(file_data, type=type)
+
+            file_data.update_data(op.time_point, names=names)
             for child, id in zip(obj.children, range(len(obj.children))):
                 if not file_data.is_3d():
                     type = child.nimphs.settings.telemac.z_name
@@ -266,13 +431,10 @@ class TelemacObjectUtils(ObjectUtils):
             time_info (InterpInfo): time information
         """
 
-        # Remove existing vertex colors
-        while bmesh.vertex_colors:
-            bmesh.vertex_colors.remove(bmesh.vertex_colors[0])
-
-        # Exit if no point data selected
+        # Exit if no point data selected (remove existing vertex colors)
         selected = PointDataManager(point_data.list)
         if selected.length() <= 0:
+            TelemacVertexColorUtils.remove(bmesh)
             return
 
         # Update point data
@@ -285,6 +447,29 @@ class TelemacObjectUtils(ObjectUtils):
             new.append(data=file_data.vars.get(var))
         point_data.list = new.dumps()
 
+    @classmethod
+    def streaming_sequence_point_data(cls, obj: Object, file_data: TelemacFileData) -> list[str]:
+        """
+        Get names of the variables read to update all the children of a TELEMAC 'streaming sequence' object.
+
+        Args:
+            obj (Object): sequence object
+            file_data (TelemacFileData): file data
+
+        Returns:
+            list[str]: names of the variables
+        """
+
+        names = []
+        for child in obj.children:
+            names += TelemacMeshUtils.required_point_data(file_data, type=child.nimphs.settings.telemac.z_name)
+
+        point_data = obj.nimphs.settings.point_data
+        if point_data.import_data:
+            names += TelemacVertexColorUtils.required_point_data(point_data)
+
+        return list(dict.fromkeys(names))
+
     @classmethod
     def update_streaming_sequence(cls, obj: Object, child: Object, file_data: TelemacFileData,
                                   frame: int, offset: int) -> None:
@@ -310,15 +495,21 @@ class TelemacObjectUtils(ObjectUtils):
             vertices = TelemacMeshUtils.vertices_LI(child, file_data, time_info, offset)
         elif interpolate.type == 'NONE':
             time_point = frame - sequence.start
-            file_data.update_data(time_point)
+            # Only read variables used for z-values and vertex colors
+            names = TelemacMeshUtils.required_point_data(file_data, type=child.nimphs.settings.telemac.z_name)
+            if point_data.import_data:
+                names += TelemacVertexColorUtils.required_point_data(point_data)
+
+            file_data.update_data(time_point, names=names)
             vertices = TelemacMeshUtils.vertices(file_data, offset=offset, type=child.nimphs.settings.telemac.z_name)
 
-        # Generate object
-        child = cls.generate(vertices, file_data.faces, child.name)
+        # Update object (the topology of TELEMAC meshes does not change over time, only z-values move)
+        child, generated = cls.update(vertices, file_data.faces, child.name, z_only=True)
 
-        # Apply smooth shading
-        if sequence.shade_smooth:
-            child.data.polygons.foreach_set("use_smooth", [True] * len(child.data.polygons))
+        # Apply smooth shading (kept by in place updates)
+        polygons = child.data.polygons
+        if len(polygons) > 0 and (generated or polygons[0].use_smooth != sequence.shade_smooth):
+            polygons.foreach_set("use_smooth", np.full(len(polygons), sequence.shade_smooth, dtype=bool))
 
         # Update point data
         if point_data.import_data:
@@ -328,11 +519,7 @@ class TelemacObjectUtils(ObjectUtils):
             if selected.length() <= 0:
                 return
 
-            # Remove old vertex colors
-            while child.data.vertex_colors:
-                child.data.vertex_colors.remove(child.data.vertex_colors[0])
-
-            # Update vertex colors data
+            # Update vertex colors data (existing layers are reused)
             if interpolate.type == 'LINEAR':
                 data = TelemacVertexColorUtils.prepare_LI(child.data, point_data, file_data, time_info, offset=offset)
             elif interpolate.type == 'NONE':
@@ -414,6 +601,31 @@ class OpenfoamObjectUtils(ObjectUtils):
             newKey = next((keyframe for keyframe in curve.keyframe_points if keyframe.co.x == op.frame), None)
             newKey.interpolation = 'CONSTANT'
 
+    @classmethod
+    def select_arrays(cls, file_data: OpenfoamFileData, io_settings: NIMPHS_OpenfoamImportSettings,
+                      point_data: NIMPHS_PointDataSettings, clip: NIMPHS_OpenfoamClipProperty) -> None:
+        """
+        Select the fields to read for a sequence: the selected point data and the clip scalars.
+
+        Reads all the fields when the 'load required fields' import setting is disabled.
+
+        Args:
+            file_data (OpenfoamFileData): file data
+            io_settings (NIMPHS_OpenfoamImportSettings): import settings
+            point_data (NIMPHS_PointDataSettings): point data settings
+            clip (NIMPHS_OpenfoamClipProperty): clip settings
+        """
+
+        if not io_settings.load_required_fields:
+            file_data.select_arrays(None)
+            return
+
+        names = OpenfoamMeshUtils.required_point_data(clip)
+        if point_data.import_data:
+            names += OpenfoamVertexColorUtils.required_point_data(point_data)
+
+        file_data.select_arrays(names)
+
     @classmethod
     def mesh_for_sequence(cls, file_data: OpenfoamFileData,
                           op: NIMPHS_OT_OpenfoamCreateMeshSequence) -> Union[Mesh, None]:
@@ -430,15 +642,17 @@ class OpenfoamObjectUtils(ObjectUtils):
 
         # Generate mesh data
         file_data.update_import_settings(op.import_settings)
+        cls.select_arrays(file_data, op.import_settings, op.point_data, op.clip)
         file_data.update_data(op.time_point)
         vertices, file_data.mesh = OpenfoamMeshUtils.vertices(file_data, clip=op.clip)
         faces = OpenfoamMeshUtils.faces(file_data.mesh)
         if file_data.mesh is None:
             return None
 
-        # Create mesh from python data
+        # Create mesh from flat arrays
         bmesh = bpy.data.meshes.new(f"{op.name}_sequence_mesh")
-        bmesh.from_pydata(vertices, [], faces)
+        cls.build(bmesh, vertices, faces)
+        LoopVertexIndices.invalidate(bmesh)
         # Use fake user so Blender will save our mesh in the .blend file
         bmesh.use_fake_user = True
 
@@ -517,6 +731,7 @@ class OpenfoamObjectUtils(ObjectUtils):
         dest.triangulate = data.triangulate
         dest.skip_zero_time = data.skip_zero_time
         dest.decompose_polyhedra = data.decompose_polyhedra
+        dest.load_required_fields = data.load_required_fields
 
         # Copy file data
         file_data.copy(context.scene.nimphs.file_data[obj.nimphs.uid])
@@ -525,7 +740,8 @@ class OpenfoamObjectUtils(ObjectUtils):
         return sequence
 
     @classmethod
-    def update_streaming_sequence(cls, scene: Scene, obj: Object, time_point: int) -> None:
+    def update_streaming_sequence(cls, scene: Scene, obj: Object, time_point: int,
+                                  raw_mesh: Union[UnstructuredGrid, None] = None) -> None:
         """
         Update the given OpenFOAM sequence object.
 
@@ -533,6 +749,7 @@ class OpenfoamObjectUtils(ObjectUtils):
             scene (Scene): scene
             obj (Object): sequence object
             time_point (int): time point
+            raw_mesh (Union[UnstructuredGrid, None], optional): prefetched 'internalMesh'. Defaults to None.
         """
 
         # Get data and settings
@@ -544,7 +761,8 @@ class OpenfoamObjectUtils(ObjectUtils):
             return
 
         file_data.update_import_settings(io_settings)
-        file_data.update_data(time_point)
+        cls.select_arrays(file_data, io_settings, obj.nimphs.settings.point_data, obj.nimphs.settings.openfoam.clip)
+        file_data.update_data(time_point, raw_mesh=raw_mesh)
         vertices, file_data.mesh = OpenfoamMeshUtils.vertices(file_data, clip=obj.nimphs.settings.openfoam.clip)
         faces = OpenfoamMeshUtils.faces(file_data.mesh)
 
@@ -554,7 +772,8 @@ class OpenfoamObjectUtils(ObjectUtils):
 
         bmesh = obj.data
         bmesh.clear_geometry()
-        bmesh.from_pydata(vertices, [], faces)
+        cls.build(bmesh, vertices, faces)
+        LoopVertexIndices.invalidate(bmesh)
 
         # Shade smooth
         if obj.nimphs.settings.openfoam.s_sequence.shade_smooth:
@@ -10,6 +10,8 @@ def remap_array(input: np.ndarray, out_min: float = 0.0, out_max: float = 1.0,
     """
     Remap values of the given array.
 
+    The output keeps the floating point precision of the input (float32 data are not promoted to float64).
+
     Args:
         input (np.ndarray): input array to remap
         out_min (float, optional): minimum value to output. Defaults to 0.0.
@@ -21,16 +23,22 @@ def remap_array(input: np.ndarray, out_min: float = 0.0, out_max: float = 1.0,
         np.ndarray: output array
     """
 
+    dtype = input.dtype if np.issubdtype(input.dtype, np.floating) else np.dtype(np.float64)
+
     if in_min == -np.inf or in_max == np.inf:
         in_min = np.min(input)
         in_max = np.max(input)
 
     if out_min < np.finfo(float).eps and out_max < np.finfo(float).eps:
-        return np.zeros(shape=input.shape)
+        return np.zeros(shape=input.shape, dtype=dtype)
     elif out_min == 1.0 and out_max == 1.0:
-        return np.ones(shape=input.shape)
+        return np.ones(shape=input.shape, dtype=dtype)
 
     if in_max - in_min > np.finfo(float).eps:
-        return out_min + (out_max - out_min) * ((input - in_min) / (in_max - in_min))
+        # Note: scalars are cast to the type of the output so that operations do not promote it
+        output = np.subtract(input, dtype.type(in_min), dtype=dtype)
+        output *= dtype.type((out_max - out_min) / (in_max - in_min))
+        output += dtype.type(out_min)
+        return output
     else:
-        return np.ones(shape=input.shape)
+        return np.ones(shape=input.shape, dtype=dtype)
@@ -1,15 +1,104 @@
 # <pep8 compliant>
-from bpy.types import Scene
+import bpy
+from bpy.types import Scene, Object
 from bpy.app.handlers import persistent
 
 import logging
 log = logging.getLogger(__name__)
 
 import time
+from typing import Union
 
+from nimphs.properties.shared.file_data import FileData
 from nimphs.properties.utils.point_data import PointDataManager
-from nimphs.properties.utils.interpolation import InterpInfoMeshSequence
-from nimphs.operators.utils.object import OpenfoamObjectUtils, TelemacObjectUtils
+from nimphs.properties.telemac.file_data import TelemacFileData
+from nimphs.properties.openfoam.file_data import OpenfoamFileData
+from nimphs.properties.utils.prefetch import Prefetcher, get_next_time_points
+from nimphs.properties.utils.interpolation import InterpInfoMeshSequence, InterpInfoStreamingSequence
+from nimphs.operators.utils.object import OpenfoamObjectUtils, TelemacObjectUtils, clear_mesh_caches
+
+#: float: Interval between two checks of the files followed by TELEMAC 'streaming sequences' (in seconds)
+FOLLOW_INTERVAL = 1.0
+
+
+def stop_prefetcher(file_data: Union[FileData, None]) -> None:
+    """
+    Stop the prefetcher of the given file data (if any).
+
+    Call it before file data are replaced or removed, otherwise its worker threads keep reading the file.
+
+    Args:
+        file_data (Union[FileData, None]): file data
+    """
+
+    if file_data is not None and file_data.prefetcher is not None:
+        file_data.prefetcher.shutdown()
+        file_data.prefetcher = None
+
+
+def get_openfoam_prefetcher(file_data: OpenfoamFileData) -> Prefetcher:
+    """
+    Get the prefetcher of the given OpenFOAM file data, create a new one if import settings or selected fields have\
+    changed.
+
+    Time points are read by a single worker thread which uses its own reader.
+
+    Args:
+        file_data (OpenfoamFileData): file data
+
+    Returns:
+        Prefetcher: prefetcher
+    """
+
+    arrays = None if file_data.arrays is None else tuple(file_data.arrays)
+    signature = (file_data.file.case_type, file_data.file.skip_zero_time, file_data.file.decompose_polyhedra, arrays)
+    if file_data.prefetcher is not None and file_data.prefetcher.signature == signature:
+        return file_data.prefetcher
+
+    stop_prefetcher(file_data)
+    reader = file_data.create_reader()
+
+    def load(time_point: int):
+        reader.set_active_time_point(time_point)
+        return reader.read()["internalMesh"]
+
+    file_data.prefetcher = Prefetcher(load, signature=signature, max_workers=1)
+    return file_data.prefetcher
+
+
+def get_telemac_prefetcher(file_data: TelemacFileData, names: list[str]) -> Prefetcher:
+    """
+    Get the prefetcher of the given TELEMAC file data, create a new one if the variables to read have changed.
+
+    Prefetched frames are stored in the frame cache of the file data.
+
+    Args:
+        file_data (TelemacFileData): file data
+        names (list[str]): names of the variables to read
+
+    Returns:
+        Prefetcher: prefetcher
+    """
+
+    signature = tuple(names)
+    if file_data.prefetcher is not None and file_data.prefetcher.signature == signature:
+        return file_data.prefetcher
+
+    stop_prefetcher(file_data)
+    ids = [file_data.vars.names.index(name) for name in names]
+
+    def load(time_point: int):
+        return file_data.read_frames(time_point, ids)
+
+    file_data.prefetcher = Prefetcher(load, signature=signature, max_workers=2)
+    return file_data.prefetcher
+
+
+@persistent
+def clear_mesh_caches_on_load(_dummy) -> None:
+    """Clear caches indexed by mesh pointers before a blend file is loaded (see 'clear_mesh_caches')."""
+
+    clear_mesh_caches()
 
 
 @persistent
@@ -31,7 +120,7 @@ def update_openfoam_streaming_sequences(scene: Scene) -> None:
 
                 # Get file data
                 try:
-                    scene.nimphs.file_data[obj.nimphs.uid]
+                    file_data = scene.nimphs.file_data[obj.nimphs.uid]
                 except KeyError:
                     # Disable update
                     sequence.update = False
@@ -43,11 +132,30 @@ def update_openfoam_streaming_sequences(scene: Scene) -> None:
 
                     start = time.time()
 
+                    # Get the prefetched time point (if any)
+                    raw_mesh, prefetcher = None, None
+                    if sequence.prefetch and file_data is not None:
+                        io_settings = obj.nimphs.settings.openfoam.import_settings
+                        file_data.update_import_settings(io_settings)
+                        OpenfoamObjectUtils.select_arrays(file_data, io_settings, obj.nimphs.settings.point_data,
+                                                          obj.nimphs.settings.openfoam.clip)
+                        prefetcher = get_openfoam_prefetcher(file_data)
+                        direction = prefetcher.tick(frame)
+                        raw_mesh = prefetcher.get(time_point)
+                    elif file_data is not None:
+                        stop_prefetcher(file_data)
+
                     try:
-                        OpenfoamObjectUtils.update_streaming_sequence(scene, obj, time_point)
+                        OpenfoamObjectUtils.update_streaming_sequence(scene, obj, time_point, raw_mesh=raw_mesh)
                     except Exception:
                         log.error(f"Error updating {obj.name}", exc_info=1)
 
+                    # Read the next time points in background
+                    if prefetcher is not None:
+                        limit = min(sequence.length, file_data.nb_time_points)
+                        prefetcher.schedule(get_next_time_points(time_point, direction, sequence.prefetch_size, limit))
+                        log.debug(f"{obj.name}, prefetch: {prefetcher}")
+
                     log.info(f"Update {obj.name}: " + "{:.4f}".format(time.time() - start) + "s")
 
 
@@ -91,13 +199,124 @@ def update_telemac_streaming_sequences(scene: Scene) -> None:
             if scene.frame_current >= sequence.start and scene.frame_current < limit:
                 start = time.time()
 
+                # Current time point (left time point when interpolating)
+                if interpolate.type == 'LINEAR':
+                    time_info = InterpInfoStreamingSequence(scene.frame_current, sequence.start, interpolate.steps)
+                    time_points = [time_info.left] if time_info.exists else [time_info.left, time_info.right]
+                else:
+                    time_points = [scene.frame_current - sequence.start]
+
+                # Wait for prefetched time points (prefetched frames are stored in the frame cache)
+                prefetcher = None
+                if sequence.prefetch and file_data.cache.is_enabled():
+                    names = TelemacObjectUtils.streaming_sequence_point_data(obj, file_data)
+                    prefetcher = get_telemac_prefetcher(file_data, names)
+                    direction = prefetcher.tick(scene.frame_current)
+                    for time_point in time_points:
+                        prefetcher.get(time_point)
+                else:
+                    stop_prefetcher(file_data)
+
                 for child, id in zip(obj.children, range(len(obj.children))):
                     # Do not update a plane when it is hidden in the viewport ("eye closed")
                     if not child.hide_get():
                         offset = id if file_data.is_3d() else 0
                         TelemacObjectUtils.update_streaming_sequence(obj, child, file_data, scene.frame_current, offset)
 
+                # Read the next time points in background
+                if prefetcher is not None:
+                    limit = min(sequence.length, file_data.nb_time_points)
+                    prefetcher.schedule(get_next_time_points(time_points[0], direction, sequence.prefetch_size, limit))
+                    log.debug(f"{obj.name}, prefetch: {prefetcher}")
+
                 log.info(obj.name + ", " + "{:.4f}".format(time.time() - start) + "s")
+                log.debug(f"{obj.name}, frame cache: {file_data.cache}")
+
+
+def get_telemac_streaming_sequence_last_frame(obj: Object) -> int:
+    """
+    Get the last frame of the given TELEMAC 'streaming sequence' (takes interpolation into account).
+
+    Args:
+        obj (Object): sequence object
+
+    Returns:
+        int: last frame
+    """
+
+    sequence = obj.nimphs.settings.telemac.s_sequence
+    interpolate = obj.nimphs.settings.telemac.interpolate
+
+    steps = interpolate.steps if interpolate.type != 'NONE' else 0
+    return sequence.start + max(sequence.length - 1, 0) * (steps + 1)
+
+
+def follow_telemac_streaming_sequence(obj: Object, file_data: TelemacFileData) -> int:
+    """
+    Extend the given TELEMAC 'streaming sequence' with the new time points written in its file (running simulation).
+
+    The length of the sequence is only extended if it used all the available time points.
+
+    Args:
+        obj (Object): sequence object
+        file_data (TelemacFileData): file data
+
+    Returns:
+        int: number of new time points
+    """
+
+    sequence = obj.nimphs.settings.telemac.s_sequence
+    use_all = sequence.length >= sequence.max
+
+    nb_new = file_data.refresh()
+    if nb_new > 0:
+        sequence.max = file_data.nb_time_points     # Order matters! (length can't be higher than max)
+        if use_all:
+            sequence.length = sequence.max
+
+    return nb_new
+
+
+def follow_telemac_streaming_sequences() -> float:
+    """
+    Timer which extends TELEMAC 'streaming sequences' which follow the file of a running simulation.
+
+    Checking a file only costs a look at its size. If the current frame is the last frame of a sequence (and the
+    animation is not playing), it moves to the new last frame.
+
+    Returns:
+        float: time before the next call (in seconds)
+    """
+
+    scene = bpy.context.scene
+    if scene is None or scene.nimphs.m_op_running:
+        return FOLLOW_INTERVAL
+
+    for obj in scene.objects:
+        if not obj.nimphs.is_streaming_sequence:
+            continue
+
+        sequence = obj.nimphs.settings.telemac.s_sequence
+        file_data = scene.nimphs.file_data.get(obj.nimphs.uid, None)
+        if not sequence.update or not sequence.follow or file_data is None:
+            continue
+
+        last_frame = get_telemac_streaming_sequence_last_frame(obj)
+
+        try:
+            nb_new = follow_telemac_streaming_sequence(obj, file_data)
+        except Exception:
+            log.warning(f"Unable to follow the file of {obj.name}", exc_info=1)
+            continue
+
+        if nb_new > 0:
+            log.info(f"{obj.name}: {nb_new} new time point(s)")
+
+            playing = getattr(bpy.context.screen, "is_animation_playing", False)
+            if scene.frame_current == last_frame and not playing:
+                scene.frame_set(get_telemac_streaming_sequence_last_frame(obj))
+
+    return FOLLOW_INTERVAL
 
 
 @persistent
@@ -8,9 +8,11 @@ import json
 import numpy as np
 from typing import Union
 from copy import deepcopy
+from collections import OrderedDict
 from nimphs.operators.utils.others import remap_array
 from nimphs.properties.utils.interpolation import InterpInfo
 from nimphs.properties.utils.point_data import PointDataManager
+from nimphs.properties.utils.preferences import get_preference
 from nimphs.properties.telemac.file_data import TelemacFileData
 from nimphs.properties.openfoam.file_data import OpenfoamFileData
 from nimphs.properties.shared.point_data_settings import NIMPHS_PointDataSettings
@@ -19,17 +21,21 @@ from nimphs.properties.shared.point_data_settings import NIMPHS_PointDataSetting
 class VertexColorInformation():
     """Utility class which hold information on vertex colors to generate."""
 
-    def __init__(self, nb_vertex_indices: int = 0) -> None:
+    def __init__(self, nb_vertex_indices: int = 0, domain: str = 'CORNER') -> None:
         """
         Init method of the class.
 
         Args:
             nb_vertex_indices (int, optional): number of vertex indices. Defaults to 0.
+            domain (str, optional): domain of the data. Enum in ['CORNER', 'POINT']. 'CORNER' data are written as\
+                vertex colors (three variables per layer), 'POINT' data as float attributes (one per variable).\
+                Defaults to 'CORNER'.
         """
 
         self.names = []
         self.data = []
         self.nb_vertex_indices = nb_vertex_indices
+        self.domain = domain
 
     def groups(self) -> tuple[list[str], list[list[int]]]:
         """
@@ -89,46 +95,264 @@ class VertexColorInformation():
         """
 
         return "{" + f"\n  names: {self.names},\n  data: {self.data},\n\
-  nb_vertex_indices: {self.nb_vertex_indices},\n  empty: {self.is_empty()}" + "\n}"
+  nb_vertex_indices: {self.nb_vertex_indices},\n  domain: {self.domain},\n  empty: {self.is_empty()}" + "\n}"
+
+
+class LoopVertexIndices():
+    """Cache of the vertex index of each face corner (loop) of meshes, by mesh and topology."""
+
+    #: int: Maximum number of cached meshes (the least recently used ones are removed first)
+    MAX_ENTRIES: int = 64
+
+    #: OrderedDict: Cached indices, indexed by mesh pointer: (number of vertices, loops and polygons), indices
+    entries: OrderedDict = OrderedDict()
+
+    @classmethod
+    def get(cls, bmesh: Mesh) -> np.ndarray:
+        """
+        Get the vertex index of each face corner of the given mesh (order of vertex colors data).
+
+        Indices are read in bulk from the loops of the mesh, then cached until its topology changes.
+
+        Args:
+            bmesh (Mesh): mesh
+
+        Returns:
+            np.ndarray: indices, shape is (n_loops,)
+        """
+
+        key = bmesh.as_pointer()
+        topology = (len(bmesh.vertices), len(bmesh.loops), len(bmesh.polygons))
+
+        entry = cls.entries.get(key, None)
+        if entry is not None and entry[0] == topology:
+            cls.entries.move_to_end(key)
+            return entry[1]
+
+        vertex_ids = np.empty(len(bmesh.loops), dtype=np.int32)
+        bmesh.loops.foreach_get("vertex_index", vertex_ids)
+
+        cls.entries[key] = (topology, vertex_ids)
+        cls.entries.move_to_end(key)
+        if len(cls.entries) > cls.MAX_ENTRIES:
+            cls.entries.popitem(last=False)
+
+        return vertex_ids
+
+    @classmethod
+    def invalidate(cls, bmesh: Mesh) -> None:
+        """
+        Remove cached indices of the given mesh. Call it when the geometry of the mesh is rebuilt.
+
+        Args:
+            bmesh (Mesh): mesh
+        """
+
+        cls.entries.pop(bmesh.as_pointer(), None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all cached indices (see 'clear_mesh_caches')."""
+
+        cls.entries.clear()
 
 
 class VertexColorUtils():
     """Utility functions for generating vertex colors for both modules."""
 
+    #: np.ndarray: Color buffer reused by all the calls to 'generate', shape is (n, 4)
+    buffer: np.ndarray = None
+    #: str: Name of the custom property of meshes which lists the attributes generated from point data
+    ATTRIBUTES: str = "nimphs_attributes"
+
+    @classmethod
+    def get_buffer(cls, size: int) -> np.ndarray:
+        """
+        Get a float32 RGBA buffer of the given size (the buffer is only reallocated when it is too small).
+
+        Args:
+            size (int): number of colors
+
+        Returns:
+            np.ndarray: buffer, shape is (size, 4)
+        """
+
+        if cls.buffer is None or len(cls.buffer) < size:
+            cls.buffer = np.empty((size, 4), dtype=np.float32)
+
+        return cls.buffer[:size]
+
+    @classmethod
+    def information(cls, bmesh: Mesh) -> VertexColorInformation:
+        """
+        Create the output structure of point data for the given mesh, according to the 'point data output' preference.
+
+        Args:
+            bmesh (Mesh): mesh
+
+        Returns:
+            VertexColorInformation: empty 'CORNER' data (vertex colors) or 'POINT' data (attributes)
+        """
+
+        if get_preference("point_data_output", 'VERTEX_COLORS') == 'ATTRIBUTES':
+            return VertexColorInformation(len(bmesh.vertices), domain='POINT')
+
+        return VertexColorInformation(len(LoopVertexIndices.get(bmesh)))
+
+    @classmethod
+    def values(cls, bmesh: Mesh, output: VertexColorInformation, data: np.ndarray, var_range: list[float],
+               raw: bool = False) -> np.ndarray:
+        """
+        Compute the values to write for the given point data (one value per vertex of the mesh).
+
+        Vertex colors hold remapped values for each face corner. Attributes hold one value per vertex, remapped or raw.
+
+        Args:
+            bmesh (Mesh): mesh
+            output (VertexColorInformation): output structure
+            data (np.ndarray): point data, one value per vertex of the mesh
+            var_range (list[float]): value range used to remap values
+            raw (bool, optional): keep the values of attributes (do not remap them). Defaults to False.
+
+        Returns:
+            np.ndarray: values
+        """
+
+        data = np.asarray(data)
+        if output.domain == 'POINT':
+            if raw:
+                return data
+        else:
+            # Vertex indices of face corners are cached until the topology of the mesh changes
+            data = data[LoopVertexIndices.get(bmesh)]
+
+        return remap_array(data, in_min=var_range[0], in_max=var_range[1])
+
+    @classmethod
+    def remove(cls, bmesh: Mesh, keep: list[str] = []) -> None:
+        """
+        Remove vertex color layers of the given mesh.
+
+        Args:
+            bmesh (Mesh): mesh
+            keep (list[str], optional): names of the layers to keep. Defaults to [].
+        """
+
+        # Note: get layers again by name, removing a layer can invalidate references to the other ones
+        for name in [layer.name for layer in bmesh.vertex_colors if layer.name not in keep]:
+            bmesh.vertex_colors.remove(bmesh.vertex_colors[name])
+
+    @classmethod
+    def remove_attributes(cls, bmesh: Mesh, keep: list[str] = []) -> None:
+        """
+        Remove attributes generated from point data on the given mesh.
+
+        Args:
+            bmesh (Mesh): mesh
+            keep (list[str], optional): names of the attributes to keep. Defaults to [].
+        """
+
+        names = json.loads(bmesh.get(cls.ATTRIBUTES, "[]"))
+        kept = [name for name in names if name in keep]
+        if kept == names:
+            return
+
+        for name in names:
+            if name not in keep and bmesh.attributes.get(name) is not None:
+                bmesh.attributes.remove(bmesh.attributes[name])
+
+        # Note: only write the custom property when the set of attributes changes (not at each frame)
+        bmesh[cls.ATTRIBUTES] = json.dumps(kept)
+
     @classmethod
     def generate(cls, bmesh: Mesh, data: VertexColorInformation) -> None:
         """
-        Generate vertex colors for the given mesh.
+        Generate vertex colors for the given mesh ('CORNER' data), or float attributes ('POINT' data).
+
+        Existing layers are reused (by name), layers which are not generated anymore are removed.
 
         Args:
             bmesh (Mesh): mesh on which to add vertex colors
             data (VertexColorInformation):  point data information to generate vertex colors
         """
 
-        # Data for alpha and empty channels
-        ones = np.ones((data.nb_vertex_indices,))
-        zeros = np.zeros((data.nb_vertex_indices,))
+        if data.domain == 'POINT':
+            cls.generate_attributes(bmesh, data)
+            return
+
+        cls.remove_attributes(bmesh)
 
         grp_names, grp_indices = data.groups()
+        cls.remove(bmesh, keep=grp_names)
+
+        # Blender stores colors as float32 RGBA values: fill a buffer of this type in place so that foreach_set
+        # can copy it directly (empty channels are set to 0, alpha channel to 1)
+        colors = cls.get_buffer(data.nb_vertex_indices)
+        colors[:, 3] = 1.0
 
         for name, indices in zip(grp_names, grp_indices):
-            vertex_colors = bmesh.vertex_colors.new(name=name, do_init=True)
+            vertex_colors = bmesh.vertex_colors.get(name)
+            if vertex_colors is None:
+                vertex_colors = bmesh.vertex_colors.new(name=name, do_init=False)
 
-            colors = []
-            for id in indices:
+            for channel, id in enumerate(indices):
                 if id != -1:
-                    colors.append(np.array(data.data[id]))
+                    colors[:, channel] = data.data[id]
                 else:
-                    colors.append(zeros)
+                    colors[:, channel] = 0.0
 
-            # Add ones for alpha channel
-            colors.append(ones)
+            vertex_colors.data.foreach_set("color", colors.ravel())
 
-            # Reshape data
-            colors = np.array(colors).T
+    @classmethod
+    def generate_attributes(cls, bmesh: Mesh, data: VertexColorInformation) -> None:
+        """
+        Write each variable as a float attribute on the vertices of the given mesh (named after the variable).
+
+        Values are neither expanded to face corners nor packed in colors: one float32 value per vertex and variable.
+        Existing attributes are reused, attributes which are not generated anymore are removed.
+
+        Args:
+            bmesh (Mesh): mesh
+            data (VertexColorInformation): 'POINT' data
+        """
+
+        cls.remove(bmesh)
+        cls.remove_attributes(bmesh, keep=data.names)
 
-            colors = colors.flatten()
-            vertex_colors.data.foreach_set("color", colors)
+        for name, values in zip(data.names, data.data):
+            attribute = bmesh.attributes.get(name)
+            if attribute is not None and (attribute.domain != 'POINT' or attribute.data_type != 'FLOAT'):
+                bmesh.attributes.remove(attribute)
+                attribute = None
+
+            if attribute is None:
+                attribute = bmesh.attributes.new(name=name, type='FLOAT', domain='POINT')
+
+            attribute.data.foreach_set("value", np.ascontiguousarray(values, dtype=np.float32))
+
+        names = json.dumps(data.names)
+        if bmesh.get(cls.ATTRIBUTES) != names:
+            bmesh[cls.ATTRIBUTES] = names
+
+    @classmethod
+    def required_point_data(cls, point_data: Union[NIMPHS_PointDataSettings, str]) -> list[str]:
+        """
+        Get the names of the variables needed to generate vertex colors.
+
+        Args:
+            point_data (Union[NIMPHS_PointDataSettings, str]): point data settings
+
+        Returns:
+            list[str]: names of the variables
+        """
+
+        # If point_data is string, then the request comes from the preview panel
+        if isinstance(point_data, str):
+            if not point_data or json.loads(point_data)["name"] == 'None':
+                return []
+            return [json.loads(point_data)["name"]]
+
+        return PointDataManager(point_data.list).names
 
 
 class TelemacVertexColorUtils(VertexColorUtils):
@@ -150,13 +374,6 @@ class TelemacVertexColorUtils(VertexColorUtils):
             VertexColorInformation: point data information to generate vertex colors
         """
 
-        # Prepare the mesh to loop over all its triangles
-        if len(bmesh.loop_triangles) == 0:
-            bmesh.calc_loop_triangles()
-
-        # Get vertex indices
-        vertex_ids = np.array([triangle.vertices for triangle in bmesh.loop_triangles]).flatten()
-
         # If point_data is string, then the request comes from the preview panel, so use 'LOCAL' method
         if isinstance(point_data, str):
             method = 'LOCAL'
@@ -165,7 +382,9 @@ class TelemacVertexColorUtils(VertexColorUtils):
             method = point_data.remap_method
             names = PointDataManager(point_data.list).names
 
-        output = VertexColorInformation(len(vertex_ids))
+        output = cls.information(bmesh)
+        # Note: previews are always remapped (displayed by the preview material)
+        raw = bool(get_preference("raw_values", False)) and not isinstance(point_data, str)
 
         for name in names:
             # Read data
@@ -186,7 +405,7 @@ class TelemacVertexColorUtils(VertexColorUtils):
 
             # Append point data to output list
             output.names.append(name)
-            output.data.append(remap_array(np.array(data)[vertex_ids], in_min=var_range[0], in_max=var_range[1]))
+            output.data.append(cls.values(bmesh, output, data, var_range, raw=raw))
 
         return output
 
@@ -207,16 +426,19 @@ class TelemacVertexColorUtils(VertexColorUtils):
             VertexColorInformation: point data information to generate vertex colors
         """
 
+        names = cls.required_point_data(point_data)
+
         # Get data from left time point
-        file_data.update_data(time_info.left)
+        file_data.update_data(time_info.left, names=names)
         left = cls.prepare(bmesh, point_data, file_data, offset=offset)
 
         if not time_info.exists:
             # Get data from right time point
-            file_data.update_data(time_info.right)
+            file_data.update_data(time_info.right, names=names)
             right = cls.prepare(bmesh, point_data, file_data, offset=offset)
 
-            percentage = np.abs(time_info.frame - time_info.left_frame) / (time_info.time_steps + 1)
+            # Note: python float, so that float32 data are not promoted
+            percentage = abs(time_info.frame - time_info.left_frame) / (time_info.time_steps + 1)
 
             # Linearly interpolate
             interpolated = left
@@ -248,12 +470,7 @@ class OpenfoamVertexColorUtils(VertexColorUtils):
             VertexColorInformation: vertex colors groups, color data, number of vertices
         """
 
-        # Prepare the mesh to loop over all its triangles
-        if len(bmesh.loop_triangles) == 0:
-            bmesh.calc_loop_triangles()
-
-        # Get vertex indices
-        vertex_ids = np.array([triangle.vertices for triangle in bmesh.loop_triangles]).flatten()
+        output = cls.information(bmesh)
 
         # If point_data is string, then the request comes from the preview panel, so use 'LOCAL' method
         if isinstance(point_data, str):
@@ -263,17 +480,18 @@ class OpenfoamVertexColorUtils(VertexColorUtils):
                 names = [] if json.loads(point_data)["name"] == 'None' else [json.loads(point_data)["name"]]
             else:
                 log.warning("No point data information given")
-                return VertexColorInformation(len(vertex_ids))
+                return output
 
         else:
             method = point_data.remap_method
             names = PointDataManager(point_data.list).names
 
-        output = VertexColorInformation(len(vertex_ids))
+        # Note: previews are always remapped (displayed by the preview material)
+        raw = bool(get_preference("raw_values", False)) and not isinstance(point_data, str)
 
         for name in names:
             # Read data
-            data = file_data.get_point_data(name)[vertex_ids]
+            data = file_data.get_point_data(name)
 
             # Get value range
             if method == 'LOCAL':
@@ -284,6 +502,6 @@ class OpenfoamVertexColorUtils(VertexColorUtils):
 
             # Append point data to output list
             output.names.append(name)
-            output.data.append(remap_array(np.array(data), in_min=var_range[0], in_max=var_range[1]))
+            output.data.append(cls.values(bmesh, output, data, var_range, raw=raw))
 
         return output
@@ -24,10 +24,10 @@ class TelemacMeshForVolume():
             time_interp_steps (int): interpolation steps for point data.
         """
 
-        # Read file
-        self.file = Serafin(path, read_time=True)
+        # Read file (time points are read as views on the memory-mapped file)
+        self.file = Serafin(path, read_time=True, use_memmap=True)
         self.file.get_2d()
-        self.data = self.file.read(self.file.temps[0])
+        self.data = self.file.read(0, is_time=False)
 
         # Get total number of planes (with interpolation)
         self.plane_interp_steps = plane_interp_steps
@@ -60,12 +60,12 @@ class TelemacMeshForVolume():
         """
 
         if interp_time_step == 0:
-            self.data = self.file.read(self.file.temps[time_point])
+            self.data = self.file.read(time_point, is_time=False)
             self.z_coords = self.get_point_data(['ELEVATION Z', 'COTE Z'])
         else:
             # Linearly interpolate point data in time
-            current_data = self.file.read(self.file.temps[time_point])
-            next_data = self.file.read(self.file.temps[time_point + 1])
+            current_data = self.file.read(time_point, is_time=False)
+            next_data = self.file.read(time_point + 1, is_time=False)
             percentage = interp_time_step / (self.time_interp_steps + 1)
             difference = next_data - current_data
             self.data = current_data + percentage * difference
@@ -461,8 +461,9 @@ class TelemacVolume():
 
         # Copy data from host to device, D_xxx = data on device
         D_volume = cuda.to_device(np.zeros(self.nb_voxels))
-        D_data = cuda.to_device(data)
-        D_z_coords = cuda.to_device(mesh.z_coords)
+        # Note: data may be a (non-native byte order) view on the file, copy it as a native array
+        D_data = cuda.to_device(np.ascontiguousarray(data, dtype=np.float64))
+        D_z_coords = cuda.to_device(np.ascontiguousarray(mesh.z_coords, dtype=np.float64))
         D_zcols = cuda.to_device(self.zcols)
         D_zmin = cuda.to_device(self.zmin)
 
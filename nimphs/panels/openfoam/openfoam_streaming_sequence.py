@@ -77,6 +77,8 @@ class NIMPHS_PT_OpenfoamStreamingSequence(NIMPHS_StreamingSequenceSettingsPanel)
             row.prop(import_settings, "triangulate", text="Triangulate")
             row = box.row()
             row.prop(import_settings, "case_type", text="Case")
+            row = box.row()
+            row.prop(import_settings, "load_required_fields", text="Load required fields")
 
             # Clip settings
             draw_clip_settings(self.layout, obj.nimphs.settings.openfoam.clip)
@@ -48,6 +48,22 @@ class NIMPHS_Preferences(AddonPreferences):
         row = box.row()
         row.prop(self.settings, "log_level", text="Log")
 
+        row = box.row()
+        row.prop(self.settings, "frame_cache_size", text="Frame cache (MB)")
+
+        row = box.row()
+        row.prop(self.settings, "single_precision", text="Single precision")
+
+        row = box.row()
+        row.prop(self.settings, "percentile", text="Percentile")
+
+        row = box.row()
+        row.prop(self.settings, "point_data_output", text="Point data")
+
+        row = box.row()
+        row.enabled = self.settings.point_data_output == 'ATTRIBUTES'
+        row.prop(self.settings, "raw_values", text="Raw values")
+
         with open(context.scene.nimphs_state_file, "r+", encoding='utf-8') as file:
             state = json.load(file)["installation"]["state"]
 
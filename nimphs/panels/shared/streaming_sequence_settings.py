@@ -72,3 +72,17 @@ class NIMPHS_StreamingSequenceSettingsPanel(Panel):
         row.prop(sequence, "length", text="Length")
         row = box.row()
         row.prop(sequence, "shade_smooth", text="Shade smooth")
+
+        # Prefetch settings
+        row = box.row()
+        row.prop(sequence, "prefetch", text="Prefetch")
+        if sequence.prefetch:
+            row.prop(sequence, "prefetch_size", text="Size")
+
+            prefetcher = file_data.prefetcher if file_data is not None else None
+            if file_data is not None and file_data.module == 'TELEMAC' and not file_data.cache.is_enabled():
+                row = box.row()
+                row.label(text="Prefetch requires the frame cache (see preferences)", icon='ERROR')
+            elif prefetcher is not None:
+                row = box.row()
+                row.label(text=f"Hits: {prefetcher.hit_rate() * 100:.0f} %, {prefetcher.fps():.1f} FPS", icon='INFO')
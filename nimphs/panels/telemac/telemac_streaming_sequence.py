@@ -61,6 +61,8 @@ class NIMPHS_PT_TelemacStreamingSequence(NIMPHS_StreamingSequenceSettingsPanel):
         row.prop(sequence, "update", text="Update")
 
         if sequence.update:
+            row.prop(sequence, "follow", text="Follow")
+
             # Import settings
             interpolate = obj.nimphs.settings.telemac.interpolate
 
@@ -0,0 +1,231 @@
+# <pep8 compliant>
+from __future__ import annotations
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import pyvista
+import numpy as np
+from pathlib import Path
+from typing import Generator, Union
+from pyvista import POpenFOAMReader, UnstructuredGrid
+
+from nimphs.properties.shared.columnar_store import ColumnarStore, get_store_path
+from nimphs.properties.openfoam.import_settings import NIMPHS_OpenfoamImportSettings
+
+
+def get_reader_settings(reader: POpenFOAMReader) -> dict:
+    """
+    Get settings of the given reader which change the content of the 'internalMesh'.
+
+    Args:
+        reader (POpenFOAMReader): reader
+
+    Returns:
+        dict: settings
+    """
+
+    return {
+        "case_type": reader.case_type,
+        "skip_zero_time": bool(reader.skip_zero_time),
+        "decompose_polyhedra": bool(reader.decompose_polyhedra),
+    }
+
+
+def get_source_signature(file_path: str) -> dict:
+    """
+    Get the total size and the latest modification time of the files of the given OpenFOAM case.
+
+    The case file is usually empty, data are read from the other files of the case directory. The columnar store of
+    the case (saved in the case directory) is ignored.
+
+    Args:
+        file_path (str): path to the OpenFOAM case
+
+    Returns:
+        dict: size of the files (in bytes) and latest modification time (in ns)
+    """
+
+    store_path = get_store_path(file_path)
+    size, mtime = 0, 0
+    for root, folders, files in os.walk(store_path.parent):
+        folders[:] = [folder for folder in folders if Path(root, folder) != store_path]
+        for name in files:
+            stat = os.stat(os.path.join(root, name))
+            size += stat.st_size
+            mtime = max(mtime, stat.st_mtime_ns)
+
+    return {"source_size": size, "source_mtime": mtime}
+
+
+class OpenfoamColumnarCase():
+    """
+    Reader of an OpenFOAM case converted to a columnar store.
+
+    Only the 'internalMesh' is stored: the geometry once (the topology must not change over time), the points of the
+    time points at which they have moved and cell / point data arrays by blocks of time points.
+    """
+
+    def __init__(self, store: ColumnarStore) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            store (ColumnarStore): columnar store of the OpenFOAM case
+        """
+
+        self.store = store
+        self.geometry = pyvista.read(store.path / "mesh.vtu")
+        self.moving_points = set(store.meta["moving_points"])
+
+    @classmethod
+    def open(cls, file_path: str) -> Union[OpenfoamColumnarCase, None]:
+        """
+        Open the columnar store of the given OpenFOAM case, if it exists and is up to date.
+
+        Args:
+            file_path (str): path to the OpenFOAM case
+
+        Returns:
+            Union[OpenfoamColumnarCase, None]: reader, ``None`` if not available
+        """
+
+        store = ColumnarStore.open(file_path, 'OpenFOAM')
+        if store is None:
+            return None
+
+        signature = get_source_signature(file_path)
+        if any(store.meta.get(key) != value for key, value in signature.items()):
+            log.debug(f"Outdated columnar store {store.path}")
+            return None
+
+        try:
+            return cls(store)
+        except Exception:
+            log.warning(f"Unable to read columnar store {store.path}", exc_info=1)
+            return None
+
+    def matches(self, reader: POpenFOAMReader) -> bool:
+        """
+        Check if the store has been generated with the settings and time values of the given reader.
+
+        Args:
+            reader (POpenFOAMReader): reader of the OpenFOAM case
+
+        Returns:
+            bool: ``True`` if the store can be used instead of the reader
+        """
+
+        if self.store.meta["settings"] != get_reader_settings(reader):
+            return False
+
+        return np.allclose(self.store.meta["time_values"], reader.time_values)
+
+    def read(self, time_point: int) -> UnstructuredGrid:
+        """
+        Build the 'internalMesh' of the given time point.
+
+        Args:
+            time_point (int): time point
+
+        Returns:
+            UnstructuredGrid: 'internalMesh'
+        """
+
+        mesh = self.geometry.copy(deep=False)
+        if time_point in self.moving_points:
+            # Note: do not use the points setter, it would modify the points shared with the geometry
+            mesh.SetPoints(pyvista.vtk_points(self.store.load_arrays(f"points_{time_point}")["points"]))
+
+        for var_id, array in enumerate(self.store.meta["arrays"]):
+            data = np.array(self.store.read_frame(var_id, time_point)).reshape([-1] + array["shape"])
+            if array["association"] == 'POINT':
+                mesh.point_data[array["name"]] = data
+            else:
+                mesh.cell_data[array["name"]] = data
+
+        return mesh
+
+
+def convert_openfoam_case(file_path: str, settings: Union[NIMPHS_OpenfoamImportSettings, None] = None,
+                          block_size: int = 16, compress: bool = False) -> Generator[int, None, None]:
+    """
+    Convert the 'internalMesh' of an OpenFOAM case to a columnar store (saved next to the case file).
+
+    Points are saved once, and again for each time point at which they differ from the first time point (moving mesh).
+
+    This is a generator which yields the number of converted time points after each block. Closing the generator
+    before the end removes the incomplete store.
+
+    Args:
+        file_path (str): path to the OpenFOAM case
+        settings (Union[NIMPHS_OpenfoamImportSettings, None], optional): import settings. Defaults to None.
+        block_size (int, optional): number of time points per block. Defaults to 16.
+        compress (bool, optional): compress blocks. Defaults to False.
+
+    Raises:
+        ValueError: if the topology of the mesh changes over time
+
+    Yields:
+        int: number of converted time points
+    """
+
+    reader = POpenFOAMReader(file_path)
+    if settings is not None:
+        reader.case_type = settings.case_type
+        reader.skip_zero_time = settings.skip_zero_time
+        reader.decompose_polyhedra = settings.decompose_polyhedra
+    else:
+        reader.case_type = 'reconstructed'
+        reader.skip_zero_time = True
+        reader.decompose_polyhedra = True
+
+    nb_time_points = reader.number_time_points
+    signature = get_source_signature(file_path)
+
+    # Geometry and list of arrays from the first time point
+    reader.set_active_time_point(0)
+    mesh = reader.read()["internalMesh"]
+    arrays = [{"name": name, "association": 'POINT', "shape": list(mesh.point_data[name].shape[1:])}
+              for name in mesh.point_data.keys()]
+    arrays += [{"name": name, "association": 'CELL', "shape": list(mesh.cell_data[name].shape[1:])}
+               for name in mesh.cell_data.keys()]
+
+    store = ColumnarStore.create(file_path, 'OpenFOAM', [array["name"] for array in arrays], nb_time_points,
+                                 block_size=block_size, compress=compress, arrays=arrays,
+                                 settings=get_reader_settings(reader), time_values=list(reader.time_values),
+                                 moving_points=[], **signature)
+
+    try:
+        geometry = mesh.copy()
+        geometry.clear_data()
+        geometry.save(store.path / "mesh.vtu")
+
+        for block, start in enumerate(range(0, nb_time_points, store.block_size)):
+            end = min(start + store.block_size, nb_time_points)
+            data = [[] for _array in arrays]
+
+            for time_point in range(start, end):
+                reader.set_active_time_point(time_point)
+                mesh = reader.read()["internalMesh"]
+                if mesh.n_points != geometry.n_points or mesh.n_cells != geometry.n_cells:
+                    raise ValueError(f"Topology changes at time point {time_point}, can't convert {file_path}")
+
+                if not np.array_equal(mesh.points, geometry.points):
+                    store.save_arrays(f"points_{time_point}", points=np.asarray(mesh.points))
+                    store.meta["moving_points"].append(time_point)
+
+                for values, array in zip(data, arrays):
+                    source = mesh.point_data if array["association"] == 'POINT' else mesh.cell_data
+                    values.append(np.asarray(source[array["name"]]).ravel())
+
+            for var_id, values in enumerate(data):
+                store.write_block(var_id, block, np.stack(values))
+
+            yield end
+
+        store.save_meta(complete=True)
+    except BaseException:
+        # Error or generator closed before the end (canceled conversion): do not leave an incomplete store
+        store.remove()
+        raise
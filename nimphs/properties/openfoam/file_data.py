@@ -10,15 +10,17 @@ from copy import deepcopy
 from pyvista import POpenFOAMReader, UnstructuredGrid, PolyData
 
 from nimphs.properties.shared.file_data import FileData
+from nimphs.properties.openfoam.columnar_case import OpenfoamColumnarCase
+from nimphs.properties.openfoam.surface_cache import OpenfoamSurfaceCache
 from nimphs.properties.openfoam.import_settings import NIMPHS_OpenfoamImportSettings
 
 
 class OpenfoamFileData(FileData):
     """Hold file data for the OpenFOAM module."""
 
-    #: UnstructuredGrid: 'internalMesh' from data
+    #: UnstructuredGrid: 'internalMesh' from data (read once per time point, never modified)
     raw_mesh: UnstructuredGrid = None
-    #: PolyData: lest generated mesh
+    #: PolyData: lest generated mesh (the raw mesh itself until a mesh is generated)
     mesh: PolyData = None
     #: bool: Indicate whether triangulation should be applied or not
     tiangulate: bool = False
@@ -26,6 +28,12 @@ class OpenfoamFileData(FileData):
     time_point: int = 0
     #: bool: indicate if the skip_zero_time property has changed
     skip_zero_has_changed: bool = False
+    #: OpenfoamColumnarCase: Columnar store of the case (if it has been converted)
+    store: OpenfoamColumnarCase = None
+    #: OpenfoamSurfaceCache: Surface extracted from the 'internalMesh', reused while the mesh does not change
+    surface_cache: OpenfoamSurfaceCache = None
+    #: Union[list[str], None]: Names of the fields to read, ``None`` to read all of them
+    arrays: Union[list[str], None] = None
 
     def __init__(self, file_path: str, settings: Union[NIMPHS_OpenfoamImportSettings, None]) -> None:
         """
@@ -38,6 +46,8 @@ class OpenfoamFileData(FileData):
 
         super().__init__()  # Must be called first (otherwise it will erase self.file content)
 
+        self.surface_cache = OpenfoamSurfaceCache()
+
         # Try to load the given file
         if not self.load_file(file_path):
             raise IOError(f"Unable to read the given file {file_path}")
@@ -99,21 +109,37 @@ class OpenfoamFileData(FileData):
         data = self.raw_mesh.get_array(name=name, preference='point')
         return data[:, int(channel)] if channel.isnumeric() else data
 
-    def update_data(self, time_point: int) -> None:
+    def update_data(self, time_point: int, raw_mesh: Union[UnstructuredGrid, None] = None) -> None:
         """
         Update file data.
 
+        The 'internalMesh' is read once, then shared by the raw mesh and the generated mesh (meshes are generated from\
+        shallow copies, see OpenfoamMeshUtils.vertices).
+
         Args:
             time_point (int): time point to read
-            io_settings (Union[NIMPHS_OpenfoamImportSettings, None], optional): import settings. Defaults to None.
+            raw_mesh (Union[UnstructuredGrid, None], optional): 'internalMesh' of this time point if it has already\
+                                                               been read (prefetched). Defaults to None.
         """
 
+        # The list of variables is generated again below, so read all the fields
+        if self.skip_zero_has_changed:
+            self.arrays = None
+
         # Update mesh
         try:
             self.time_point = time_point
             self.file.set_active_time_point(time_point)
-            self.mesh = self.file.read()["internalMesh"]
-            self.raw_mesh = self.file.read()["internalMesh"]
+            self.apply_arrays(self.file)
+            # Read from the columnar store if it has been generated with the same settings
+            if raw_mesh is None and self.store is not None and self.store.matches(self.file):
+                raw_mesh = self.store.read(time_point)
+
+            if raw_mesh is None:
+                raw_mesh = self.file.read()["internalMesh"]
+
+            self.raw_mesh = raw_mesh
+            self.mesh = raw_mesh
         except AttributeError:  # Raised when using wrong case_type
             self.raw_mesh = None
             return
@@ -152,6 +178,67 @@ class OpenfoamFileData(FileData):
         if old != self.file.skip_zero_time:
             self.skip_zero_has_changed = True
 
+        # Read all the fields, unless required fields are selected again (see 'select_arrays')
+        self.arrays = None
+
+    def select_arrays(self, names: Union[list[str], None]) -> None:
+        """
+        Select the fields to read from the given variable names (applied by the next update).
+
+        Args:
+            names (Union[list[str], None]): names of the variables (e.g. 'U.0', 'p'), ``None`` to read all the fields
+        """
+
+        if names is None:
+            self.arrays = None
+            return
+
+        arrays = []
+        for name in names:
+            channel = name.split('.')[-1]
+            arrays.append(name[:-2] if channel.isnumeric() else name)
+
+        self.arrays = list(dict.fromkeys(arrays))
+
+    def apply_arrays(self, reader: POpenFOAMReader) -> None:
+        """
+        Enable the selected fields on the given reader, disable the other ones.
+
+        Args:
+            reader (POpenFOAMReader): reader
+        """
+
+        if self.arrays is None:
+            reader.enable_all_cell_arrays()
+            reader.enable_all_point_arrays()
+            return
+
+        reader.disable_all_cell_arrays()
+        reader.disable_all_point_arrays()
+        for name in self.arrays:
+            if name in reader.cell_array_names:
+                reader.enable_cell_array(name)
+            if name in reader.point_array_names:
+                reader.enable_point_array(name)
+
+    def create_reader(self) -> POpenFOAMReader:
+        """
+        Create a new reader of the same file, using the same settings.
+
+        Readers can not be shared between threads, background reads use their own reader.
+
+        Returns:
+            POpenFOAMReader: reader
+        """
+
+        reader = POpenFOAMReader(self.file.path)
+        reader.case_type = self.file.case_type
+        reader.skip_zero_time = self.file.skip_zero_time
+        reader.decompose_polyhedra = self.file.decompose_polyhedra
+        self.apply_arrays(reader)
+
+        return reader
+
     def is_ok(self) -> bool:
         """
         Check if file data is up (data are not None or empty).
@@ -200,4 +287,6 @@ class OpenfoamFileData(FileData):
             return False
 
         self.file = POpenFOAMReader(file_path)
+        # Columnar store of the case (see 'optimize result' operator)
+        self.store = OpenfoamColumnarCase.open(file_path)
         return True
@@ -34,6 +34,13 @@ decompose polyhedra into tetrahedra and pyramids",
         default=True
     )
 
+    #: bpy.props.BoolProperty: If `True`, sequences only read the fields they use (selected point data, clip scalars)
+    load_required_fields: BoolProperty(
+        name="Load required fields",  # noqa: F821
+        description="Sequences only read the fields they use (selected point data and clip scalars)",
+        default=True
+    )
+
     #: bpy.props.BoolProperty: If `True`, more complex polygons will be broken down into triangles
     triangulate: BoolProperty(
         name="Triangulate",  # noqa: F821
@@ -0,0 +1,117 @@
+# <pep8 compliant>
+import logging
+log = logging.getLogger(__name__)
+
+import numpy as np
+from typing import Union
+from pyvista import PolyData, UnstructuredGrid
+
+
+class OpenfoamSurfaceCache():
+    """
+    Surface extracted from the 'internalMesh' of an OpenFOAM case, reused while the mesh does not change.
+
+    Most cases have a fixed mesh and time-varying fields: the extracted (and triangulated) surface is the same at each
+    time point, apart from point and cell data. When the mesh has not changed, point and cell data of the surface are
+    sampled from the 'internalMesh' through the original point and cell ids of the surface, instead of extracting the
+    surface again.
+
+    Each call to 'get' returns a new shallow copy of the cached surface with its own point and cell data arrays:
+    surfaces returned earlier are not modified. Points and cells are shared with the cache and must not be modified.
+    """
+
+    #: str: Name of the array which gives, for each point of the surface, the id of the point in the 'internalMesh'
+    ORIGINAL_POINT_IDS: str = "vtkOriginalPointIds"
+    #: str: Name of the array which gives, for each cell of the surface, the id of the cell in the 'internalMesh'
+    ORIGINAL_CELL_IDS: str = "vtkOriginalCellIds"
+
+    #: PolyData: Cached surface
+    surface: PolyData = None
+    #: tuple: Number of points and cells of the 'internalMesh', triangulation state
+    signature: tuple = None
+    #: np.ndarray: Points of the 'internalMesh' (a moving mesh has the same signature but not the same points)
+    points: np.ndarray = None
+    #: np.ndarray: Id of the original point of each point of the surface
+    ids: np.ndarray = None
+    #: np.ndarray: Id of the original cell of each cell of the surface (``None`` if not available)
+    cell_ids: np.ndarray = None
+
+    def get(self, mesh: UnstructuredGrid, triangulate: bool) -> Union[PolyData, None]:
+        """
+        Get the cached surface if it has been extracted from the same mesh. Point and cell data are sampled from the\
+        given mesh.
+
+        Args:
+            mesh (UnstructuredGrid): 'internalMesh'
+            triangulate (bool): indicate whether the surface is triangulated
+
+        Returns:
+            Union[PolyData, None]: copy of the surface, ``None`` if the mesh has changed
+        """
+
+        if self.surface is None or self.signature != self.get_signature(mesh, triangulate):
+            return None
+
+        if not np.array_equal(self.points, mesh.points):
+            return None
+
+        surface = self.surface.copy(deep=False)
+        for name in mesh.point_data.keys():
+            surface.point_data[name] = np.asarray(mesh.point_data[name])[self.ids]
+
+        # Without original cell ids, cell data of the cached surface would be outdated: remove them
+        for name in mesh.cell_data.keys():
+            if self.cell_ids is not None:
+                surface.cell_data[name] = np.asarray(mesh.cell_data[name])[self.cell_ids]
+            elif name in surface.cell_data.keys():
+                surface.cell_data.remove(name)
+
+        return surface
+
+    def put(self, mesh: UnstructuredGrid, surface: PolyData, triangulate: bool) -> None:
+        """
+        Cache the surface extracted from the given mesh.
+
+        Args:
+            mesh (UnstructuredGrid): 'internalMesh'
+            surface (PolyData): extracted surface
+            triangulate (bool): indicate whether the surface is triangulated
+        """
+
+        if self.ORIGINAL_POINT_IDS not in surface.point_data.keys():
+            log.debug("No original point ids, surface not cached")
+            self.clear()
+            return
+
+        # Note: the given surface is returned to the caller, keep a copy which does not share its point data
+        self.surface = surface.copy(deep=False)
+        self.signature = self.get_signature(mesh, triangulate)
+        self.points = np.array(mesh.points)
+        self.ids = np.asarray(surface.point_data[self.ORIGINAL_POINT_IDS])
+        if self.ORIGINAL_CELL_IDS in surface.cell_data.keys():
+            self.cell_ids = np.asarray(surface.cell_data[self.ORIGINAL_CELL_IDS])
+        else:
+            self.cell_ids = None
+
+    def clear(self) -> None:
+        """Remove the cached surface."""
+
+        self.surface = None
+        self.signature = None
+        self.points = None
+        self.ids = None
+        self.cell_ids = None
+
+    def get_signature(self, mesh: UnstructuredGrid, triangulate: bool) -> tuple:
+        """
+        Get the signature of the given mesh.
+
+        Args:
+            mesh (UnstructuredGrid): 'internalMesh'
+            triangulate (bool): indicate whether the surface is triangulated
+
+        Returns:
+            tuple: number of points, number of cells, triangulation state
+        """
+
+        return (mesh.n_points, mesh.n_cells, bool(triangulate))
@@ -1,6 +1,6 @@
 # <pep8 compliant>
 from bpy.types import PropertyGroup
-from bpy.props import EnumProperty, StringProperty
+from bpy.props import EnumProperty, StringProperty, IntProperty, BoolProperty, FloatProperty
 
 
 class NIMPHS_Preferences(PropertyGroup):
@@ -35,3 +35,47 @@ class NIMPHS_Preferences(PropertyGroup):
         description="List of files to accept when importing TELEMAC files",
         default="*.slf",
     )
+
+    #: bpy.props.IntProperty: Maximum size of the frame cache of each TELEMAC file (in MB). 0 disables the cache.
+    frame_cache_size: IntProperty(
+        name="Frame cache size",
+        description="Maximum size of the frame cache of each TELEMAC file (in MB). 0 disables the cache",
+        default=512,
+        min=0,
+        subtype='UNSIGNED',  # noqa: F821
+    )
+
+    #: bpy.props.BoolProperty: Process point data in single precision (float32), as stored by Blender.
+    single_precision: BoolProperty(
+        name="Single precision",
+        description="Process point data in single precision (float32), as stored by Blender. Reload file data to "
+                    "apply this setting",
+        default=True,
+    )
+
+    #: bpy.props.FloatProperty: Percentile of the 'Percentile' remap method.
+    percentile: FloatProperty(
+        name="Percentile",  # noqa: F821
+        description="Values below this percentile or above (100 - this percentile) are ignored by the 'Percentile' "
+                    "remap method. Compute ranges again to apply this setting",
+        default=1.0,
+        min=0.0,
+        max=49.0,
+    )
+
+    #: bpy.props.EnumProperty: Define how point data are written on meshes. Enum in ['VERTEX_COLORS', 'ATTRIBUTES'].
+    point_data_output: EnumProperty(
+        name="Point data output",
+        description="Define how point data are written on meshes. Enum in ['VERTEX_COLORS', 'ATTRIBUTES']",
+        items=[
+            ('VERTEX_COLORS', 'Vertex colors', 'Remapped values packed by three in color layers'),  # noqa: F821
+            ('ATTRIBUTES', 'Attributes', 'One float attribute per variable, stored on vertices'),    # noqa: F821
+        ],
+    )
+
+    #: bpy.props.BoolProperty: Write the values of point data (not remapped) when using attributes.
+    raw_values: BoolProperty(
+        name="Raw values",
+        description="Write the values of point data (not remapped in [0, 1]) when using attributes",
+        default=False,
+    )
@@ -0,0 +1,324 @@
+# <pep8 compliant>
+from __future__ import annotations
+import logging
+log = logging.getLogger(__name__)
+
+import json
+import shutil
+import threading
+import numpy as np
+from pathlib import Path
+from typing import Union
+from collections import OrderedDict
+
+from nimphs.properties.utils.frame_cache import FrameCache
+
+
+def get_store_path(file_path: str) -> Path:
+    """
+    Get the path to the columnar store of the given result file.
+
+    Args:
+        file_path (str): path to the result file (TELEMAC file or OpenFOAM case)
+
+    Returns:
+        Path: path to the store (directory next to the result file)
+    """
+
+    path = Path(file_path).resolve()
+    return path.with_name(path.name + ".nimphs")
+
+
+class ColumnarStore():
+    """
+    Chunked columnar store of point data values.
+
+    Values of each variable are saved by blocks of time points (one ``.npy`` file per variable and per block, or one
+    compressed ``.npz`` file). Reading one variable, one vertex or one plane over time only reads the needed blocks.
+    """
+
+    #: int: Version of the store format
+    VERSION: int = 1
+    #: int: Size of the cache of decompressed blocks (in bytes)
+    BLOCK_CACHE_SIZE: int = 64 * 1024 * 1024
+    #: int: Maximum number of memory-mapped blocks kept open
+    MAX_OPEN_BLOCKS: int = 256
+
+    #: Path: Path to the store directory
+    path: Path = None
+    #: dict: Information on the store (names of the variables, number of time points, block size, etc.)
+    meta: dict = None
+
+    def __init__(self, path: Path, meta: dict) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            path (Path): path to the store directory
+            meta (dict): information on the store
+        """
+
+        self.path = Path(path)
+        self.meta = meta
+        self._blocks = FrameCache(self.BLOCK_CACHE_SIZE if meta.get("compress", False) else 0)
+        self._mmaps = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, file_path: str, module: str) -> Union[ColumnarStore, None]:
+        """
+        Open the columnar store of the given result file (if it exists and is complete).
+
+        Args:
+            file_path (str): path to the result file
+            module (str): name of the module. Enum in ['OpenFOAM', 'TELEMAC'].
+
+        Returns:
+            Union[ColumnarStore, None]: store, ``None`` if not available
+        """
+
+        path = get_store_path(file_path)
+        try:
+            with open(path / "meta.json", "r", encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("version") != cls.VERSION or meta.get("module") != module or not meta.get("complete", False):
+            log.debug(f"Ignore columnar store {path}")
+            return None
+
+        return cls(path, meta)
+
+    @classmethod
+    def create(cls, file_path: str, module: str, names: list[str], nb_time_points: int, block_size: int = 16,
+               compress: bool = False, **info) -> ColumnarStore:
+        """
+        Create a new (empty) columnar store for the given result file. An existing store is replaced.
+
+        Args:
+            file_path (str): path to the result file
+            module (str): name of the module. Enum in ['OpenFOAM', 'TELEMAC'].
+            names (list[str]): names of the variables
+            nb_time_points (int): number of time points
+            block_size (int, optional): number of time points per block. Defaults to 16.
+            compress (bool, optional): compress blocks. Defaults to False.
+            **info: additional information saved with the store (must be JSON serializable)
+
+        Returns:
+            ColumnarStore: store
+        """
+
+        path = get_store_path(file_path)
+        if path.exists():
+            shutil.rmtree(path)
+        path.mkdir(parents=True)
+
+        meta = {
+            "version": cls.VERSION,
+            "module": module,
+            "source": str(Path(file_path).resolve()),
+            "names": list(names),
+            "nb_time_points": int(nb_time_points),
+            "block_size": max(1, int(block_size)),
+            "compress": bool(compress),
+            "complete": False,
+        }
+        meta.update(info)
+
+        store = cls(path, meta)
+        store.save_meta()
+        return store
+
+    @property
+    def names(self) -> list[str]:
+        """
+        Get the names of the variables.
+
+        Returns:
+            list[str]: names
+        """
+
+        return self.meta["names"]
+
+    @property
+    def nb_time_points(self) -> int:
+        """
+        Get the number of time points.
+
+        Returns:
+            int: number of time points
+        """
+
+        return self.meta["nb_time_points"]
+
+    @property
+    def block_size(self) -> int:
+        """
+        Get the number of time points per block.
+
+        Returns:
+            int: block size
+        """
+
+        return self.meta["block_size"]
+
+    def save_meta(self, complete: Union[bool, None] = None) -> None:
+        """
+        Save information on the store.
+
+        Args:
+            complete (Union[bool, None], optional): mark the store as complete (all blocks written). Defaults to None.
+        """
+
+        if complete is not None:
+            self.meta["complete"] = complete
+
+        with open(self.path / "meta.json", "w", encoding="utf-8") as file:
+            json.dump(self.meta, file, indent=4)
+
+    def remove(self) -> None:
+        """Remove the store from the disk (e.g. incomplete conversion)."""
+
+        with self._lock:
+            self._mmaps.clear()
+        self._blocks.clear()
+
+        shutil.rmtree(self.path, ignore_errors=True)
+        log.debug(f"Removed columnar store {self.path}")
+
+    def save_arrays(self, name: str, **arrays) -> None:
+        """
+        Save additional arrays (mesh information for example).
+
+        Args:
+            name (str): name of the group of arrays
+            **arrays: arrays to save
+        """
+
+        np.savez(self.path / f"{name}.npz", **arrays)
+
+    def load_arrays(self, name: str) -> dict[str, np.ndarray]:
+        """
+        Load additional arrays.
+
+        Args:
+            name (str): name of the group of arrays
+
+        Returns:
+            dict[str, np.ndarray]: arrays
+        """
+
+        with np.load(self.path / f"{name}.npz", allow_pickle=False) as arrays:
+            return {key: arrays[key] for key in arrays.files}
+
+    def get_block_path(self, var_id: int, block: int) -> Path:
+        """
+        Get the path to a block of values.
+
+        Args:
+            var_id (int): id of the variable
+            block (int): id of the block
+
+        Returns:
+            Path: path to the block
+        """
+
+        return self.path / f"{var_id}" / (f"{block}.npz" if self.meta["compress"] else f"{block}.npy")
+
+    def write_block(self, var_id: int, block: int, data: np.ndarray) -> None:
+        """
+        Write a block of values.
+
+        Args:
+            var_id (int): id of the variable
+            block (int): id of the block
+            data (np.ndarray): values, shape is (nb_time_points_in_block, nb_values)
+        """
+
+        path = self.get_block_path(var_id, block)
+        path.parent.mkdir(exist_ok=True)
+
+        data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder('='))
+        if self.meta["compress"]:
+            np.savez_compressed(path, data=data)
+        else:
+            np.save(path, data)
+
+    def read_block(self, var_id: int, block: int) -> np.ndarray:
+        """
+        Read a block of values (memory-mapped when not compressed).
+
+        Args:
+            var_id (int): id of the variable
+            block (int): id of the block
+
+        Returns:
+            np.ndarray: values, shape is (nb_time_points_in_block, nb_values)
+        """
+
+        if not self.meta["compress"]:
+            with self._lock:
+                data = self._mmaps.get((var_id, block), None)
+                if data is None:
+                    data = np.load(self.get_block_path(var_id, block), mmap_mode='r')
+                    self._mmaps[(var_id, block)] = data
+                    if len(self._mmaps) > self.MAX_OPEN_BLOCKS:
+                        self._mmaps.popitem(last=False)
+                else:
+                    self._mmaps.move_to_end((var_id, block))
+
+                return data
+
+        data = self._blocks.get((var_id, block))
+        if data is None:
+            with np.load(self.get_block_path(var_id, block)) as arrays:
+                data = arrays["data"]
+            self._blocks.put((var_id, block), data)
+
+        return data
+
+    def read_frame(self, var_id: int, time_point: int) -> np.ndarray:
+        """
+        Read values of a variable at the given time point.
+
+        Args:
+            var_id (int): id of the variable
+            time_point (int): time point
+
+        Returns:
+            np.ndarray: values
+        """
+
+        return self.read_block(var_id, time_point // self.block_size)[time_point % self.block_size]
+
+    def read_series(self, var_id: int, start: int = 0, end: Union[int, None] = None,
+                    columns: Union[np.ndarray, list[int], None] = None) -> np.ndarray:
+        """
+        Read values of a variable over a range of time points (only reads the needed blocks).
+
+        Args:
+            var_id (int): id of the variable
+            start (int, optional): first time point. Defaults to 0.
+            end (Union[int, None], optional): last time point (excluded). Defaults to None (number of time points).
+            columns (Union[np.ndarray, list[int], None], optional): indices of the values to read. Defaults to None.
+
+        Returns:
+            np.ndarray: values, shape is (end - start, nb_values)
+        """
+
+        end = self.nb_time_points if end is None else end
+        if end <= start:
+            # Empty range: only the number of values is needed (from the first block, if any)
+            if self.nb_time_points == 0:
+                return np.empty((0, 0 if columns is None else len(columns)), dtype=np.float32)
+            data = self.read_block(var_id, 0)[:0]
+            return data if columns is None else data[:, columns]
+
+        output = []
+        for block in range(start // self.block_size, (end - 1) // self.block_size + 1):
+            first = block * self.block_size
+            data = self.read_block(var_id, block)[max(start - first, 0):end - first]
+            output.append(data if columns is None else data[:, columns])
+
+        return np.concatenate(output, axis=0)
@@ -4,6 +4,7 @@ from typing import Union
 from pyvista import POpenFOAMReader
 
 from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.utils.prefetch import Prefetcher
 from nimphs.properties.utils.point_data import PointDataManager
 
 
@@ -18,6 +19,8 @@ class FileData():
     nb_time_points: int = 0
     #: PointDataManager: Information on variables
     vars: PointDataManager = None
+    #: Prefetcher: Background reader of the next time points ('streaming sequence' objects)
+    prefetcher: Prefetcher = None
 
     def __init__(self) -> None:
         """Init method of the class."""
@@ -26,6 +29,7 @@ class FileData():
         self.file = None
         self.nb_time_points = 0
         self.vars = PointDataManager()
+        self.prefetcher = None
 
     def get_point_data(self, _id: Union[str, int]) -> np.ndarray:
         """
@@ -43,7 +47,7 @@ class FileData():
 
         Args:
             name (str): name of the variable to update
-            scope (str, optional): indicate which information to update. Enum in ['LOCAL', 'GLOBAL'].\
+            scope (str, optional): indicate which information to update. Enum in ['LOCAL', 'GLOBAL', 'PERCENTILE'].\
                                    Defaults to 'LOCAL'.
             data (Union[np.ndarray, tuple, None], optional): data corresponding to the given variable\
                                                              or min / max values. Defaults to None.
@@ -66,3 +70,8 @@ class FileData():
         if scope == 'GLOBAL':
             self.vars.ranges[id].minG = float(data["min"])
             self.vars.ranges[id].maxG = float(data["max"])
+
+        # Update percentile information (global range without outliers)
+        if scope == 'PERCENTILE':
+            self.vars.ranges[id].minP = float(data["min"])
+            self.vars.ranges[id].maxP = float(data["max"])
@@ -51,3 +51,19 @@ class NIMPHS_ModuleStreamingSequenceSettings(PropertyGroup):
         description="Indicate whether to use smooth shading or flat shading",
         default=False
     )
+
+    #: bpy.props.BoolProperty: Read the next time points in background during playback.
+    prefetch: BoolProperty(
+        name="Prefetch",  # noqa: F821
+        description="Read the next time points in background during playback",
+        default=False
+    )
+
+    #: bpy.props.IntProperty: Number of time points to read ahead.
+    prefetch_size: IntProperty(
+        name="Prefetch size",
+        description="Number of time points to read ahead",
+        default=4,
+        min=1,
+        soft_max=32,
+    )
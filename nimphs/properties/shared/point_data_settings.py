@@ -32,7 +32,8 @@ class NIMPHS_PointDataSettings(PropertyGroup):
         items=[
             ("LOCAL", "Local", "Remap point data using a local value range"),  # noqa: F821
             ("GLOBAL", "Global", "Remap point data using a global value range"),  # noqa: F821
-            ("CUSTOM", "Custom", "Remap point data using a custom value range")  # noqa: F821
+            ("CUSTOM", "Custom", "Remap point data using a custom value range"),  # noqa: F821
+            ("PERCENTILE", "Percentile", "Remap point data using a global value range without outliers")  # noqa: F821
         ]
     )
 
@@ -0,0 +1,344 @@
+# <pep8 compliant>
+from __future__ import annotations
+import logging
+log = logging.getLogger(__name__)
+
+import numpy as np
+from pathlib import Path
+from typing import Generator, Union
+from concurrent.futures import ThreadPoolExecutor
+
+from nimphs.properties.telemac.serafin import get_time_position
+from nimphs.properties.telemac.partitioned_serafin import open_telemac_file, get_partition_paths
+from nimphs.properties.shared.columnar_store import ColumnarStore
+
+
+def get_source_signature(file_path: str) -> dict:
+    """
+    Get the total size and the latest modification time of the given TELEMAC file.
+
+    For a partitioned result, all the partition files are taken into account.
+
+    Args:
+        file_path (str): path to the TELEMAC file (or to one of the partition files of a partitioned result)
+
+    Raises:
+        IOError: if a partition file is missing
+
+    Returns:
+        dict: size of the files (in bytes) and latest modification time (in ns)
+    """
+
+    size, mtime = 0, 0
+    for path in get_partition_paths(file_path) or [file_path]:
+        stat = Path(path).stat()
+        size += stat.st_size
+        mtime = max(mtime, stat.st_mtime_ns)
+
+    return {"source_size": size, "source_mtime": mtime}
+
+
+class TelemacColumnarFrames():
+    """Lazy (n_time, n_var, n_nodes) access to the values of a columnar store (same indexing as Serafin frames)."""
+
+    def __init__(self, file: TelemacColumnarFile) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            file (TelemacColumnarFile): TELEMAC columnar file
+        """
+
+        self.file = file
+        self.shape = (file.nb_pdt, file.nbvar, file.npoin)
+        self.dtype = np.dtype(file.store.meta["dtype"])
+
+    def __getitem__(self, time_points: slice) -> np.ndarray:
+        """
+        Read a range of time points.
+
+        Args:
+            time_points (slice): time points (slice with a step of 1)
+
+        Returns:
+            np.ndarray: values, shape is (n_time, n_var, n_nodes)
+        """
+
+        start, end, _step = time_points.indices(self.shape[0])
+        return np.stack([self.file.store.read_series(var_id, start, end) for var_id in range(self.shape[1])], axis=1)
+
+
+class TelemacColumnarFile():
+    """
+    Reader of a TELEMAC file converted to a columnar store.
+
+    It provides the reading methods of Serafin used by file data (read, read_vars, read_time_series, etc.).
+    """
+
+    def __init__(self, store: ColumnarStore) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            store (ColumnarStore): columnar store of the TELEMAC file
+        """
+
+        self.store = store
+        self.timings = {}
+
+        mesh = store.load_arrays("mesh")
+        self.temps = mesh["temps"]
+        self.x, self.y = mesh["x"], mesh["y"]
+        self.ikle, self.ikle2d = mesh["ikle"], mesh["ikle2d"]
+
+        self.nomvar = store.meta["nomvar"]
+        self.nbvar = len(self.nomvar)
+        self.nb_pdt = store.nb_time_points
+        self.nplan = store.meta["nplan"]
+        self.npoin = store.meta["npoin"]
+        self.npoin2d = store.meta["npoin2d"]
+
+    @classmethod
+    def open(cls, file_path: str) -> Union[TelemacColumnarFile, None]:
+        """
+        Open the columnar store of the given TELEMAC file, if it exists and is up to date.
+
+        Args:
+            file_path (str): path to the TELEMAC file
+
+        Returns:
+            Union[TelemacColumnarFile, None]: reader, ``None`` if not available
+        """
+
+        store = ColumnarStore.open(file_path, 'TELEMAC')
+        if store is None:
+            return None
+
+        try:
+            signature = get_source_signature(file_path)
+        except IOError:
+            signature = {}
+
+        if len(signature) == 0 or any(store.meta.get(key) != value for key, value in signature.items()):
+            log.debug(f"Outdated columnar store {store.path}")
+            return None
+
+        return cls(store)
+
+    def get_2d(self) -> None:
+        """2D mesh information is computed during the conversion, nothing to do."""
+
+        pass
+
+    def refresh(self) -> int:
+        """
+        Columnar stores are not updated after their conversion, there are never new time points.
+
+        Returns:
+            int: number of new time points (always 0)
+        """
+
+        return 0
+
+    def get_position(self, time2read: float, is_time: bool = True) -> int:
+        """
+        Get the position of the given time.
+
+        Args:
+            time2read (float): time (or position of time if is_time is False)
+            is_time (bool, optional): indicate if time2read is a time. Defaults to True.
+
+        Returns:
+            int: position of the time
+        """
+
+        return get_time_position(self.temps, time2read) if is_time else int(time2read)
+
+    def pos_var(self, list_var: list[Union[int, str]]) -> list[int]:
+        """
+        Get the position of the given variables (positions or names).
+
+        Args:
+            list_var (list[Union[int, str]]): variables
+
+        Returns:
+            list[int]: positions of the variables
+        """
+
+        output = []
+        for var in list_var:
+            if isinstance(var, str):
+                var = next(id for id, name in enumerate(self.nomvar) if var.lower() in name.lower())
+            output.append(int(var))
+
+        return output
+
+    def read(self, time2read: float, var2del: list[int] = [], is_time: bool = True, **_kwargs) -> np.ndarray:
+        """
+        Read all the variables of a specific time.
+
+        Args:
+            time2read (float): time (or position of time if is_time is False)
+            var2del (list[int], optional): variables to ignore. Defaults to [].
+            is_time (bool, optional): indicate if time2read is a time. Defaults to True.
+
+        Returns:
+            np.ndarray: values, shape is (nbvar, npoin)
+        """
+
+        data = np.stack(self.read_vars(time2read, list(range(self.nbvar)), is_time=is_time))
+        return np.delete(data, var2del, 0) if len(var2del) > 0 else data
+
+    def read_vars(self, time2read: float, list_var: list[Union[int, str]], is_time: bool = True) -> list[np.ndarray]:
+        """
+        Read the given variables of a specific time.
+
+        Args:
+            time2read (float): time (or position of time if is_time is False)
+            list_var (list[Union[int, str]]): variables to read (positions or names)
+            is_time (bool, optional): indicate if time2read is a time. Defaults to True.
+
+        Returns:
+            list[np.ndarray]: one array per variable
+        """
+
+        time_point = self.get_position(time2read, is_time=is_time)
+        return [self.store.read_frame(var_id, time_point) for var_id in self.pos_var(list_var)]
+
+    def read_frames(self, list_time: list[float], list_var: Union[list[Union[int, str]], None] = None,
+                    is_time: bool = False, out: Union[np.ndarray, None] = None,
+                    max_workers: Union[int, None] = None) -> np.ndarray:
+        """
+        Read several time points concurrently (thread pool). Thread-safe.
+
+        Args:
+            list_time (list[float]): positions of the times to read (or times if is_time is True)
+            list_var (Union[list[Union[int, str]], None], optional): variables. Defaults to None (all variables).
+            is_time (bool, optional): indicate if list_time contains times. Defaults to False.
+            out (Union[np.ndarray, None], optional): output buffer of shape (n_time, n_var, npoin).\
+                Defaults to None (allocate a new array).
+            max_workers (Union[int, None], optional): number of threads. Defaults to None (8 at most).
+
+        Raises:
+            ValueError: if the shape of the output buffer is wrong
+
+        Returns:
+            np.ndarray: values, shape is (n_time, n_var, npoin) (out if given)
+        """
+
+        list_var = list(range(self.nbvar)) if list_var is None else self.pos_var(list_var)
+        time_points = [self.get_position(time2read, is_time=is_time) for time2read in list_time]
+
+        shape = (len(time_points), len(list_var), self.npoin)
+        if out is None:
+            out = np.empty(shape, dtype=self.store.meta["dtype"])
+        elif out.shape != shape:
+            raise ValueError(f"The shape of the output buffer is {out.shape}, expected {shape}")
+
+        def read_frame(pos: int) -> None:
+            for pos_var, var_id in enumerate(list_var):
+                out[pos, pos_var] = self.store.read_frame(var_id, time_points[pos])
+
+        max_workers = min(8, len(time_points)) if max_workers is None else max_workers
+        if max_workers <= 1:
+            for pos in range(len(time_points)):
+                read_frame(pos)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(read_frame, range(len(time_points))))
+
+        return out
+
+    def read_time_series(self, liste_nodes: list[int], list_var: Union[list[Union[int, str]], None] = None,
+                         start: int = 0, end: Union[int, None] = None,
+                         out: Union[np.ndarray, None] = None) -> np.ndarray:
+        """
+        Read the history of a set of nodes for a set of variables (only reads the needed blocks).
+
+        Args:
+            liste_nodes (list[int]): node positions
+            list_var (Union[list[Union[int, str]], None], optional): variables. Defaults to None (all variables).
+            start (int, optional): position of the first time to read. Defaults to 0.
+            end (Union[int, None], optional): position of the last time to read (excluded). Defaults to None.
+            out (Union[np.ndarray, None], optional): output buffer of shape (n_time, n_var, n_nodes).\
+                Defaults to None (allocate a new array).
+
+        Raises:
+            ValueError: if the shape of the output buffer is wrong
+
+        Returns:
+            np.ndarray: values, shape is (n_time, n_var, n_nodes) (out if given)
+        """
+
+        list_var = list(range(self.nbvar)) if list_var is None else self.pos_var(list_var)
+        nodes = np.asarray(liste_nodes, dtype=np.intp)
+        end = self.nb_pdt if end is None else end
+
+        shape = (end - start, len(list_var), len(nodes))
+        if out is None:
+            out = np.empty(shape, dtype=self.store.meta["dtype"])
+        elif out.shape != shape:
+            raise ValueError(f"The shape of the output buffer is {out.shape}, expected {shape}")
+
+        for pos, var_id in enumerate(list_var):
+            out[:, pos] = self.store.read_series(var_id, start, end, columns=nodes)
+
+        return out
+
+    def get_frames_view(self) -> TelemacColumnarFrames:
+        """
+        Get lazy access to all the frames of the file.
+
+        Returns:
+            TelemacColumnarFrames: frames, shape is (nb_pdt, nbvar, npoin)
+        """
+
+        return TelemacColumnarFrames(self)
+
+
+def convert_telemac_file(file_path: str, block_size: int = 16, compress: bool = False) -> Generator[int, None, None]:
+    """
+    Convert a TELEMAC file to a columnar store (saved next to the file).
+
+    This is a generator which yields the number of converted time points after each block. Closing the generator
+    before the end removes the incomplete store.
+
+    Args:
+        file_path (str): path to the TELEMAC file (or to one of the partition files of a partitioned result)
+        block_size (int, optional): number of time points per block. Defaults to 16.
+        compress (bool, optional): compress blocks. Defaults to False.
+
+    Yields:
+        int: number of converted time points
+    """
+
+    # Note: subdomains of partitioned results are stitched, the store holds the recombined result
+    file = open_telemac_file(file_path)
+    file.get_2d()
+    frames = file.get_frames_view()
+
+    signature = get_source_signature(file_path)
+    store = ColumnarStore.create(file_path, 'TELEMAC', [name[:16].rstrip() for name in file.nomvar], file.nb_pdt,
+                                 block_size=block_size, compress=compress, nomvar=list(file.nomvar),
+                                 nplan=int(file.nplan), npoin=int(file.npoin), npoin2d=int(file.npoin2d),
+                                 dtype=frames.dtype.newbyteorder('=').str, **signature)
+
+    store.save_arrays("mesh", temps=np.asarray(file.temps), x=np.asarray(file.x), y=np.asarray(file.y),
+                      ikle=np.asarray(file.ikle), ikle2d=np.asarray(file.ikle2d))
+
+    try:
+        for block, start in enumerate(range(0, file.nb_pdt, store.block_size)):
+            end = min(start + store.block_size, file.nb_pdt)
+            data = frames[start:end]
+            for var_id in range(file.nbvar):
+                store.write_block(var_id, block, data[:, var_id])
+
+            yield end
+
+        store.save_meta(complete=True)
+    except BaseException:
+        # Error or generator closed before the end (canceled conversion): do not leave an incomplete store
+        store.remove()
+        raise
+    finally:
+        file.close()
@@ -9,7 +9,12 @@ from typing import Union
 from copy import deepcopy
 
 from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.telemac.columnar_file import TelemacColumnarFile
+from nimphs.properties.telemac.partitioned_serafin import open_telemac_file
 from nimphs.properties.shared.file_data import FileData
+from nimphs.properties.telemac.statistics_index import TelemacStatisticsIndex
+from nimphs.properties.utils.frame_cache import FrameCache
+from nimphs.properties.utils.preferences import get_preference
 
 
 def remove_spaces(name: str):
@@ -28,6 +33,25 @@ def remove_spaces(name: str):
             return name[:i + 1]
 
 
+def is_memory_mapped(data: np.ndarray) -> bool:
+    """
+    Indicate if the given array is a view on a memory-mapped file.
+
+    Args:
+        data (np.ndarray): array
+
+    Returns:
+        bool: ``True`` if the memory of the array belongs to a memory map
+    """
+
+    while data is not None:
+        if isinstance(data, np.memmap):
+            return True
+        data = getattr(data, "base", None)
+
+    return False
+
+
 class TelemacFileData(FileData):
     """Hold file data for the TELEMAC module."""
 
@@ -41,10 +65,20 @@ class TelemacFileData(FileData):
     nb_vertices: int = 0
     #: int: Number of triangles
     nb_triangles: int = 0
-    #: np.ndarray: Data
-    data: np.ndarray = None
+    #: dict[int, np.ndarray]: Data of the current time point, indexed by variable id (read-only views on the file)
+    data: dict[int, np.ndarray] = None
+    #: int: Current time point
+    time_point: int = 0
     #: tuple[float, float, float]: Dimensions
     dimensions: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    #: FrameCache: Cache of decoded frames, indexed by (time point, variable id)
+    cache: FrameCache = None
+    #: TelemacStatisticsIndex: Value ranges of each variable at each time point
+    statistics: TelemacStatisticsIndex = None
+    #: np.dtype: Type of the floating point values of vertices and point data (see 'single precision' preference)
+    dtype: np.dtype = np.dtype(np.float64)
+    #: bool: Indicate if the file returns views on memory-mapped data in the requested type (frame cache not used)
+    zero_copy: bool = False
 
     def __init__(self, file_path: str) -> None:
         """
@@ -56,6 +90,11 @@ class TelemacFileData(FileData):
 
         super().__init__()  # Must be called first (otherwise it will erase self.file content)
 
+        # Note: in single precision mode, data stay in float32 from the reader to the mesh (Blender stores vertices
+        # and colors as 32 bits floats)
+        self.cache = FrameCache(int(get_preference("frame_cache_size", 512)) * 1024 * 1024)
+        self.dtype = np.dtype(np.float32) if get_preference("single_precision", True) else np.dtype(np.float64)
+
         if not self.load_file(file_path):
             raise IOError(f"Unable to read the given file {file_path}")
 
@@ -63,7 +102,7 @@ class TelemacFileData(FileData):
         self.module = 'TELEMAC'
 
         self.file.get_2d()  # Read mesh
-        self.data = self.file.read(self.file.temps[0])  # Read time step
+        self.update_data(0)  # Read time step
 
         self.nb_planes = self.file.nplan
 
@@ -73,7 +112,7 @@ class TelemacFileData(FileData):
         self.nb_time_points = self.file.nb_pdt
 
         # Construct vertices array
-        self.vertices = np.vstack((self.file.x[:self.nb_vertices], self.file.y[:self.nb_vertices])).T
+        self.vertices = np.vstack((self.file.x[:self.nb_vertices], self.file.y[:self.nb_vertices])).T.astype(self.dtype)
 
         # Construct faces array
         # Note: '-1' to remove the '+1' offset in the ikle array
@@ -84,12 +123,17 @@ class TelemacFileData(FileData):
 
         self.init_point_data_manager()
 
+        # Read 'GLOBAL' and 'PERCENTILE' value ranges from the statistics index (if it has already been computed)
+        self.statistics = TelemacStatisticsIndex(file_path)
+        if self.statistics.load():
+            self.update_global_ranges()
+
         # Compute dimensions
         z, name = self.get_point_data_from_list(['ELEVATION Z', 'COTE Z'])
         dimx = np.max(self.vertices[:, 0]) - np.min(self.vertices[:, 0])
         dimy = np.max(self.vertices[:, 1]) - np.min(self.vertices[:, 1])
         dimz = np.max(z) - np.min(z)
-        self.dimensions = (dimx, dimy, dimz)
+        self.dimensions = (float(dimx), float(dimy), float(dimz))
 
     def copy(self, other: TelemacFileData) -> None:
         """
@@ -112,6 +156,10 @@ class TelemacFileData(FileData):
         if isinstance(id, str):
             id = self.vars.names.index(id)
 
+        # This variable has not been read by the last (selective) update, read it now
+        if id not in self.data:
+            self.data[id] = self.read_frames(self.time_point, [id])[0]
+
         return self.data[id]
 
     def get_point_data_from_list(self, names: list[str]) -> tuple[np.ndarray, str]:
@@ -134,21 +182,130 @@ class TelemacFileData(FileData):
                 pass
 
         log.error(f"No data available from var names {names}", exc_info=1)
-        return np.zeros((self.nb_vertices, 1)), ''
+        return np.zeros((self.nb_vertices, 1), dtype=self.dtype), ''
 
-    def update_data(self, time_point: int) -> None:
+    def update_data(self, time_point: int, names: Union[list[str], None] = None) -> None:
         """
         Update file data.
 
+        If names are given, only read these variables (other variables are read on demand by get_point_data).
+
         Args:
             time_point (int): time point to read
+            names (Union[list[str], None], optional): names of the variables to read. Defaults to None (read all).
         """
 
         if time_point > self.nb_time_points or time_point < 0:
             log.error(f"Undefined time point ({time_point})")
             return
 
-        self.data = self.file.read(self.file.temps[time_point])
+        self.time_point = time_point
+
+        if names is None:
+            ids = list(range(self.file.nbvar))
+        else:
+            ids = [self.vars.names.index(name) for name in dict.fromkeys(names) if name in self.vars.names]
+
+        self.data = dict(zip(ids, self.read_frames(time_point, ids)))
+
+    def read_frames(self, time_point: int, ids: list[int]) -> list[np.ndarray]:
+        """
+        Read data of the given variables at the given time point, using the frame cache when possible.
+
+        Data already stored in the requested precision and byte order (e.g. uncompressed columnar stores) are returned
+        as views on the memory-mapped file and are not cached: reading them again costs nothing, a cached copy would
+        only duplicate the page cache. Other data are decoded once and cached.
+
+        Args:
+            time_point (int): time point to read
+            ids (list[int]): ids of the variables to read
+
+        Returns:
+            list[np.ndarray]: data of each variable
+        """
+
+        if not self.cache.is_enabled() or self.zero_copy:
+            # Note: no copy when the file already stores values in the requested precision and byte order
+            read = self.file.read_vars(time_point, ids, is_time=False)
+            return [data.astype(self.dtype, copy=False) for data in read]
+
+        output = [self.cache.get((time_point, id)) for id in ids]
+        missing = [id for id, data in zip(ids, output) if data is None]
+        if not missing:
+            return output
+
+        # Decode missing frames once (requested precision, native byte order, owned memory), then cache them
+        read = dict(zip(missing, self.file.read_vars(time_point, missing, is_time=False)))
+        for i, id in enumerate(ids):
+            if output[i] is None:
+                output[i] = read[id].astype(self.dtype, copy=False)
+                if is_memory_mapped(output[i]):
+                    self.zero_copy = True
+                else:
+                    self.cache.put((time_point, id), output[i])
+
+        return output
+
+    def refresh(self) -> int:
+        """
+        Look for new time points written in the file by a running simulation (the mesh is not read again).
+
+        Value ranges of the statistics index do not cover new time points: the index is cleared, the 'compute ranges'
+        operator computes it again.
+
+        Returns:
+            int: number of new time points
+        """
+
+        nb_new = self.file.refresh()
+        if nb_new > 0:
+            self.nb_time_points = self.file.nb_pdt
+            self.statistics.clear()
+            log.debug(f"{nb_new} new time point(s), {self.nb_time_points} available")
+
+        return nb_new
+
+    def update_global_ranges(self, names: Union[list[str], None] = None) -> None:
+        """
+        Update 'GLOBAL' and 'PERCENTILE' value ranges using the statistics index.
+
+        Args:
+            names (Union[list[str], None], optional): names of the variables to update. Defaults to None (all).
+        """
+
+        if not self.statistics.is_ok():
+            return
+
+        percentile = float(get_preference("percentile", 1.0))
+        for name in (self.vars.names if names is None else names):
+            if name in self.statistics.names:
+                mini, maxi = self.statistics.get_range(name)
+                self.update_var_range(name, scope='GLOBAL', data={"min": mini, "max": maxi})
+                mini, maxi = self.statistics.get_percentile_range(name, percentile)
+                self.update_var_range(name, scope='PERCENTILE', data={"min": mini, "max": maxi})
+
+    def get_time_series(self, names: list[str], vertex_ids: list[int], start: int = 0,
+                        end: Union[int, None] = None, out: Union[np.ndarray, None] = None) -> np.ndarray:
+        """
+        Get the history of the given vertices for the given variables (read in one pass).
+
+        To read a large number of vertices over a large number of time points, read batches of time points in the same
+        preallocated output buffer.
+
+        Args:
+            names (list[str]): names of the variables
+            vertex_ids (list[int]): indices of the vertices (for 3D simulations, index in the whole 3D mesh)
+            start (int, optional): first time point. Defaults to 0.
+            end (Union[int, None], optional): last time point (excluded). Defaults to None (number of time points).
+            out (Union[np.ndarray, None], optional): output buffer, shape is (n_time_points, n_variables, n_vertices).\
+                Defaults to None (allocate a new array).
+
+        Returns:
+            np.ndarray: data, shape is (n_time_points, n_variables, n_vertices)
+        """
+
+        ids = [self.vars.names.index(name) for name in names]
+        return self.file.read_time_series(vertex_ids, ids, start=start, end=end, out=out)
 
     def is_ok(self) -> bool:
         """
@@ -199,5 +356,20 @@ class TelemacFileData(FileData):
             log.error("Cannot open files from directories")
             return False
 
-        self.file = Serafin(file_path, read_time=True)
+        self.zero_copy = False
+
+        # Use the columnar store of the file if it exists and is up to date (see 'optimize result' operator)
+        self.file = TelemacColumnarFile.open(file_path)
+        if self.file is not None:
+            log.debug(f"Read {path.name} from columnar store {self.file.store.path}")
+            return True
+
+        # Memory-mapped reader: time points are read as views on the file (no parsing, no copies)
+        # Partitioned results: all the subdomains are read in parallel and stitched into the global numbering
+        self.file = open_telemac_file(file_path)
+
+        # Timing breakdown of the header reading (connectivity and coordinates are decoded in bulk)
+        timings = ", ".join([f"{name}: " + "{:.4f}".format(value) + "s" for name, value in self.file.timings.items()])
+        log.debug(f"Read header of {path.name} ({timings})")
+
         return True
@@ -0,0 +1,383 @@
+# <pep8 compliant>
+from __future__ import annotations
+import logging
+log = logging.getLogger(__name__)
+
+import re
+import numpy as np
+from pathlib import Path
+from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+
+from nimphs.properties.telemac.serafin import Serafin, get_time_position
+
+#: re.Pattern: Suffix of partition files ('<file><ncsize - 1>-<id of the partition>', 5 digits each)
+PARTITION_SUFFIX = re.compile(r"^(?P<base>.+?)(?P<last>\d{5})-(?P<id>\d{5})$")
+
+
+def get_partition_paths(file_path: str) -> list[str]:
+    """
+    Get the paths to all the partition files of a partitioned (non-recombined) TELEMAC result.
+
+    Args:
+        file_path (str): path to one of the partition files (e.g. 'result.slf00003-00001')
+
+    Raises:
+        IOError: if a partition file is missing
+
+    Returns:
+        list[str]: paths to the partition files, empty if the given file is not a partition file
+    """
+
+    path = Path(file_path)
+    match = PARTITION_SUFFIX.match(path.name)
+    if match is None:
+        return []
+
+    last = match.group("last")
+    paths = [path.with_name(f"{match.group('base')}{last}-{id:05d}") for id in range(int(last) + 1)]
+
+    missing = [str(partition) for partition in paths if not partition.exists()]
+    if len(missing) > 0:
+        raise IOError(f"Missing partition files: {missing}")
+
+    return [str(partition) for partition in paths]
+
+
+def open_telemac_file(file_path: str) -> Union[Serafin, PartitionedSerafin]:
+    """
+    Open a TELEMAC result: memory-mapped Serafin file, or all the subdomains of a partitioned result.
+
+    Args:
+        file_path (str): path to the file (or to one of the partition files)
+
+    Returns:
+        Union[Serafin, PartitionedSerafin]: reader
+    """
+
+    partitions = get_partition_paths(file_path)
+    if len(partitions) > 0:
+        return PartitionedSerafin(partitions)
+
+    return Serafin(file_path, read_time=True, use_memmap=True)
+
+
+class PartitionedFrames():
+    """Lazy (n_time, n_var, n_nodes) access to the frames of a partitioned result (same indexing as Serafin frames)."""
+
+    def __init__(self, file: PartitionedSerafin) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            file (PartitionedSerafin): partitioned TELEMAC result
+        """
+
+        self.file = file
+        self.shape = (file.nb_pdt, file.nbvar, file.npoin)
+        self.dtype = file.dtype
+
+    def __getitem__(self, time_points: slice) -> np.ndarray:
+        """
+        Read a range of time points.
+
+        Args:
+            time_points (slice): time points
+
+        Returns:
+            np.ndarray: values, shape is (n_time, n_var, n_nodes)
+        """
+
+        return self.file.read_frames(range(*time_points.indices(self.shape[0])))
+
+
+class PartitionedSerafin():
+    """
+    Reader of a partitioned TELEMAC result (one Serafin file per subdomain, not recombined).
+
+    All the subdomains are read in parallel (thread pool, one task per subdomain) and stitched into the global
+    numbering. The global numbers of the nodes of each subdomain come from its IPOBO array (KNOLG in partitioned
+    files). Nodes on the interfaces between subdomains are read from a single subdomain: index arrays of the owned
+    nodes are computed once, then each frame is stitched with vectorized gathers.
+
+    It provides the reading methods of Serafin used by file data (read, read_vars, read_frames, read_time_series, etc.).
+    """
+
+    def __init__(self, paths: list[str], max_workers: Union[int, None] = None) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            paths (list[str]): paths to the partition files (ordered by id of the subdomain)
+            max_workers (Union[int, None], optional): number of threads. Defaults to None (number of partitions, 8
+                at most).
+
+        Raises:
+            ValueError: if the partitions do not cover all the nodes of the global mesh
+        """
+
+        self.paths = paths
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or min(8, len(paths)))
+
+        def open_partition(path: str) -> Serafin:
+            partition = Serafin(path, read_time=True, use_memmap=True)
+            partition.get_2d()
+            return partition
+
+        self.partitions = list(self.executor.map(open_partition, paths))
+        first = self.partitions[0]
+
+        self.timings = {}
+        for partition in self.partitions:
+            for name, value in partition.timings.items():
+                self.timings[name] = self.timings.get(name, 0.0) + value
+
+        self.nomvar = first.nomvar
+        self.nbvar = first.nbvar
+        self.nplan = first.nplan
+        self.dtype = first.get_dtype().newbyteorder('=')
+        self.nb_pdt = min(partition.nb_pdt for partition in self.partitions)
+        self.temps = np.asarray(first.temps)[:self.nb_pdt]
+
+        nb_planes = max(self.nplan, 1)
+
+        # Global numbers of the nodes of the first plane of each subdomain (KNOLG, 1-based)
+        knolg = [np.asarray(partition.ipobo[:partition.NPOIN2D[0]], dtype=np.intp) - 1 for partition in self.partitions]
+        self.npoin2d = int(max(numbers.max() for numbers in knolg)) + 1
+        self.npoin = self.npoin2d * nb_planes
+
+        # Global numbers of all the nodes of each subdomain (planes are stored one after the other)
+        numbers = [(np.arange(nb_planes)[:, np.newaxis] * self.npoin2d + local).ravel() for local in knolg]
+
+        # Nodes owned by each subdomain (nodes on interfaces are owned by the first subdomain which has them)
+        owner = np.full(self.npoin, -1, dtype=np.intp)
+        for id in range(len(self.partitions) - 1, -1, -1):
+            owner[numbers[id]] = id
+
+        if np.any(owner < 0):
+            raise ValueError(f"Partitions do not cover the global mesh ({np.count_nonzero(owner < 0)} missing nodes)")
+
+        #: list[np.ndarray]: Local indices of the nodes owned by each subdomain
+        self.local_ids = [np.flatnonzero(owner[global_ids] == id) for id, global_ids in enumerate(numbers)]
+        #: list[np.ndarray]: Global indices of the nodes owned by each subdomain
+        self.global_ids = [global_ids[local] for global_ids, local in zip(numbers, self.local_ids)]
+        #: np.ndarray: Local index of each node of the global mesh in its subdomain
+        self.local_index = np.empty(self.npoin, dtype=np.intp)
+        for local, global_ids in zip(self.local_ids, self.global_ids):
+            self.local_index[global_ids] = local
+        self.owner = owner
+
+        # Global mesh
+        self.x = np.empty(self.npoin, dtype=first.x.dtype)
+        self.y = np.empty(self.npoin, dtype=first.y.dtype)
+        for partition, local, global_ids in zip(self.partitions, self.local_ids, self.global_ids):
+            self.x[global_ids] = partition.x[local]
+            self.y[global_ids] = partition.y[local]
+
+        self.ikle2d = np.concatenate([local[partition.IKLE2D[0]] for partition, local in zip(self.partitions, knolg)])
+        self.ikle = np.concatenate([global_ids[partition.ikle.reshape((partition.nelem, -1)) - 1].ravel() + 1
+                                    for partition, global_ids in zip(self.partitions, numbers)])
+
+        log.debug(f"Opened {len(paths)} partitions ({self.npoin} nodes, {len(self.ikle2d)} triangles)")
+
+    def get_2d(self) -> None:
+        """2D mesh information is computed when the partitions are opened, nothing to do."""
+
+        pass
+
+    def get_dtype(self) -> np.dtype:
+        """
+        Get the numpy dtype of the values (native byte order).
+
+        Returns:
+            np.dtype: dtype of the values
+        """
+
+        return self.dtype
+
+    def get_position(self, time2read: float, is_time: bool = True) -> int:
+        """
+        Get the position of the given time.
+
+        Args:
+            time2read (float): time (or position of time if is_time is False)
+            is_time (bool, optional): indicate if time2read is a time. Defaults to True.
+
+        Returns:
+            int: position of the time
+        """
+
+        return get_time_position(self.temps, time2read) if is_time else int(time2read)
+
+    def pos_var(self, list_var: list[Union[int, str]]) -> list[int]:
+        """
+        Get the position of the given variables (positions or names).
+
+        Args:
+            list_var (list[Union[int, str]]): variables
+
+        Returns:
+            list[int]: positions of the variables
+        """
+
+        list_var = list(list_var)
+        self.partitions[0].pos_var(list_var)
+        return list_var
+
+    def refresh(self) -> int:
+        """
+        Look for new time points written in all the partition files (running simulation).
+
+        Returns:
+            int: number of new time points (available in all the partitions)
+        """
+
+        for partition in self.partitions:
+            partition.refresh()
+
+        nb_pdt = min(partition.nb_pdt for partition in self.partitions)
+        nb_new = nb_pdt - self.nb_pdt
+        if nb_new > 0:
+            self.nb_pdt = nb_pdt
+            self.temps = np.asarray(self.partitions[0].temps)[:nb_pdt]
+
+        return max(nb_new, 0)
+
+    def read_frames(self, list_time: list[float], list_var: Union[list[Union[int, str]], None] = None,
+                    is_time: bool = False, out: Union[np.ndarray, None] = None,
+                    max_workers: Union[int, None] = None) -> np.ndarray:
+        """
+        Read several time points of all the subdomains in parallel, in the global numbering. Thread-safe.
+
+        Args:
+            list_time (list[float]): positions of the times to read (or times if is_time is True)
+            list_var (Union[list[Union[int, str]], None], optional): variables. Defaults to None (all variables).
+            is_time (bool, optional): indicate if list_time contains times. Defaults to False.
+            out (Union[np.ndarray, None], optional): output buffer of shape (n_time, n_var, npoin).\
+                Defaults to None (allocate a new array).
+            max_workers (Union[int, None], optional): use 1 to read the subdomains in the calling thread.\
+                Defaults to None (thread pool of the reader).
+
+        Raises:
+            ValueError: if the shape of the output buffer is wrong
+
+        Returns:
+            np.ndarray: values, shape is (n_time, n_var, npoin) (out if given)
+        """
+
+        list_var = list(range(self.nbvar)) if list_var is None else self.pos_var(list_var)
+        time_points = [self.get_position(time2read, is_time=is_time) for time2read in list_time]
+
+        shape = (len(time_points), len(list_var), self.npoin)
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        elif out.shape != shape:
+            raise ValueError(f"The shape of the output buffer is {out.shape}, expected {shape}")
+
+        variables = np.asarray(list_var, dtype=np.intp)
+
+        def read_partition(id: int) -> None:
+            partition = self.partitions[id]
+            gather = np.ix_(variables, self.local_ids[id])
+            for pos, time_point in enumerate(time_points):
+                out[pos][:, self.global_ids[id]] = partition.read_view(time_point, is_time=False)[gather]
+
+        if max_workers is not None and max_workers <= 1:
+            for id in range(len(self.partitions)):
+                read_partition(id)
+        else:
+            # Note: consume results to raise exceptions from the workers
+            list(self.executor.map(read_partition, range(len(self.partitions))))
+
+        return out
+
+    def read_vars(self, time2read: float, list_var: list[Union[int, str]], is_time: bool = True) -> list[np.ndarray]:
+        """
+        Read the given variables of a specific time.
+
+        Args:
+            time2read (float): time (or position of time if is_time is False)
+            list_var (list[Union[int, str]]): variables to read (positions or names)
+            is_time (bool, optional): indicate if time2read is a time. Defaults to True.
+
+        Returns:
+            list[np.ndarray]: one array per variable
+        """
+
+        return list(self.read_frames([time2read], list_var, is_time=is_time)[0])
+
+    def read(self, time2read: float, var2del: list[int] = [], is_time: bool = True, **_kwargs) -> np.ndarray:
+        """
+        Read all the variables of a specific time.
+
+        Args:
+            time2read (float): time (or position of time if is_time is False)
+            var2del (list[int], optional): variables to ignore. Defaults to [].
+            is_time (bool, optional): indicate if time2read is a time. Defaults to True.
+
+        Returns:
+            np.ndarray: values, shape is (nbvar, npoin)
+        """
+
+        data = self.read_frames([time2read], is_time=is_time)[0]
+        return np.delete(data, var2del, 0) if len(var2del) > 0 else data
+
+    def read_time_series(self, liste_nodes: list[int], list_var: Union[list[Union[int, str]], None] = None,
+                         start: int = 0, end: Union[int, None] = None,
+                         out: Union[np.ndarray, None] = None) -> np.ndarray:
+        """
+        Read the history of a set of nodes (global numbering) for a set of variables, subdomains are read in parallel.
+
+        Args:
+            liste_nodes (list[int]): node positions
+            list_var (Union[list[Union[int, str]], None], optional): variables. Defaults to None (all variables).
+            start (int, optional): position of the first time to read. Defaults to 0.
+            end (Union[int, None], optional): position of the last time to read (excluded). Defaults to None.
+            out (Union[np.ndarray, None], optional): output buffer of shape (n_time, n_var, n_nodes).\
+                Defaults to None (allocate a new array).
+
+        Raises:
+            ValueError: if the shape of the output buffer is wrong
+
+        Returns:
+            np.ndarray: values, shape is (n_time, n_var, n_nodes) (out if given)
+        """
+
+        list_var = list(range(self.nbvar)) if list_var is None else self.pos_var(list_var)
+        nodes = np.asarray(liste_nodes, dtype=np.intp)
+        end = self.nb_pdt if end is None else end
+
+        shape = (end - start, len(list_var), len(nodes))
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        elif out.shape != shape:
+            raise ValueError(f"The shape of the output buffer is {out.shape}, expected {shape}")
+
+        owners = self.owner[nodes]
+
+        def read_partition(id: int) -> None:
+            positions = np.flatnonzero(owners == id)
+            if len(positions) > 0:
+                local = self.local_index[nodes[positions]]
+                out[:, :, positions] = self.partitions[id].read_time_series(local, list_var, start=start, end=end)
+
+        list(self.executor.map(read_partition, range(len(self.partitions))))
+
+        return out
+
+    def get_frames_view(self) -> PartitionedFrames:
+        """
+        Get lazy access to all the frames of the result.
+
+        Returns:
+            PartitionedFrames: frames, shape is (nb_pdt, nbvar, npoin)
+        """
+
+        return PartitionedFrames(self)
+
+    def close(self) -> None:
+        """Close all the partition files."""
+
+        self.executor.shutdown(wait=True)
+        for partition in self.partitions:
+            partition.close()
@@ -27,7 +27,37 @@ import copy
 import mmap
 import matplotlib.tri as tri
 import datetime
+import time
 import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def get_time_position(temps, time2read):
+    """
+    Find the position of a time in the list of times of a result (binary search, O(log(nb_pdt))).
+    Times are compared with a tolerance: the list of times can be reconstructed from the time step (see get_temps)
+    and slightly differ from the (single precision) values written in the file.
+    Args:
+        temps: list of times (increasing)
+        time2read: time to find
+
+    Returns:
+        int: position of the time
+    """
+    temps = np.asarray(temps)
+    pos = int(np.searchsorted(temps, time2read))
+    candidates = [candidate for candidate in (pos - 1, pos) if 0 <= candidate < len(temps)]
+    if candidates:
+        nearest = min(candidates, key=lambda candidate: abs(temps[candidate] - time2read))
+        if np.isclose(temps[nearest], time2read):
+            return nearest
+
+    # Times are not sorted (should not happen): linear search
+    positions = np.flatnonzero(np.isclose(temps, time2read))
+    if len(positions) == 0:
+        raise IndexError('time {} not found in the result'.format(time2read))
+    return int(positions[0])
 
 
 class Serafin:
@@ -209,11 +239,14 @@ class Serafin:
     def __init__(self, name='', mode='rb',
                  read_time=False,
                  pdt_variable=False,
-                 paral=False):
+                 paral=False,
+                 use_memmap=False):
 
         self.name = [name]
         self.mode = mode
         self.paral = paral
+        # Keep a memory map over the whole file and read frames as views (no parsing, no copies)
+        self.use_memmap = use_memmap
         self.ncsize = 1
         self.size_num_paral = 5  # Size of the number in the name of the file partitionned
         self.nplan = 1
@@ -295,6 +328,9 @@ class Serafin:
         # Variable for MemoryError
         self.chunck_size = 1
 
+        # Time spent (in seconds) in each part of read_header (summed over all partitions)
+        self.timings = {}
+
         # Variable for Probe
         self.elem2probe = None
         self.file2probe = None
@@ -351,7 +387,8 @@ class Serafin:
             ifloat = 8
             cfloat = 'd'
             self.precision = ['d', 8]
-        r = unpack('{}{}{}'.format(self.endian, nfloat, cfloat), f.read(ifloat * nfloat))
+        # Skip values, only the record markers are needed to check the precision
+        f.seek(ifloat * nfloat, 1)
         chk = unpack('{}i'.format(self.endian), f.read(4))
         if l != chk:
             print('... Cannot read ' + str(nfloat) + ' floats from your binary file')
@@ -405,6 +442,42 @@ class Serafin:
         self.NEIGHBORS = [None for num_proc in range(self.ncsize)]
         self.is_get_2d = [False for num_proc in range(self.ncsize)]
         self.M = [None for num_proc in range(self.ncsize)]
+        self.MEMMAP = [None for num_proc in range(self.ncsize)]
+        # Byte offset of each time step in the file (see read_header), a frame is read without searching for it
+        self.OFFSET_PDT = [None for num_proc in range(self.ncsize)]
+        # Protect shared file handles and memory maps when the file is read by several threads
+        self.LOCK = [threading.Lock() for num_proc in range(self.ncsize)]
+
+    def read_array(self, f, dtype, count):
+        """
+        Read an array of values with a bulk decoding. The array is converted to the native byte order in place.
+        Args:
+            f: file
+            dtype: type of the values ('i', 'f' or 'd')
+            count: number of values to read
+
+        Returns:
+            np.ndarray: array of values (native byte order)
+        """
+        array = np.fromfile(f, dtype=np.dtype('{}{}'.format(self.endian, dtype)), count=count)
+        if not array.dtype.isnative:
+            array.byteswap(inplace=True)
+            array = array.view(array.dtype.newbyteorder('='))
+        return array
+
+    def add_timing(self, name, start):
+        """
+        Add the time elapsed since start to the timing breakdown
+        Args:
+            name: name of the step
+            start: start time of the step
+
+        Returns:
+            float: current time
+        """
+        now = time.perf_counter()
+        self.timings[name] = self.timings.get(name, 0.) + now - start
+        return now
 
     def read_header(self, num_file=0):
         """
@@ -415,6 +488,7 @@ class Serafin:
         Returns:
 
         """
+        start = time.perf_counter()
         self.FILE[num_file].seek(0, 0)
         # Recuperation du nombre d'octet dans le fichier
         self.taille_fichier = os.path.getsize(self.name[num_file])
@@ -493,29 +567,31 @@ class Serafin:
         self.var_i = unpack('{}i'.format(self.endian), self.FILE[num_file].read(4))[0]
         self.FILE[num_file].read(4)  # fin encadrement
 
-        # On ignore ikle
+        start = self.add_timing('header', start)
+
+        # Lecture de ikle (int32)
         num = unpack('{}i'.format(self.endian), self.FILE[num_file].read(4))[0]  # debut encadrement
-        nb_val = '{}{}i'.format(self.endian, self.NELEM[num_file] * self.ndp)
-        self.IKLE[num_file] = np.array(unpack(nb_val, self.FILE[num_file].read(4 * self.NELEM[num_file] * self.ndp)))
+        self.IKLE[num_file] = self.read_array(self.FILE[num_file], 'i', self.NELEM[num_file] * self.ndp)
         self.FILE[num_file].read(4)  # fin encadrement
+        start = self.add_timing('ikle', start)
 
-        # On ignore IPOBO
+        # Lecture de IPOBO (int32)
         num = unpack('{}i'.format(self.endian), self.FILE[num_file].read(4))[0]  # debut encadrement
-        nb_val = '{}{}i'.format(self.endian, self.NPOIN[num_file])
-        self.IPOBO[num_file] = np.array(unpack(nb_val, self.FILE[num_file].read(4 * self.NPOIN[num_file])))
+        self.IPOBO[num_file] = self.read_array(self.FILE[num_file], 'i', self.NPOIN[num_file])
         self.FILE[num_file].read(4)  # fin encadrement
+        start = self.add_timing('ipobo', start)
 
-        # On ignore x
+        # Lecture de x (float32 or float64)
         self.getFloatTypeFromFloat(self.FILE[num_file], self.NPOIN[num_file])
         num = unpack('{}i'.format(self.endian), self.FILE[num_file].read(4))[0]  # debut encadrement
-        nb_val = '{}{}{}'.format(self.endian, self.NPOIN[num_file], self.precision[0])
-        self.X[num_file] = np.array(unpack(nb_val, self.FILE[num_file].read(self.precision[1] * self.NPOIN[num_file])))
+        self.X[num_file] = self.read_array(self.FILE[num_file], self.precision[0], self.NPOIN[num_file])
         self.FILE[num_file].read(4)  # fin encadrement
 
-        # On ignore y
+        # Lecture de y (float32 or float64)
         num = unpack('{}i'.format(self.endian), self.FILE[num_file].read(4))[0]  # debut encadrement
-        self.Y[num_file] = np.array(unpack(nb_val, self.FILE[num_file].read(self.precision[1] * self.NPOIN[num_file])))
+        self.Y[num_file] = self.read_array(self.FILE[num_file], self.precision[0], self.NPOIN[num_file])
         self.FILE[num_file].read(4)  # fin encadrement
+        self.add_timing('coordinates', start)
 
         # Recherche de la taille de l'entete
         self.entete_[num_file] = (80 + 8) + (8 + 8) + (self.nbvar * (8 + 32)) + (40 + 8) + (self.date[-1] * ((6 * 4) + 8)) + \
@@ -531,6 +607,7 @@ class Serafin:
 
         # Recuperation du nombre de PDT
         self.nb_pdt = int((self.taille_fichier - self.entete_[num_file]) / self.taille_pdt_[num_file])
+        self.OFFSET_PDT[num_file] = self.get_offsets(self.nb_pdt, num_file)
         if num_file == 0:
             self.x = self.X[num_file]
             self.y = self.Y[num_file]
@@ -575,32 +652,95 @@ class Serafin:
         """
         val = '{}{}'.format(self.endian, self.precision[0])
         if not pdt_variable:
+            t = []
+            for num_time in range(min(self.nb_pdt, 3)):
+                pos_time = self.get_offset(num_time, num_file) + 4
+                t.append(unpack(val, self.pread(pos_time, self.precision[1], num_file))[0])
             if self.nb_pdt < 3:
-                for num_time in range(self.nb_pdt):
-                    self.FILE[num_file].seek(self.entete_[num_file] + 4 + num_time * self.taille_pdt_[num_file], 0)
-                    self.temps.append(unpack(val, self.FILE[num_file].read(self.precision[1]))[0])
+                self.temps = np.array(t, dtype=np.float64)
             else:
-                t = []
-                for num_time in range(3):
-                    self.FILE[num_file].seek(self.entete_[num_file] + 4 + num_time * self.taille_pdt_[num_file], 0)
-                    t.append(unpack(val, self.FILE[num_file].read(self.precision[1]))[0])
-                self.temps.append(t[0])
-                for i in range(self.nb_pdt - 1):
-                    self.temps.append(t[1] + i * (t[2] - t[1]))
+                # Reconstruct the list of times from the time step (vectorized)
+                self.temps = np.concatenate(([t[0]], t[1] + np.arange(self.nb_pdt - 1) * (t[2] - t[1])))
+        elif self.nb_pdt == 0:
+            self.temps = np.array([], dtype=np.float64)
         else:
             # Recuperation de tous les pas de temps
-            self.temps = []
-            # On se positionne a la fin de l'entete du fichier (debut des PDT)
-            self.FILE[num_file].seek(self.entete_[num_file], 0)
-            for num_time in range(self.nb_pdt):
-                self.FILE[num_file].seek(4, 1)
-                self.temps.append(unpack(val, self.FILE[num_file].read(self.precision[1]))[0])
-                self.FILE[num_file].seek(self.taille_pdt_[num_file] - (self.precision[1] + 4), 1)
-        self.temps = np.array(self.temps)
+            # Gather the time of each time step with a strided view on the memory map (one pass, no seek nor parsing)
+            temps = np.ndarray(shape=(self.nb_pdt,), dtype=self.get_dtype(), buffer=self.get_memmap(num_file),
+                               offset=int(self.entete_[num_file]) + 4, strides=(int(self.taille_pdt_[num_file]),))
+            self.temps = np.array(temps, dtype=np.float64)
 
         # On se positionne a la fin de l'entete du fichier (debut des PDT)
         self.FILE[num_file].seek(self.entete_[num_file], 0)
 
+    def get_offsets(self, nb_pdt, num_file=0):
+        """
+        Compute the byte offset of each time step (the size of a time step is constant, even with a variable time step)
+        Args:
+            nb_pdt: number of time steps
+            num_file:
+
+        Returns:
+            np.ndarray: offsets (int64)
+        """
+        return int(self.entete_[num_file]) + np.arange(nb_pdt, dtype=np.int64) * int(self.taille_pdt_[num_file])
+
+    def get_offset(self, pos_time, num_file=0):
+        """
+        Get the byte offset of a time step (beginning of the record of its time) from the table of offsets
+        Args:
+            pos_time: position of the time
+            num_file:
+
+        Returns:
+            int: offset
+        """
+        return int(self.OFFSET_PDT[num_file][pos_time])
+
+    def get_position(self, time2read, is_time=True):
+        """
+        Get the position of a time. Read frames by position (is_time=False) to skip the search.
+        Args:
+            time2read: time (or position of time if is_time is False)
+            is_time:
+
+        Returns:
+            int: position of the time
+        """
+        return get_time_position(self.temps, time2read) if is_time else int(time2read)
+
+    def refresh(self, num_file=0):
+        """
+        Look for new time steps written at the end of the file since it has been opened (file of a running simulation).
+        Only the size of the file is checked: the header and the mesh are not read again. New time steps which are
+        completely written are appended to the list of times (their time values are read from the file).
+        Args:
+            num_file:
+
+        Returns:
+            int: number of new time steps
+        """
+        taille_fichier = os.path.getsize(self.name[num_file])
+        nb_pdt = int((taille_fichier - self.entete_[num_file]) / self.taille_pdt_[num_file])
+        if nb_pdt <= self.nb_pdt:
+            return 0
+
+        self.OFFSET_PDT[num_file] = self.get_offsets(nb_pdt, num_file)
+        val = '{}{}'.format(self.endian, self.precision[0])
+        temps = []
+        for num_time in range(self.nb_pdt, nb_pdt):
+            pos_time = self.get_offset(num_time, num_file) + 4
+            temps.append(unpack(val, self.pread(pos_time, self.precision[1], num_file))[0])
+
+        nb_new = nb_pdt - self.nb_pdt
+        self.temps = np.concatenate((np.asarray(self.temps, dtype=np.float64), temps))
+        self.nb_pdt = nb_pdt
+        self.taille_fichier = taille_fichier
+        # The memory map has the size of the file when it has been created, map the file again on next read
+        self.MEMMAP[num_file] = None
+
+        return nb_new
+
     def get_info(self, num_file=0):
         """
         Get some info of the mesh:
@@ -750,38 +890,277 @@ class Serafin:
         :param specific_frame:
         :return:
         """
-        taille_pdt = np.array([self.taille_pdt_[num_file]], dtype=np.int64)
-        if is_time:
-            pos_time2read = np.where(self.temps == time2read)[0][0]
-        else:
-            pos_time2read = time2read
+        if self.use_memmap and not specific_frame:
+            var = self.read_view(time2read, is_time=is_time, num_file=num_file)
+            if len(var2del) > 0:
+                var = np.delete(var, var2del, 0)
+            return var
+
+        pos_time2read = self.get_position(time2read, is_time=is_time)
 
         if not specific_frame:
-            pos_actu = np.int64(self.entete_[num_file] + pos_time2read * taille_pdt[0] + (8 + self.precision[1]))
-            self.FILE[num_file].seek(pos_actu, 0)
+            # Positional read of the whole frame (thread-safe, the shared file handle is not moved)
+            dtype = self.get_dtype()
+            pos_actu = self.get_offset(pos_time2read, num_file) + (8 + self.precision[1])
+            frame = self.pread(pos_actu, self.nbvar * (8 + self.NPOIN[num_file] * self.precision[1]), num_file)
+            var = np.ndarray(shape=(self.nbvar, self.NPOIN[num_file]), dtype=dtype, buffer=frame, offset=4,
+                             strides=(8 + self.NPOIN[num_file] * self.precision[1], self.precision[1]))
+            var = np.array(var, dtype=dtype.newbyteorder('='))
             self.pos_pdt = pos_time2read + 1
+            if len(var2del) > 0:
+                var = np.delete(var, var2del, 0)
+            return var
         else:
-            self.FILE[num_file].seek(self.entete_[num_file], 0)
-            for num_time in range(pos_time2read):
-                self.FILE[num_file].seek(self.taille_pdt_[num_file], 1)
-                self.pos_pdt = num_time + 1
-            self.FILE[num_file].seek(8 + self.precision[1], 1)
+            self.FILE[num_file].seek(self.get_offset(pos_time2read, num_file) + 8 + self.precision[1], 0)
+            self.pos_pdt = pos_time2read
 
-        nb_val = '{}{}{}'.format(self.endian, self.NPOIN[num_file], self.precision[0])
+        # Decode blocks in bulk, keeping the precision of the file (float32 results are not promoted to float64)
+        dtype = self.get_dtype()
         var = []
         for pos_var in range(self.nbvar):
             self.FILE[num_file].read(4)
-            var.append(unpack(nb_val, self.FILE[num_file].read(self.precision[1] * self.NPOIN[num_file])))
+            var.append(np.frombuffer(self.FILE[num_file].read(self.precision[1] * self.NPOIN[num_file]), dtype=dtype))
             self.FILE[num_file].read(4)
 
-        var = np.array(var)
+        var = np.array(var, dtype=dtype.newbyteorder('='))
 
         if len(var2del) > 0:
             var = np.delete(var, var2del, 0)
 
         return var
 
-    # @profile
+    def get_memmap(self, num_file=0):
+        """
+        Get the memory map of the whole file (created on first call)
+        Args:
+            num_file:
+
+        Returns:
+            np.memmap: read-only memory map of the file (raw bytes)
+        """
+        if self.MEMMAP[num_file] is None:
+            with self.LOCK[num_file]:
+                if self.MEMMAP[num_file] is None:
+                    self.MEMMAP[num_file] = np.memmap(self.name[num_file], dtype=np.uint8, mode='r')
+        return self.MEMMAP[num_file]
+
+    def pread(self, offset, size, num_file=0):
+        """
+        Read bytes at the given position of the file without moving the shared file handle.
+        Uses positional reads (os.pread) when available, so several threads can read the file at the same time.
+        Args:
+            offset: position of the first byte to read
+            size: number of bytes to read
+            num_file:
+
+        Returns:
+            bytes: data
+        """
+        if not hasattr(os, 'pread'):
+            with self.LOCK[num_file]:
+                self.FILE[num_file].seek(offset, 0)
+                return self.FILE[num_file].read(size)
+
+        fileno = self.FILE[num_file].fileno()
+        data = os.pread(fileno, size, offset)
+        # Positional reads can return less data than requested
+        while 0 < len(data) < size:
+            chunk = os.pread(fileno, size - len(data), offset + len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    def get_dtype(self):
+        """
+        Get the numpy dtype of the values stored in the file (byte order and precision)
+        Returns:
+            np.dtype: dtype of the values
+        """
+        return np.dtype('{}{}'.format(self.endian, self.precision[0]))
+
+    def read_view(self, time2read, is_time=True, num_file=0):
+        """
+        Get all the variables of a specific time as a view on the memory map of the file.
+        Nothing is parsed nor copied: the array directly points to the variable blocks of the frame
+        (the 4 bytes record markers around each block are skipped using strides).
+        Args:
+            time2read: time (or position of time if is_time is False) to read
+            is_time:
+            num_file:
+
+        Returns:
+            np.ndarray: read-only array of shape (nbvar, npoin)
+        """
+        pos_time2read = self.get_position(time2read, is_time=is_time)
+
+        precision = self.precision[1]
+        # Position of the first value of the first variable of the frame
+        pos_actu = self.get_offset(pos_time2read, num_file) + (8 + precision) + 4
+        self.pos_pdt = pos_time2read + 1
+
+        return np.ndarray(shape=(self.nbvar, self.NPOIN[num_file]),
+                          dtype=self.get_dtype(),
+                          buffer=self.get_memmap(num_file),
+                          offset=pos_actu,
+                          strides=(8 + self.NPOIN[num_file] * precision, precision))
+
+    def read_vars(self, time2read, list_var, is_time=True, num_file=0):
+        """
+        Read only the given variables of a specific time (or a specific position of time).
+        Seek directly to the record of each variable instead of reading the whole frame.
+        Args:
+            time2read: time (or position of time if is_time is False) to read
+            list_var: list of variables to read (positions or names, see pos_var)
+            is_time:
+            num_file:
+
+        Returns:
+            list: one np.ndarray per variable (views on the file if use_memmap is True)
+        """
+        list_var = list(list_var)
+        self.pos_var(list_var)
+
+        if self.use_memmap:
+            frame = self.read_view(time2read, is_time=is_time, num_file=num_file)
+            return [frame[pos_var] for pos_var in list_var]
+
+        pos_time2read = self.get_position(time2read, is_time=is_time)
+
+        precision = self.precision[1]
+        dtype = self.get_dtype()
+        pos_frame = self.get_offset(pos_time2read, num_file) + (8 + precision)
+        var = []
+        for pos_var in list_var:
+            data = self.pread(pos_frame + pos_var * (8 + self.NPOIN[num_file] * precision) + 4,
+                              precision * self.NPOIN[num_file], num_file)
+            var.append(np.frombuffer(data, dtype=dtype))
+        self.pos_pdt = pos_time2read + 1
+
+        return var
+
+    def read_frames(self, list_time, list_var=None, is_time=False, out=None, max_workers=None, num_file=0):
+        """
+        Read several frames concurrently (thread pool, positional reads). Thread-safe.
+        I/O of the different frames overlap (the GIL is released during the reads), which helps on fast storage.
+        Args:
+            list_time: positions of the times to read (or times if is_time is True)
+            list_var: list of variables to read (positions or names, see pos_var). Defaults to all variables.
+            is_time:
+            out: output buffer of shape (n_time, n_var, npoin). Defaults to None (allocate a new array).
+            max_workers: number of threads. Defaults to the number of frames (8 at most).
+            num_file:
+
+        Returns:
+            np.ndarray: array of shape (n_time, n_var, npoin) (native byte order, out if given)
+        """
+        if list_var is None:
+            list_var = list(range(self.nbvar))
+        else:
+            list_var = list(list_var)
+            self.pos_var(list_var)
+
+        list_time = [self.get_position(time2read, is_time=is_time) for time2read in list_time]
+
+        precision = self.precision[1]
+        dtype = self.get_dtype()
+        shape = (len(list_time), len(list_var), self.NPOIN[num_file])
+        if out is None:
+            out = np.empty(shape, dtype=dtype.newbyteorder('='))
+        elif out.shape != shape:
+            raise ValueError('the shape of the output buffer is {}, expected {}'.format(out.shape, shape))
+
+        block = 8 + self.NPOIN[num_file] * precision
+        # Read contiguous variables in one call
+        first, last = min(list_var, default=0), max(list_var, default=-1)
+
+        def read_frame(pos):
+            pos_frame = self.get_offset(list_time[pos], num_file) + (8 + precision)
+            data = self.pread(pos_frame + first * block, (last - first + 1) * block, num_file)
+            frame = np.ndarray(shape=(last - first + 1, self.NPOIN[num_file]), dtype=dtype, buffer=data, offset=4,
+                               strides=(block, precision))
+            for pos_out, pos_var in enumerate(list_var):
+                out[pos, pos_out] = frame[pos_var - first]
+
+        if max_workers is None:
+            max_workers = min(8, len(list_time))
+
+        if max_workers <= 1:
+            for pos in range(len(list_time)):
+                read_frame(pos)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Note: consume results to raise exceptions from the workers
+                list(executor.map(read_frame, range(len(list_time))))
+
+        return out
+
+    def get_frames_view(self, num_file=0):
+        """
+        Get all the frames of the file as a single strided view on the memory map of the file.
+        Args:
+            num_file:
+
+        Returns:
+            np.ndarray: read-only array of shape (nb_pdt, nbvar, npoin)
+        """
+        precision = self.precision[1]
+        return np.ndarray(shape=(self.nb_pdt, self.nbvar, self.NPOIN[num_file]),
+                          dtype=self.get_dtype(),
+                          buffer=self.get_memmap(num_file),
+                          offset=int(self.entete_[num_file]) + (8 + precision) + 4,
+                          strides=(int(self.taille_pdt_[num_file]), 8 + self.NPOIN[num_file] * precision, precision))
+
+    def read_time_series(self, liste_nodes, list_var=None, start=0, end=None, out=None, num_file=0):
+        """
+        Read the history of a set of nodes for a set of variables in one pass.
+        Only the requested values are gathered from the memory map (fancy indexing on the view of each frame), frames
+        are never decoded. Give a preallocated output buffer to read several batches of time steps without allocating
+        new arrays (e.g. probes on a large number of nodes over a large number of time steps).
+        Args:
+            liste_nodes: list of node positions
+            list_var: list of variables to read (positions or names, see pos_var). Defaults to all variables.
+            start: position of the first time to read
+            end: position of the last time to read (excluded). Defaults to the number of times.
+            out: output buffer of shape (n_time, n_var, n_nodes). Defaults to None (allocate a new array).
+            num_file:
+
+        Returns:
+            np.ndarray: array of shape (n_time, n_var, n_nodes) (native byte order, out if given)
+        """
+        if list_var is None:
+            list_var = list(range(self.nbvar))
+        else:
+            list_var = list(list_var)
+            self.pos_var(list_var)
+
+        if end is None:
+            end = self.nb_pdt
+
+        nodes = np.asarray(liste_nodes, dtype=np.intp)
+        shape = (end - start, len(list_var), len(nodes))
+        frames = self.get_frames_view(num_file=num_file)
+
+        if out is None:
+            out = np.empty(shape, dtype=frames.dtype.newbyteorder('='))
+        elif out.shape != shape:
+            raise ValueError('the shape of the output buffer is {}, expected {}'.format(out.shape, shape))
+
+        # Check node positions once, the gathers below do not check bounds
+        if len(nodes) > 0 and (nodes.min() < 0 or nodes.max() >= self.NPOIN[num_file]):
+            raise IndexError('node positions out of range (0, {})'.format(self.NPOIN[num_file]))
+
+        # np.take can only write in a buffer of the type of the file (byte order excepted)
+        use_take = out.dtype.newbyteorder('=') == frames.dtype.newbyteorder('=')
+        for pos_time, frame in enumerate(frames[start:end]):
+            for pos, pos_var in enumerate(list_var):
+                if use_take:
+                    np.take(frame[pos_var], nodes, out=out[pos_time, pos], mode='clip')
+                else:
+                    out[pos_time, pos] = frame[pos_var][nodes]
+
+        return out
+
     def all_time_node(self, pos_node, time2read=None, var2keep=None, num_file=0):
         """
         read all time for a specific node
@@ -791,38 +1170,17 @@ class Serafin:
         :return:
         """
         if time2read is not None:
-            pos_time2read = np.where(self.temps == time2read)[0][0]
+            start = self.get_position(time2read)
+            end = start + 1
         else:
-            pos_time2read = range(0, len(self.temps))
+            start, end = 0, self.nb_pdt
 
-        if var2keep is not None:
-            None
-        else:
+        if var2keep is None:
             var2keep = range(self.nbvar)
+        var2keep = list(var2keep)
 
-        precision = self.precision[1]
-        octet_pos_node = [(8 + precision * self.NPOIN[num_file]) * num_var + 4 + pos_node * precision for num_var, name in
-                          enumerate(self.nomvar)]
-        taille_pdt_var = self.taille_pdt_[num_file] - (8 + precision)
-
-        res = np.zeros((self.nbvar, len(self.temps)))
-        nb_val = '{}{}{}'.format(self.endian, 1, self.precision[0])
-
-        # Close the file and reopen it. It avoid doing a seek on a large file
-        for num_time, val in enumerate(pos_time2read):
-            pos_actu = np.int64(self.entete_[num_file] + val * self.taille_pdt_[num_file] + (8 + precision))
-            offset = np.int64(np.int64(pos_actu / mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY)
-            remain_octet = np.int64(np.int64(pos_actu) - np.int64(offset))
-            mm = mmap.mmap(self.FILE[num_file].fileno(),
-                           remain_octet + taille_pdt_var,
-                           access=mmap.ACCESS_READ,
-                           offset=offset)
-            for num_var, name_var in enumerate(self.nomvar):
-                if num_var in var2keep:
-                    first = remain_octet + octet_pos_node[num_var]
-                    last = first + precision
-                    res[num_var, num_time] = unpack(nb_val, mm[first:last])[0]
-        mm.close()
+        res = np.zeros((self.nbvar, self.nb_pdt))
+        res[var2keep, start:end] = self.read_time_series([pos_node], var2keep, start, end, num_file=num_file)[:, :, 0].T
 
         return res
 
@@ -831,77 +1189,26 @@ class Serafin:
                    num_file=0):
         """
         Read just a list of node instead of reading all node of the result
+        The values are gathered from the memory map of the file with fancy indexing (see read_time_series).
         :param time2read:
-        :param liste_nodes:
-        :param var2del:
+        :param liste_nodes: positions of the nodes in bytes in a variable block (position of the node * precision)
+        :param var2del: unused, all the variables are read (probe indexes the output by position of variable)
         :param is_time:
-        :return:
+        :return: np.ndarray of shape (nbvar, n_nodes)
         """
-        taille_pdt = np.array([self.taille_pdt_[num_file]], dtype=np.int64)
-        if continuous_time:
-            if self.first_continuous:
+        if continuous_time and not self.first_continuous:
+            self.pos_pdt += valech
+            pos_time2read = self.pos_pdt
+        else:
+            pos_time2read = self.get_position(time2read, is_time=is_time)
+            if continuous_time:
                 self.first_continuous = False
-                if is_time:
-                    pos_time2read = np.where(self.temps == time2read)[0][0]
-                else:
-                    pos_time2read = time2read
-                pos_actu = self.entete_[num_file] + taille_pdt[0] * pos_time2read + 8 + self.precision[1]
                 self.pos_pdt = pos_time2read
-            else:
-                self.pos_pdt += valech
-                pos_actu = self.entete_[num_file] + taille_pdt[0] * self.pos_pdt + 8 + self.precision[1]
-        else:
-            if is_time:
-                pos_time2read = np.where(self.temps == time2read)[0][0]
-            else:
-                pos_time2read = time2read
 
-            try:
-                pos_actu = np.int64(self.entete_[num_file] + pos_time2read * taille_pdt[0] + (8 + self.precision[1]))
-                self.FILE[num_file].seek(np.int64(self.entete_[num_file] + pos_actu), 0)
-            except Warning:
-                print('WARNING IN READ_NODES')
-                self.FILE[num_file].seek(self.entete_[num_file], 0)
-                for num_time in range(pos_time2read):
-                    self.FILE[num_file].seek(taille_pdt[0], 1)
-                    self.pos_pdt = num_time + 1
-                self.FILE[num_file].seek(8 + self.precision[1], 1)
-            except IOError:
-                print('ERROR IN READ_NODES')
-                if self.first_error:
-                    self.first_error = False
-                    self.FILE[num_file].seek(self.entete_[num_file], 0)
-                    for num_time in range(pos_time2read):
-                        self.FILE[num_file].seek(taille_pdt[0], 1)
-                        self.pos_pdt = num_time + 1
-                else:
-                    self.FILE[num_file].seek(taille_pdt[0], 1)
-                self.FILE[num_file].seek(8 + self.precision[1], 1)
-                # pos_actu = self.entete + taille_pdt[0] * pos_time2read + 8 + self.precision[1]
-        offset = int(pos_actu / mmap.ALLOCATIONGRANULARITY) * \
-            mmap.ALLOCATIONGRANULARITY
-        remain_octet = pos_actu - offset
-        mm = mmap.mmap(self.FILE[num_file].fileno(),
-                       remain_octet + (self.precision[1] * self.NPOIN[num_file] + 8) * self.nbvar,
-                       access=mmap.ACCESS_READ,
-                       offset=offset)
-
-        nb_val = '{}{}{}'.format(self.endian, len(liste_nodes), self.precision[0])
-        var = []
-        for pos_var in range(self.nbvar):
-            first = remain_octet + (4 + self.precision[1] * self.NPOIN[num_file] + 4) * pos_var + 4
-            last = remain_octet + (4 + self.precision[1] * self.NPOIN[num_file] + 4) * (pos_var + 1) - 4
-            val_tempo = mm[first:last]
-            val = b''.join(val_tempo[i:i + self.precision[1]] for i in liste_nodes)
-            var.append(unpack(nb_val, val))
-
-        mm.close()
+        nodes = np.asarray(liste_nodes, dtype=np.intp) // self.precision[1]
+        var = self.read_time_series(nodes, start=pos_time2read, end=pos_time2read + 1, num_file=num_file)[0]
 
-        var = np.array(var)
-
-        # Force the garbage collector
-        gc.collect()
-        return var
+        return var.astype(np.float64)
 
     def write_frame(self, time, var, num_file=0):
         """
@@ -1424,6 +1731,8 @@ class Serafin:
         """
         for file in self.FILE:
             file.close()
+        # Release memory maps (they are closed once all the views on them are released)
+        self.MEMMAP = [None for num_proc in range(self.ncsize)]
 
     def memory_error(self, dimension1_var, dimension2, var):
         try:
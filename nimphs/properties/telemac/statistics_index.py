@@ -0,0 +1,294 @@
+# <pep8 compliant>
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import queue
+import hashlib
+import numpy as np
+from pathlib import Path
+from typing import Generator, Union
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.utils.histogram import StreamingHistogram
+from nimphs.properties.telemac.columnar_file import TelemacColumnarFile
+from nimphs.properties.telemac.partitioned_serafin import PartitionedSerafin
+
+
+def get_statistics_cache_dir() -> Path:
+    """
+    Get the directory where statistics indices are stored when they can not be written next to their file.
+
+    Returns:
+        Path: path to the directory
+    """
+
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "nimphs" / "statistics"
+
+
+class TelemacStatisticsIndex():
+    """
+    Value ranges of each variable at each time point (and on each plane for 3D simulations) of a TELEMAC file.
+
+    The index also holds a histogram of all the values of each variable, to get value ranges without outliers
+    (percentiles). Value ranges and histograms are computed in a single pass over the file, then saved in an index
+    file (next to the TELEMAC file, or in a cache directory). The index is identified by the path, size and
+    modification time of the file.
+    """
+
+    #: int: Version of the index file format
+    VERSION: int = 2
+    #: str: Suffix of index files saved next to TELEMAC files
+    SUFFIX: str = ".nimphs.npz"
+    #: int: Maximum size of data read at once during the computation (in bytes)
+    CHUNK_SIZE: int = 64 * 1024 * 1024
+    #: float: Maximum time spent waiting for the workers before reporting progress (in seconds)
+    POLL_INTERVAL: float = 0.05
+
+    #: Path: Path to the TELEMAC file
+    file_path: Path = None
+    #: list[str]: Names of the variables (as stored in the file)
+    names: list[str] = []
+    #: np.ndarray: Minimum values, shape is (nb_time_points, nb_vars, nb_planes)
+    minima: np.ndarray = None
+    #: np.ndarray: Maximum values, shape is (nb_time_points, nb_vars, nb_planes)
+    maxima: np.ndarray = None
+    #: list[StreamingHistogram]: Histogram of all the values of each variable
+    histograms: list[StreamingHistogram] = []
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            file_path (str): path to the TELEMAC file
+        """
+
+        self.file_path = Path(file_path).resolve()
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove value ranges (they have to be computed or loaded again)."""
+
+        self.names = []
+        self.minima = None
+        self.maxima = None
+        self.histograms = []
+
+    def is_ok(self) -> bool:
+        """
+        Indicate if value ranges are available (computed over at least one time point).
+
+        Returns:
+            bool: state
+        """
+
+        return self.minima is not None and self.maxima is not None and len(self.minima) > 0
+
+    def get_signature(self) -> dict:
+        """
+        Get information which identifies the current state of the TELEMAC file.
+
+        Returns:
+            dict: path, size and modification time of the file
+        """
+
+        stat = self.file_path.stat()
+        return {"path": str(self.file_path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def get_index_paths(self) -> list[Path]:
+        """
+        Get possible paths of the index file (by order of preference).
+
+        Returns:
+            list[Path]: next to the TELEMAC file, in the cache directory
+        """
+
+        digest = hashlib.sha1(str(self.file_path).encode("utf-8")).hexdigest()
+        return [self.file_path.with_name(self.file_path.name + self.SUFFIX),
+                get_statistics_cache_dir() / f"{digest}.npz"]
+
+    def load(self) -> bool:
+        """
+        Load value ranges from an existing index file. Outdated index files are ignored.
+
+        Returns:
+            bool: ``True`` if value ranges have been loaded
+        """
+
+        signature = self.get_signature()
+
+        for path in self.get_index_paths():
+            if not path.exists():
+                continue
+
+            try:
+                with np.load(path, allow_pickle=False) as index:
+                    outdated = [int(index["version"]) != self.VERSION, str(index["path"]) != signature["path"],
+                                int(index["size"]) != signature["size"], int(index["mtime"]) != signature["mtime"]]
+                    if any(outdated):
+                        log.debug(f"Outdated statistics index {path}")
+                        continue
+
+                    self.names = [str(name) for name in index["names"]]
+                    self.minima = index["minima"]
+                    self.maxima = index["maxima"]
+                    self.histograms = [StreamingHistogram(counts, offsets, zeros) for counts, offsets, zeros in
+                                       zip(index["counts"], index["offsets"], index["zeros"])]
+            except Exception:
+                log.warning(f"Unable to read statistics index {path}", exc_info=1)
+                continue
+
+            log.debug(f"Loaded statistics index {path}")
+            return True
+
+        return False
+
+    def save(self) -> Union[Path, None]:
+        """
+        Save value ranges in an index file (next to the TELEMAC file if possible, otherwise in the cache directory).
+
+        Returns:
+            Union[Path, None]: path to the index file, ``None`` if it could not be saved
+        """
+
+        if not self.is_ok():
+            return None
+
+        signature = self.get_signature()
+
+        for path in self.get_index_paths():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "wb") as file:
+                    np.savez(file, version=self.VERSION, path=signature["path"], size=signature["size"],
+                             mtime=signature["mtime"], names=np.array(self.names), minima=self.minima,
+                             maxima=self.maxima, counts=np.array([hist.counts for hist in self.histograms]),
+                             offsets=np.array([hist.offsets for hist in self.histograms]),
+                             zeros=np.array([hist.zeros for hist in self.histograms]))
+            except OSError:
+                log.debug(f"Unable to write statistics index {path}", exc_info=1)
+                continue
+
+            log.debug(f"Saved statistics index {path}")
+            return path
+
+        log.warning(f"Unable to save statistics index of {self.file_path}")
+        return None
+
+    def compute(self, file: Union[Serafin, PartitionedSerafin, TelemacColumnarFile],
+                max_workers: Union[int, None] = None) -> Generator[int, None, None]:
+        """
+        Compute value ranges and histograms in a single pass over the file.
+
+        Chunks of time points are read and reduced by a pool of worker threads (reads and numpy reductions release the
+        GIL, so chunks are processed in parallel without copying data between processes). Each worker reuses its own
+        buffer. This is a generator which yields the number of processed time points: it does not wait for the
+        workers for more than POLL_INTERVAL seconds, so it can be stepped from a modal operator without freezing the
+        interface. Closing the generator cancels pending chunks.
+
+        Args:
+            file (Union[Serafin, PartitionedSerafin, TelemacColumnarFile]): TELEMAC file (with the 2D mesh information)
+            max_workers (Union[int, None], optional): number of threads. Defaults to None (number of CPUs, 8 at most).
+
+        Yields:
+            int: number of processed time points
+        """
+
+        nb_planes = max(file.nplan, 1)
+        names = [name[:16].rstrip() for name in file.nomvar]
+
+        # Header only (e.g. simulation which has just started): nothing to read
+        if file.nb_pdt == 0:
+            self.names = names
+            self.minima = np.empty((0, len(names), nb_planes), dtype=np.float64)
+            self.maxima = np.empty((0, len(names), nb_planes), dtype=np.float64)
+            self.histograms = [StreamingHistogram() for _name in names]
+            return
+
+        frames = file.get_frames_view()
+        nb_time_points, nb_vars, nb_vertices = frames.shape
+
+        minima = np.empty((nb_time_points, nb_vars, nb_planes), dtype=np.float64)
+        maxima = np.empty((nb_time_points, nb_vars, nb_planes), dtype=np.float64)
+        histograms = [StreamingHistogram() for _i in range(nb_vars)]
+
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+        max_workers = max(1, min(max_workers, nb_time_points))
+
+        # Share the memory budget between workers
+        frame_size = max(1, nb_vars * nb_vertices * frames.dtype.itemsize)
+        chunk = max(1, min(nb_time_points, self.CHUNK_SIZE // (frame_size * max_workers)))
+        buffers = queue.SimpleQueue()
+        for _i in range(max_workers):
+            buffers.put(np.empty((chunk, nb_vars, nb_vertices), dtype=frames.dtype.newbyteorder('=')))
+
+        def reduce(start: int, end: int) -> int:
+            buffer = buffers.get()
+            try:
+                # Note: the worker reads its frames itself (no nested thread pools)
+                data = file.read_frames(range(start, end), out=buffer[:end - start], max_workers=1)
+                data = data.reshape((end - start, nb_vars, nb_planes, nb_vertices // nb_planes))
+                np.min(data, axis=3, out=minima[start:end])
+                np.max(data, axis=3, out=maxima[start:end])
+                for var, histogram in enumerate(histograms):
+                    histogram.update(data[:, var])
+            finally:
+                buffers.put(buffer)
+            return end - start
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = {executor.submit(reduce, start, min(start + chunk, nb_time_points))
+                       for start in range(0, nb_time_points, chunk)}
+            processed = 0
+            while pending:
+                done, pending = wait(pending, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                # Note: raise exceptions from the workers
+                processed += sum(future.result() for future in done)
+                yield processed
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.names = names
+        self.minima = minima
+        self.maxima = maxima
+        self.histograms = histograms
+
+    def get_range(self, name: str, time_points: Union[slice, list[int]] = slice(None),
+                  plane: Union[int, None] = None) -> tuple[float, float]:
+        """
+        Get the value range of the given variable over the given time points.
+
+        Args:
+            name (str): name of the variable
+            time_points (Union[slice, list[int]], optional): time points. Defaults to slice(None) (all).
+            plane (Union[int, None], optional): id of the plane. Defaults to None (all planes).
+
+        Returns:
+            tuple[float, float]: minimum, maximum
+        """
+
+        id = self.names.index(name)
+        planes = slice(None) if plane is None else plane
+
+        return float(np.min(self.minima[time_points, id, planes])), float(np.max(self.maxima[time_points, id, planes]))
+
+    def get_percentile_range(self, name: str, percentile: float) -> tuple[float, float]:
+        """
+        Get the value range of the given variable over all the time points, without outliers.
+
+        Args:
+            name (str): name of the variable
+            percentile (float): values below this percentile or above (100 - percentile) are ignored
+
+        Returns:
+            tuple[float, float]: minimum, maximum
+        """
+
+        mini, maxi = self.get_range(name)
+        # Note: values of the histogram are approximated, keep them in the actual value range
+        low, high = self.histograms[self.names.index(name)].get_range(percentile)
+        return float(np.clip(low, mini, maxi)), float(np.clip(high, mini, maxi))
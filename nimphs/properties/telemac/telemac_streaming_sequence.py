@@ -1,4 +1,6 @@
 # <pep8 compliant>
+from bpy.props import BoolProperty
+
 from nimphs.properties.shared.module_streaming_sequence_settings import NIMPHS_ModuleStreamingSequenceSettings
 
 
@@ -7,3 +9,10 @@ class NIMPHS_TelemacStreamingSequenceProperty(NIMPHS_ModuleStreamingSequenceSett
 
     register_cls = True
     is_custom_base_cls = False
+
+    #: bpy.props.BoolProperty: Extend the sequence when new time points are written in the file (running simulation).
+    follow: BoolProperty(
+        name="Follow",  # noqa: F821
+        description="Follow the file of a running simulation: extend the sequence when new time points are written",
+        default=False,
+    )
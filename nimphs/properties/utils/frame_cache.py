@@ -0,0 +1,147 @@
+# <pep8 compliant>
+import logging
+log = logging.getLogger(__name__)
+
+import threading
+import numpy as np
+from typing import Hashable, Union
+from collections import OrderedDict
+
+
+class FrameCache():
+    """Size-bounded cache of decoded frames with 'least recently used' eviction (thread-safe)."""
+
+    #: int: Maximum size of cached data (in bytes). 0 disables the cache.
+    max_size: int = 0
+    #: int: Current size of cached data (in bytes)
+    size: int = 0
+    #: int: Number of successful lookups
+    hits: int = 0
+    #: int: Number of failed lookups
+    misses: int = 0
+
+    def __init__(self, max_size: int = 0) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            max_size (int, optional): maximum size of cached data (in bytes). Defaults to 0 (disabled).
+        """
+
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached frames.
+
+        Returns:
+            int: number of entries
+        """
+
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the given key is cached (does not count as a lookup).
+
+        Args:
+            key (Hashable): key of the frame
+
+        Returns:
+            bool: ``True`` if cached
+        """
+
+        return key in self._entries
+
+    def __str__(self) -> str:
+        """
+        Output this data structure as a string.
+
+        Returns:
+            str: output string
+        """
+
+        return (f"{len(self._entries)} frames, {self.size / (1024 * 1024):.1f}/{self.max_size / (1024 * 1024):.1f} MB, "
+                f"hits: {self.hits}, misses: {self.misses}")
+
+    def is_enabled(self) -> bool:
+        """
+        Indicate if the cache is enabled.
+
+        Returns:
+            bool: state
+        """
+
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Union[np.ndarray, None]:
+        """
+        Get a cached frame and mark it as the most recently used one.
+
+        Args:
+            key (Hashable): key of the frame
+
+        Returns:
+            Union[np.ndarray, None]: data, ``None`` if not cached
+        """
+
+        with self._lock:
+            data = self._entries.get(key, None)
+            if data is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: Hashable, data: np.ndarray) -> None:
+        """
+        Add a frame to the cache, evict the least recently used frames to stay under the size limit.
+
+        Frames larger than the limit are not cached.
+
+        Args:
+            key (Hashable): key of the frame
+            data (np.ndarray): data
+        """
+
+        if data.nbytes > self.max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.nbytes
+
+            while self._entries and self.size + data.nbytes > self.max_size:
+                _key, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.nbytes
+
+            self._entries[key] = data
+            self.size += data.nbytes
+
+    def hit_rate(self) -> float:
+        """
+        Get the ratio of successful lookups.
+
+        Returns:
+            float: hit rate (between 0 and 1)
+        """
+
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def clear(self) -> None:
+        """Remove all cached frames and reset counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,157 @@
+# <pep8 compliant>
+import logging
+log = logging.getLogger(__name__)
+
+import threading
+import numpy as np
+from typing import Union
+
+
+class StreamingHistogram():
+    """
+    Histogram of all the values of a variable, updated one chunk of values at a time (constant memory, thread-safe).
+
+    Bins are log-scaled on each side of zero: a value is approximated with a constant relative error (see
+    RELATIVE_ACCURACY), whatever the range of the values. Each side has a fixed number of bins: when values span too
+    many orders of magnitude, the bins of the smallest magnitudes are merged. Values closer to zero than MIN_VALUE
+    are counted as zeros.
+    """
+
+    #: int: Number of bins on each side of zero
+    NB_BINS: int = 2048
+    #: float: Relative accuracy of the approximated values
+    RELATIVE_ACCURACY: float = 0.005
+    #: float: Smallest magnitude of non-zero values
+    MIN_VALUE: float = 1e-30
+
+    #: np.ndarray: Number of values in each bin, shape is (2, NB_BINS) (negative values, positive values)
+    counts: np.ndarray = None
+    #: np.ndarray: Key of the first bin of each side, shape is (2,)
+    offsets: np.ndarray = None
+    #: int: Number of zeros
+    zeros: int = 0
+
+    def __init__(self, counts: Union[np.ndarray, None] = None, offsets: Union[np.ndarray, None] = None,
+                 zeros: int = 0) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            counts (Union[np.ndarray, None], optional): number of values in each bin (restore a saved histogram).\
+                Defaults to None.
+            offsets (Union[np.ndarray, None], optional): key of the first bin of each side. Defaults to None.
+            zeros (int, optional): number of zeros. Defaults to 0.
+        """
+
+        shape = (2, self.NB_BINS)
+        self.counts = np.zeros(shape, dtype=np.int64) if counts is None else np.array(counts, dtype=np.int64)
+        self.offsets = np.zeros(2, dtype=np.int64) if offsets is None else np.array(offsets, dtype=np.int64)
+        self.zeros = int(zeros)
+        self.gamma = (1 + self.RELATIVE_ACCURACY) / (1 - self.RELATIVE_ACCURACY)
+        self._log_gamma = np.log(self.gamma)
+        self._lock = threading.Lock()
+
+    def total(self) -> int:
+        """
+        Get the number of values added to the histogram.
+
+        Returns:
+            int: number of values
+        """
+
+        return int(self.counts.sum()) + self.zeros
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add values to the histogram (non-finite values are ignored).
+
+        Args:
+            values (np.ndarray): values
+        """
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+        magnitudes = np.abs(values)
+        valid = np.isfinite(magnitudes) & (magnitudes >= self.MIN_VALUE)
+        nb_zeros = int(np.count_nonzero(magnitudes < self.MIN_VALUE))
+
+        keys = np.ceil(np.log(magnitudes[valid]) / self._log_gamma).astype(np.int64)
+        negative = values[valid] < 0
+
+        with self._lock:
+            self.zeros += nb_zeros
+            for side, side_keys in enumerate([keys[negative], keys[~negative]]):
+                if side_keys.size > 0:
+                    self.add(side, side_keys)
+
+    def add(self, side: int, keys: np.ndarray) -> None:
+        """
+        Count keys in the bins of the given side, shift the bins if needed (keep the largest magnitudes).
+
+        Args:
+            side (int): 0 for negative values, 1 for positive values
+            keys (np.ndarray): keys of the values (log of their magnitude)
+        """
+
+        counts, offset = self.counts[side], int(self.offsets[side])
+        mini, maxi = int(keys.min()), int(keys.max())
+
+        used = np.flatnonzero(counts)
+        if len(used) == 0:
+            new_offset = max(maxi - self.NB_BINS + 1, mini)
+        else:
+            top = max(offset + int(used[-1]), maxi)
+            new_offset = max(top - self.NB_BINS + 1, min(offset, mini))
+
+        if new_offset != offset:
+            # Move bins, merge the ones which fall below the first bin into it
+            ids = np.clip(used + (offset - new_offset), 0, self.NB_BINS - 1)
+            shifted = np.zeros(self.NB_BINS, dtype=np.int64)
+            np.add.at(shifted, ids, counts[used])
+            counts[:] = shifted
+            self.offsets[side] = offset = new_offset
+
+        ids = np.clip(keys - offset, 0, self.NB_BINS - 1)
+        counts += np.bincount(ids, minlength=self.NB_BINS)
+
+    def get_percentiles(self, percentiles: list[float]) -> list[float]:
+        """
+        Get approximated percentiles of the values.
+
+        Args:
+            percentiles (list[float]): percentiles (in [0, 100])
+
+        Returns:
+            list[float]: values, ``np.nan`` if the histogram is empty
+        """
+
+        total = self.total()
+        if total == 0:
+            return [np.nan for _percentile in percentiles]
+
+        # Values of the bins in increasing order: negative values, zeros, positive values
+        keys = np.arange(self.NB_BINS)
+        negative = -2 * self.gamma ** (keys[::-1] + self.offsets[0]) / (self.gamma + 1)
+        positive = 2 * self.gamma ** (keys + self.offsets[1]) / (self.gamma + 1)
+        values = np.concatenate((negative, [0.0], positive))
+        cumulative = np.cumsum(np.concatenate((self.counts[0][::-1], [self.zeros], self.counts[1])))
+
+        output = []
+        for percentile in percentiles:
+            rank = (total - 1) * min(max(percentile, 0.0), 100.0) / 100.0
+            output.append(float(values[np.searchsorted(cumulative, rank, side='right')]))
+
+        return output
+
+    def get_range(self, percentile: float) -> tuple[float, float]:
+        """
+        Get the robust value range which excludes values below the given percentile and above (100 - percentile).
+
+        Args:
+            percentile (float): percentile
+
+        Returns:
+            tuple[float, float]: minimum, maximum
+        """
+
+        mini, maxi = self.get_percentiles([percentile, 100.0 - percentile])
+        return mini, maxi
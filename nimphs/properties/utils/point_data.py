@@ -23,6 +23,10 @@ class ValueRange():
     minC: float = np.nan
     #: float: custom maximum
     maxC: float = np.nan
+    #: float: percentile minimum (global range without outliers)
+    minP: float = np.nan
+    #: float: percentile maximum (global range without outliers)
+    maxP: float = np.nan
 
     def __init__(self, json_string: str = "") -> None:
         """
@@ -38,6 +42,8 @@ class ValueRange():
         self.maxG = np.nan
         self.minC = np.nan
         self.maxC = np.nan
+        self.minP = np.nan
+        self.maxP = np.nan
 
         # Read data from given json string
         if json_string:
@@ -49,13 +55,15 @@ class ValueRange():
             self.maxG = data.get("maxG", np.nan)
             self.minC = data.get("minC", np.nan)
             self.maxC = data.get("maxC", np.nan)
+            self.minP = data.get("minP", np.nan)
+            self.maxP = data.get("maxP", np.nan)
 
     def get(self, type: str) -> list[float]:
         """
         Return a value range in a list of floats.
 
         Args:
-            type (str): type of the value range, enum in ['LOCAL', 'GLOBAL', 'CUSTOM']
+            type (str): type of the value range, enum in ['LOCAL', 'GLOBAL', 'CUSTOM', 'PERCENTILE']
 
         Returns:
             list[float]: value range
@@ -67,6 +75,8 @@ class ValueRange():
             return [self.minG, self.maxG]
         if type == 'CUSTOM':
             return [self.minC, self.maxC]
+        if type == 'PERCENTILE':
+            return [self.minP, self.maxP]
 
     def dumps(self) -> str:
         """
@@ -82,7 +92,9 @@ class ValueRange():
             "minG": self.minG,
             "maxG": self.maxG,
             "minC": self.minC,
-            "maxC": self.maxC
+            "maxC": self.maxC,
+            "minP": self.minP,
+            "maxP": self.maxP
         }
 
         return json.dumps(data)
@@ -99,6 +111,7 @@ class ValueRange():
         output += f"minL: {self.minL}, maxL: {self.maxL}"
         output += f", minG: {self.minG}, maxG: {self.maxG}"
         output += f", minC: {self.minC}, maxC: {self.maxC}"
+        output += f", minP: {self.minP}, maxP: {self.maxP}"
         output += "}"
         return output
 
@@ -0,0 +1,22 @@
+# <pep8 compliant>
+import bpy
+
+from typing import Any
+
+
+def get_preference(name: str, default: Any) -> Any:
+    """
+    Get the value of a setting from the add-on preferences.
+
+    Args:
+        name (str): name of the setting
+        default (Any): value returned when add-on preferences are not available (e.g. in background mode)
+
+    Returns:
+        Any: value of the setting
+    """
+
+    try:
+        return getattr(bpy.context.preferences.addons["nimphs"].preferences.settings, name)
+    except (AttributeError, KeyError):
+        return default
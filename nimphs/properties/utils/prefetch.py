@@ -0,0 +1,174 @@
+# <pep8 compliant>
+import logging
+log = logging.getLogger(__name__)
+
+import time
+from collections import deque
+from typing import Any, Callable, Hashable, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class Prefetcher():
+    """Read time points ahead of the playback on background threads."""
+
+    #: Hashable: Settings used to read data (a new prefetcher is needed when they change)
+    signature: Hashable = None
+    #: int: Number of requested time points which were ready
+    hits: int = 0
+    #: int: Number of requested time points which were not ready
+    misses: int = 0
+    #: int: Last updated frame
+    last_frame: Union[int, None] = None
+
+    def __init__(self, load: Callable[[int], Any], signature: Hashable = None, max_workers: int = 1) -> None:
+        """
+        Init method of the class.
+
+        Args:
+            load (Callable[[int], Any]): function which reads the given time point (called on worker threads)
+            signature (Hashable, optional): settings used to read data. Defaults to None.
+            max_workers (int, optional): number of worker threads. Defaults to 1.
+        """
+
+        self.signature = signature
+        self.hits = 0
+        self.misses = 0
+        self.last_frame = None
+
+        self._load = load
+        self._futures: dict[int, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nimphs_prefetch")
+        self._frame_times = deque(maxlen=30)
+        self._served = deque(maxlen=4)
+
+    def __str__(self) -> str:
+        """
+        Output this data structure as a string.
+
+        Returns:
+            str: output string
+        """
+
+        return f"hits: {self.hits}, misses: {self.misses}, {len(self._futures)} pending, {self.fps():.1f} FPS"
+
+    def tick(self, frame: int) -> int:
+        """
+        Register a frame update (used to compute FPS and the playback direction).
+
+        Args:
+            frame (int): current frame
+
+        Returns:
+            int: playback direction (``1`` forwards, ``-1`` backwards)
+        """
+
+        direction = -1 if self.last_frame is not None and frame < self.last_frame else 1
+        if frame != self.last_frame:
+            self._frame_times.append(time.perf_counter())
+        self.last_frame = frame
+
+        return direction
+
+    def get(self, time_point: int) -> Any:
+        """
+        Get data of a prefetched time point. Wait for it if it is still being read.
+
+        Requesting a time point removes it from the prefetcher (data are kept by the caller or the frame cache).
+
+        Args:
+            time_point (int): time point
+
+        Returns:
+            Any: output of the load function, ``None`` if this time point has not been prefetched
+        """
+
+        future = self._futures.pop(time_point, None)
+        if future is None or future.cancelled():
+            # Interpolated frames request the same time points several times, only count the first request
+            if time_point not in self._served:
+                self.misses += 1
+                self._served.append(time_point)
+            return None
+
+        self._served.append(time_point)
+
+        if future.done():
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        try:
+            return future.result()
+        except Exception:
+            log.error(f"Error while prefetching time point {time_point}", exc_info=1)
+            return None
+
+    def schedule(self, time_points: list[int]) -> None:
+        """
+        Request the given time points. Pending requests for other time points are cancelled.
+
+        Args:
+            time_points (list[int]): time points to read, by order of priority
+        """
+
+        for time_point in list(self._futures.keys()):
+            if time_point not in time_points:
+                self._futures.pop(time_point).cancel()
+
+        for time_point in time_points:
+            if time_point not in self._futures:
+                self._futures[time_point] = self._executor.submit(self._load, time_point)
+
+    def hit_rate(self) -> float:
+        """
+        Get the ratio of requested time points which were ready.
+
+        Returns:
+            float: hit rate (between 0 and 1)
+        """
+
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def fps(self) -> float:
+        """
+        Get the achieved frame rate over the last frame updates.
+
+        Returns:
+            float: frames per second
+        """
+
+        if len(self._frame_times) < 2:
+            return 0.0
+
+        elapsed = self._frame_times[-1] - self._frame_times[0]
+        return (len(self._frame_times) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def shutdown(self) -> None:
+        """Cancel pending requests and stop worker threads."""
+
+        for future in self._futures.values():
+            future.cancel()
+
+        self._futures.clear()
+        self._executor.shutdown(wait=False)
+
+
+def get_next_time_points(time_point: int, direction: int, size: int, limit: int) -> list[int]:
+    """
+    Get the next time points to prefetch in the playback direction.
+
+    Playback loops: time points wrap around at the ends of the sequence.
+
+    Args:
+        time_point (int): current time point
+        direction (int): playback direction (``1`` forwards, ``-1`` backwards)
+        size (int): number of time points to prefetch
+        limit (int): number of readable time points
+
+    Returns:
+        list[int]: time points
+    """
+
+    # Never request the current time point again
+    return [(time_point + direction * i) % limit for i in range(1, min(size, limit - 1) + 1)]
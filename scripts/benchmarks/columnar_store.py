@@ -0,0 +1,111 @@
+# <pep8 compliant>
+"""
+Compare reading a TELEMAC file from the Serafin file (memory-mapped) and from a columnar store.
+
+Run with Blender's Python (NIMPHS modules import bpy) from the root of the repository:
+
+    blender -b --python scripts/benchmarks/columnar_store.py -- [path/to/file.slf]
+
+Defaults to the bundled ``data/telemac_3d/telemac_3d.slf`` sample. The file is copied in a temporary directory, so the
+columnar stores are not written next to the original file.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import numpy as np
+from pathlib import Path
+
+sys.path.append(os.path.abspath("."))  # Make nimphs modules available in this file
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.shared.columnar_store import get_store_path
+from nimphs.properties.telemac.columnar_file import TelemacColumnarFile, convert_telemac_file
+
+REPEAT = 5
+
+
+def timeit(function) -> float:
+    """
+    Get the best execution time of the given function.
+
+    Args:
+        function (Callable): function to run
+
+    Returns:
+        float: time (in seconds)
+    """
+
+    best = np.inf
+    for _i in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def run(file) -> dict[str, float]:
+    """
+    Run access patterns on the given reader.
+
+    Args:
+        file (Union[Serafin, TelemacColumnarFile]): reader
+
+    Returns:
+        dict[str, float]: time of each access pattern
+    """
+
+    npoin2d = file.npoin // max(file.nplan, 1)
+    nodes = np.linspace(0, file.npoin - 1, 100).astype(int)
+    plane = np.arange(npoin2d) + npoin2d * (max(file.nplan, 1) // 2)
+
+    return {
+        "all frames": timeit(lambda: [np.array(file.read_vars(t, list(range(file.nbvar)), is_time=False))
+                                      for t in range(file.nb_pdt)]),
+        "one variable": timeit(lambda: [np.array(file.read_vars(t, [1], is_time=False)[0])
+                                        for t in range(file.nb_pdt)]),
+        "time series (100 nodes)": timeit(lambda: file.read_time_series(nodes, [1])),
+        "one plane": timeit(lambda: file.read_time_series(plane, [1])),
+    }
+
+
+def main():
+    """Run the benchmark."""
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    source = Path(argv[0] if argv else "data/telemac_3d/telemac_3d.slf").resolve()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / source.name
+        shutil.copy(source, path)
+
+        serafin = Serafin(str(path), read_time=True, use_memmap=True)
+        serafin.get_2d()
+        results = {"serafin (memmap)": run(serafin)}
+        sizes = {"serafin (memmap)": path.stat().st_size}
+
+        for compress in [False, True]:
+            name = "columnar (compressed)" if compress else "columnar"
+
+            start = time.perf_counter()
+            for _processed in convert_telemac_file(str(path), compress=compress):
+                pass
+            print(f"Convert to {name}: " + "{:.4f}".format(time.perf_counter() - start) + "s")
+
+            results[name] = run(TelemacColumnarFile.open(str(path)))
+            sizes[name] = sum(file.stat().st_size for file in get_store_path(str(path)).rglob("*") if file.is_file())
+
+        serafin.close()
+
+    print(f"\n{source.name} ({serafin.nb_pdt} time points, {serafin.nbvar} variables, {serafin.npoin} vertices)")
+    patterns = list(next(iter(results.values())).keys())
+    print(f"{'backend':<24}{'size (MB)':>12}" + "".join(f"{pattern:>26}" for pattern in patterns))
+    for backend, timings in results.items():
+        columns = "".join(f"{timings[pattern] * 1000:>24.2f}ms" for pattern in patterns)
+        print(f"{backend:<24}{sizes[backend] / 1e6:>12.2f}{columns}")
+
+
+if __name__ == "__main__":
+    main()
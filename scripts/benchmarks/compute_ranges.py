@@ -0,0 +1,92 @@
+# <pep8 compliant>
+"""
+Compare the computation of value ranges of a TELEMAC file, one time point at a time and with the statistics index.
+
+The first method decodes each time point and reduces each variable separately (as done for each timer event by the
+'compute ranges' operator before the statistics index). The second one runs the statistics index computation, with
+one worker thread and with one worker thread per CPU.
+
+Run with Blender's Python (NIMPHS modules import bpy) from the root of the repository:
+
+    blender -b --python scripts/benchmarks/compute_ranges.py -- [path/to/file.slf]
+
+Defaults to the bundled ``data/telemac_3d/telemac_3d.slf`` sample. Use a large file to get meaningful results.
+"""
+
+import os
+import sys
+import time
+import numpy as np
+from pathlib import Path
+from typing import Union
+
+sys.path.append(os.path.abspath("."))  # Make nimphs modules available in this file
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.telemac.statistics_index import TelemacStatisticsIndex
+
+
+def run_time_points(file: Serafin) -> float:
+    """
+    Compute value ranges one time point at a time.
+
+    Args:
+        file (Serafin): TELEMAC file
+
+    Returns:
+        float: time (s)
+    """
+
+    start = time.perf_counter()
+    minima, maxima = [], []
+    for time_point in range(file.nb_pdt):
+        data = np.array(file.read(time_point, is_time=False))
+        minima.append([float(np.min(values)) for values in data])
+        maxima.append([float(np.max(values)) for values in data])
+
+    return time.perf_counter() - start
+
+
+def run_index(file: Serafin, path: Path, max_workers: Union[int, None]) -> float:
+    """
+    Compute value ranges with the statistics index.
+
+    Args:
+        file (Serafin): TELEMAC file
+        path (Path): path to the TELEMAC file
+        max_workers (Union[int, None]): number of threads
+
+    Returns:
+        float: time (s)
+    """
+
+    start = time.perf_counter()
+    for _processed in TelemacStatisticsIndex(str(path)).compute(file, max_workers=max_workers):
+        pass
+
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    path = Path(argv[0] if argv else "data/telemac_3d/telemac_3d.slf").resolve()
+
+    file = Serafin(str(path), read_time=True, use_memmap=True)
+    file.get_2d()
+
+    results = {
+        "one time point at a time": run_time_points(file),
+        "statistics index (1 thread)": run_index(file, path, 1),
+        f"statistics index ({min(8, os.cpu_count() or 1)} threads)": run_index(file, path, None),
+    }
+    file.close()
+
+    print(f"\n{path.name} ({path.stat().st_size / 1e6:.2f} MB, {file.nb_pdt} time points)")
+    reference = results["one time point at a time"]
+    for method, elapsed in results.items():
+        print(f"{method:<36}{elapsed:>10.4f}s{reference / elapsed:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# <pep8 compliant>
+"""
+Compare the construction of Blender meshes with ``from_pydata`` and with the bulk mesh builder (``ObjectUtils.build``).
+
+Faces are generated from the surface of an OpenFOAM case (or a synthetic quad surface of about 1M faces), then each
+method builds the mesh from the triangulated surface and from the polygonal surface (faces as a list of arrays, as
+returned by ``OpenfoamMeshUtils.faces``).
+
+Run with Blender's Python (NIMPHS modules import bpy) from the root of the repository:
+
+    blender -b --python scripts/benchmarks/mesh_builder.py -- [path/to/case.foam]
+"""
+
+import os
+import sys
+import bpy
+import time
+import numpy as np
+import pyvista
+from pyvista import PolyData
+from typing import Union
+
+sys.path.append(os.path.abspath("."))  # Make nimphs modules available in this file
+from nimphs.operators.utils.mesh import OpenfoamMeshUtils
+from nimphs.operators.utils.object import ObjectUtils
+
+#: int: Resolution of the synthetic surface (number of quads along each axis)
+RESOLUTION = 1000
+
+
+def get_surface(file_path: Union[str, None]) -> PolyData:
+    """
+    Get the surface used to generate faces.
+
+    Args:
+        file_path (Union[str, None]): path to an OpenFOAM case. Defaults to a synthetic quad surface.
+
+    Returns:
+        PolyData: surface
+    """
+
+    if file_path is None:
+        return pyvista.Plane(i_resolution=RESOLUTION, j_resolution=RESOLUTION)
+
+    reader = pyvista.POpenFOAMReader(file_path)
+    return reader.read()["internalMesh"].extract_surface(nonlinear_subdivision=0)
+
+
+def run(vertices: np.ndarray, faces: Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]],
+        bulk: bool) -> tuple[float, int]:
+    """
+    Build a mesh from the given vertices and faces.
+
+    Args:
+        vertices (np.ndarray): vertices
+        faces (Union[np.ndarray, list[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]): faces
+        bulk (bool): use the bulk mesh builder, otherwise use ``from_pydata``
+
+    Returns:
+        tuple[float, int]: time (s), number of loops of the generated mesh
+    """
+
+    bmesh = bpy.data.meshes.new("NIMPHS_benchmark_mesh")
+
+    start = time.perf_counter()
+    if bulk:
+        ObjectUtils.build(bmesh, vertices, faces)
+    else:
+        bmesh.from_pydata(vertices, [], faces)
+    elapsed = time.perf_counter() - start
+
+    nb_loops = len(bmesh.loops)
+    bpy.data.meshes.remove(bmesh)
+
+    return elapsed, nb_loops
+
+
+def main():
+    """Run the benchmark."""
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    surface = get_surface(argv[0] if argv else None)
+
+    triangulated = surface.triangulate()
+    polygons = OpenfoamMeshUtils.faces(surface)
+    indices, starts, totals = ObjectUtils.polygons(polygons)
+    cases = {
+        "triangles": (np.array(triangulated.points), OpenfoamMeshUtils.faces(triangulated)),
+        "polygons": (np.array(surface.points), polygons),
+    }
+
+    print(f"\n{'faces':<12}{'number':>12}{'from_pydata (s)':>20}{'bulk (s)':>12}{'speedup':>12}")
+    for name, (vertices, faces) in cases.items():
+        # Note: from_pydata does not read flat arrays, give it one array per polygon
+        if isinstance(faces, tuple):
+            reference, nb_loops = run(vertices, np.split(indices, starts[1:]), bulk=False)
+        else:
+            reference, nb_loops = run(vertices, faces, bulk=False)
+
+        elapsed, nb_bulk_loops = run(vertices, faces, bulk=True)
+        assert nb_loops == nb_bulk_loops, "Meshes are different"
+
+        nb_faces = len(ObjectUtils.polygons(faces)[1])
+        print(f"{name:<12}{nb_faces:>12}{reference:>20.3f}{elapsed:>12.3f}{reference / elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# <pep8 compliant>
+"""
+Measure the update time of an OpenFOAM streaming sequence, for each time point of a case.
+
+Each update reads the time point, generates the surface and its faces and rebuilds the mesh (as done by
+``OpenfoamObjectUtils.update_streaming_sequence``). It is compared with the previous data path, which read each time
+point twice (raw mesh and generated mesh) and deep copied the raw mesh before extracting the surface.
+
+Run with Blender's Python (NIMPHS modules import bpy) from the root of the repository:
+
+    blender -b --python scripts/benchmarks/openfoam_streaming.py -- [path/to/case.foam]
+
+Defaults to the OpenFOAM sample used by the tests (``data/openfoam/sample/foam.foam``, see ``scripts/run_tests.py``).
+"""
+
+import os
+import sys
+import bpy
+import time
+import numpy as np
+from copy import deepcopy
+from pathlib import Path
+
+sys.path.append(os.path.abspath("."))  # Make nimphs modules available in this file
+from nimphs.operators.utils.object import ObjectUtils
+from nimphs.operators.utils.mesh import OpenfoamMeshUtils
+from nimphs.properties.openfoam.file_data import OpenfoamFileData
+
+
+def update_legacy(file_data: OpenfoamFileData, time_point: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read the given time point and generate the surface with the previous data path.
+
+    Args:
+        file_data (OpenfoamFileData): file data
+        time_point (int): time point
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: vertices, faces
+    """
+
+    file_data.file.set_active_time_point(time_point)
+    file_data.mesh = file_data.file.read()["internalMesh"]
+    file_data.raw_mesh = file_data.file.read()["internalMesh"]
+
+    surface = deepcopy(file_data.raw_mesh).extract_surface(nonlinear_subdivision=0)
+    if file_data.triangulate:
+        surface.triangulate(inplace=True)
+        surface.compute_normals(inplace=True, consistent_normals=False, split_vertices=True)
+
+    file_data.mesh = surface
+    return np.array(surface.points), OpenfoamMeshUtils.faces(surface)
+
+
+def update(file_data: OpenfoamFileData, time_point: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read the given time point and generate the surface with the current data path.
+
+    Args:
+        file_data (OpenfoamFileData): file data
+        time_point (int): time point
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: vertices, faces
+    """
+
+    file_data.update_data(time_point)
+    vertices, file_data.mesh = OpenfoamMeshUtils.vertices(file_data)
+    return vertices, OpenfoamMeshUtils.faces(file_data.mesh)
+
+
+def run(file_path: str, legacy: bool) -> dict[str, float]:
+    """
+    Update a mesh with each time point of the given case.
+
+    Args:
+        file_path (str): path to the OpenFOAM case
+        legacy (bool): use the previous data path
+
+    Returns:
+        dict[str, float]: total time (s), mean time per update (s), slowest update (s)
+    """
+
+    file_data = OpenfoamFileData(file_path, None)
+    bmesh = bpy.data.meshes.new("NIMPHS_benchmark_mesh")
+
+    timings = []
+    for time_point in range(file_data.nb_time_points):
+        start = time.perf_counter()
+
+        vertices, faces = (update_legacy if legacy else update)(file_data, time_point)
+        bmesh.clear_geometry()
+        ObjectUtils.build(bmesh, vertices, faces)
+
+        timings.append(time.perf_counter() - start)
+
+    bpy.data.meshes.remove(bmesh)
+
+    return {
+        "total (s)": float(np.sum(timings)),
+        "mean (s)": float(np.mean(timings)),
+        "max (s)": float(np.max(timings)),
+    }
+
+
+def main():
+    """Run the benchmark."""
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    path = Path(argv[0] if argv else "data/openfoam/sample/foam.foam").resolve()
+
+    results = {"previous": run(str(path), legacy=True), "current": run(str(path), legacy=False)}
+
+    print(f"\n{path.parent.name}")
+    measures = list(next(iter(results.values())).keys())
+    print(f"{'data path':<12}" + "".join(f"{measure:>16}" for measure in measures))
+    for name, values in results.items():
+        print(f"{name:<12}" + "".join(f"{values[measure]:>16.4f}" for measure in measures))
+
+
+if __name__ == "__main__":
+    main()
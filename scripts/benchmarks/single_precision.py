@@ -0,0 +1,94 @@
+# <pep8 compliant>
+"""
+Compare memory usage and speed of the TELEMAC data path in single (float32) and double (float64) precision.
+
+For each time point of the file, it reads all the variables, generates vertices of the mesh (each plane for 3D
+simulations) and remaps each variable to vertex colors (as done when updating a sequence).
+
+Run with Blender's Python (NIMPHS modules import bpy) from the root of the repository:
+
+    blender -b --python scripts/benchmarks/single_precision.py -- [path/to/file.slf]
+
+Defaults to the bundled ``data/telemac_3d/telemac_3d.slf`` sample. Use a large file to get meaningful results.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import numpy as np
+from pathlib import Path
+
+sys.path.append(os.path.abspath("."))  # Make nimphs modules available in this file
+import nimphs.properties.telemac.file_data as telemac_file_data
+from nimphs.operators.utils.others import remap_array
+from nimphs.operators.utils.mesh import TelemacMeshUtils
+from nimphs.properties.telemac.file_data import TelemacFileData
+
+
+def run(file_path: str, dtype: np.dtype) -> dict[str, float]:
+    """
+    Run the data path on all the time points of the given file.
+
+    Args:
+        file_path (str): path to the TELEMAC file
+        dtype (np.dtype): type of the floating point values of point data
+
+    Returns:
+        dict[str, float]: time (s), peak memory (MB), size of the frame cache (MB), size of the output buffers (MB)
+    """
+
+    # Force the precision instead of reading it from the add-on preferences
+    telemac_file_data.get_float_dtype = lambda: np.dtype(dtype)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    file_data = TelemacFileData(file_path)
+    loop_vertex_ids = file_data.faces.ravel()
+    nb_planes = max(file_data.nb_planes, 1)
+
+    output_size = 0
+    for time_point in range(file_data.nb_time_points):
+        file_data.update_data(time_point)
+        output_size = 0
+
+        for plane in range(nb_planes):
+            vertices = TelemacMeshUtils.vertices(file_data, offset=plane)
+            output_size += vertices.nbytes
+
+            for name in file_data.vars.names:
+                data = file_data.get_point_data(name)
+                data = data[plane * file_data.nb_vertices:(plane + 1) * file_data.nb_vertices]
+                colors = remap_array(data[loop_vertex_ids])
+                output_size += colors.nbytes
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "time (s)": elapsed,
+        "peak memory (MB)": peak / 1e6,
+        "frame cache (MB)": file_data.cache.size / 1e6,
+        "output / time point (MB)": output_size / 1e6,
+    }
+
+
+def main():
+    """Run the benchmark."""
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    path = Path(argv[0] if argv else "data/telemac_3d/telemac_3d.slf").resolve()
+
+    results = {"float64": run(str(path), np.float64), "float32": run(str(path), np.float32)}
+
+    print(f"\n{path.name} ({path.stat().st_size / 1e6:.2f} MB)")
+    measures = list(next(iter(results.values())).keys())
+    print(f"{'precision':<12}" + "".join(f"{measure:>28}" for measure in measures))
+    for precision, values in results.items():
+        print(f"{precision:<12}" + "".join(f"{values[measure]:>28.3f}" for measure in measures))
+
+
+if __name__ == "__main__":
+    main()
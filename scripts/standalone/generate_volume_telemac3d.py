@@ -53,7 +53,7 @@ class Mesh():
         # Read file
         self.file = Serafin(path, read_time=True)
         self.file.get_2d()
-        self.data = self.file.read(self.file.temps[0])
+        self.data = self.file.read(0, is_time=False)
 
         # Get total number of planes (with interpolation)
         self.plane_interp_steps = plane_interp_steps
@@ -84,12 +84,12 @@ class Mesh():
         """
 
         if time_interp_step == 0:
-            self.data = self.file.read(self.file.temps[time_point])
+            self.data = self.file.read(time_point, is_time=False)
             self.z_coords = self.get_point_data(['ELEVATION Z', 'COTE Z'])
         else:
             # Linearly interpolate point data in time
-            current_data = self.file.read(self.file.temps[time_point])
-            next_data = self.file.read(self.file.temps[time_point + 1])
+            current_data = self.file.read(time_point, is_time=False)
+            next_data = self.file.read(time_point + 1, is_time=False)
             percentage = time_interp_step / (time_steps + 1)
             difference = next_data - current_data
             self.data = current_data + percentage * difference
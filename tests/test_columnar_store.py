@@ -0,0 +1,126 @@
+# <pep8 compliant>
+import os
+import sys
+import shutil
+import pytest
+import numpy as np
+
+# Make helpers module available in this file
+sys.path.append(os.path.abspath("."))
+from helpers import utils
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.shared.columnar_store import ColumnarStore, get_store_path
+from nimphs.properties.telemac.columnar_file import TelemacColumnarFile, convert_telemac_file
+from nimphs.properties.telemac.file_data import TelemacFileData, is_memory_mapped
+
+
+@pytest.fixture(params=[False, True], ids=['npy', 'npz'])
+def compress(request):
+    return request.param
+
+
+def test_columnar_store_round_trip(tmp_path, compress):
+    file_path = str(tmp_path / "result.slf")
+    values = np.random.default_rng(0).random((10, 2, 50)).astype(np.float32)
+
+    store = ColumnarStore.create(file_path, 'TELEMAC', ["A", "B"], 10, block_size=4, compress=compress, extra=1)
+    assert store.path == get_store_path(file_path)
+    for block, start in enumerate(range(0, 10, store.block_size)):
+        for var_id in range(2):
+            store.write_block(var_id, block, values[start:start + store.block_size, var_id])
+    store.save_arrays("mesh", x=values[0, 0])
+
+    # Incomplete stores are ignored
+    assert ColumnarStore.open(file_path, 'TELEMAC') is None
+    store.save_meta(complete=True)
+    assert ColumnarStore.open(file_path, 'OpenFOAM') is None
+
+    store = ColumnarStore.open(file_path, 'TELEMAC')
+    assert store.names == ["A", "B"] and store.nb_time_points == 10 and store.block_size == 4
+    assert store.meta["extra"] == 1
+    assert np.array_equal(store.load_arrays("mesh")["x"], values[0, 0])
+
+    for var_id in range(2):
+        for time_point in range(10):
+            assert np.array_equal(store.read_frame(var_id, time_point), values[time_point, var_id])
+
+        assert np.array_equal(store.read_series(var_id), values[:, var_id])
+        # Ranges over several blocks, selection of values
+        assert np.array_equal(store.read_series(var_id, 3, 9), values[3:9, var_id])
+        assert np.array_equal(store.read_series(var_id, 5, 6, columns=[7, 1]), values[5:6, var_id][:, [7, 1]])
+        # Empty ranges
+        assert store.read_series(var_id, 4, 4).shape == (0, 50)
+        assert store.read_series(var_id, 10, columns=[7, 1]).shape == (0, 2)
+
+    # Creating a store replaces the existing one
+    ColumnarStore.create(file_path, 'TELEMAC', ["A"], 1)
+    assert ColumnarStore.open(file_path, 'TELEMAC') is None
+
+
+@pytest.mark.parametrize("source", [utils.FILE_PATH_TELEMAC_2D, utils.FILE_PATH_TELEMAC_3D], ids=['2D', '3D'])
+def test_convert_telemac_file(tmp_path, source, compress):
+    # The store is saved next to the file: work on a copy of the sample
+    file_path = shutil.copy(source, tmp_path)
+    assert TelemacColumnarFile.open(file_path) is None
+
+    converted = list(convert_telemac_file(file_path, block_size=4, compress=compress))
+    serafin = Serafin(file_path, read_time=True)
+    assert converted[-1] == serafin.nb_pdt
+
+    file = TelemacColumnarFile.open(file_path)
+    assert file is not None
+    assert file.nb_pdt == serafin.nb_pdt and file.nbvar == serafin.nbvar
+    assert np.array_equal(file.temps, serafin.temps)
+
+    frames = serafin.read_frames(range(serafin.nb_pdt))
+    assert np.array_equal(file.read_frames(range(file.nb_pdt)), frames)
+    assert np.array_equal(file.read(serafin.temps[3]), frames[3])
+    assert np.array_equal(file.read_vars(2, [1, 0], is_time=False), frames[2, [1, 0]])
+
+    nodes = [0, 10, file.npoin - 1]
+    assert np.array_equal(file.read_time_series(nodes, start=1, end=10), frames[1:10][:, :, nodes])
+    assert np.array_equal(file.get_frames_view()[2:6], frames[2:6])
+    serafin.close()
+
+    # The store is outdated once the file has changed
+    with open(file_path, "ab") as source_file:
+        source_file.write(b"\0")
+    assert TelemacColumnarFile.open(file_path) is None
+
+
+def test_cancel_convert_telemac_file(tmp_path):
+    file_path = shutil.copy(utils.FILE_PATH_TELEMAC_2D, tmp_path)
+
+    steps = convert_telemac_file(file_path, block_size=4)
+    assert next(steps) == 4
+    assert get_store_path(file_path).exists()
+
+    # Closing the generator (canceled conversion) removes the incomplete store
+    steps.close()
+    assert not get_store_path(file_path).exists()
+    assert TelemacColumnarFile.open(file_path) is None
+
+
+def test_read_frames_columnar_store(tmp_path):
+    file_path = shutil.copy(utils.FILE_PATH_TELEMAC_2D, tmp_path)
+    file = Serafin(file_path, read_time=True)
+
+    # Big endian values of the file are decoded once and cached
+    file_data = TelemacFileData(file_path)
+    file_data.dtype = np.dtype(np.float32)
+    size = len(file_data.cache)
+    frames = file_data.read_frames(1, [0, 1])
+    assert not file_data.zero_copy and len(file_data.cache) == size + 2
+    assert np.array_equal(frames[0], file.read(1, is_time=False)[0])
+
+    # Values of uncompressed stores are views on the memory-mapped blocks: no copy, not cached
+    list(convert_telemac_file(file_path, block_size=4))
+    file_data = TelemacFileData(file_path)
+    file_data.dtype = np.dtype(np.float32)
+    for _ in range(2):
+        frames = file_data.read_frames(1, [0, 1])
+        assert file_data.zero_copy and len(file_data.cache) == 0
+        assert is_memory_mapped(frames[1])
+        assert np.array_equal(frames[1], file.read(1, is_time=False)[1])
+
+    file.close()
@@ -46,6 +46,8 @@ def test_computed_min_max_values_openfoam():
         ground_truth = {"max": vars[name]["max"], "min": vars[name]["min"]}
         assert data.minG == ground_truth["min"]
         assert data.maxG == ground_truth["max"]
+        # Value ranges without outliers are within global value ranges
+        assert data.minG <= data.minP <= data.maxP <= data.maxG
 
 
 # -------------------------- #
@@ -83,6 +85,8 @@ def test_computed_min_max_values_telemac_2d():
         ground_truth = {"max": vars[name]["max"], "min": vars[name]["min"]}
         assert data.minG == ground_truth["min"]
         assert data.maxG == ground_truth["max"]
+        # Value ranges without outliers are within global value ranges
+        assert data.minG <= data.minP <= data.maxP <= data.maxG
 
 
 # -------------------------- #
@@ -120,3 +124,5 @@ def test_computed_min_max_values_telemac_3d():
         ground_truth = {"max": vars[name]["max"], "min": vars[name]["min"]}
         assert data.minG == ground_truth["min"]
         assert data.maxG == ground_truth["max"]
+        # Value ranges without outliers are within global value ranges
+        assert data.minG <= data.minP <= data.maxP <= data.maxG
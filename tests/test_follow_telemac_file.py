@@ -0,0 +1,114 @@
+# <pep8 compliant>
+import os
+import sys
+import shutil
+import pytest
+import numpy as np
+from types import SimpleNamespace
+
+# Make helpers module available in this file
+sys.path.append(os.path.abspath("."))
+from helpers import utils
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.telemac.file_data import TelemacFileData
+from nimphs.operators.utils.sequence import follow_telemac_streaming_sequence
+
+
+def append_time_point(file_path: str, time: float) -> None:
+    """
+    Append a time point to a TELEMAC file (copy of the values of the last time point), as a running simulation does.
+
+    Args:
+        file_path (str): path to the TELEMAC file
+        time (float): time of the new time point
+    """
+
+    file = Serafin(file_path, read_time=True)
+    size = int(file.taille_pdt_[0])
+    file.close()
+
+    with open(file_path, "r+b") as output:
+        output.seek(-size, os.SEEK_END)
+        frame = bytearray(output.read(size))
+        # Time record: record marker (4 bytes), time, record marker
+        frame[4:8] = np.array([time], dtype='>f4').tobytes()
+        output.seek(0, os.SEEK_END)
+        output.write(frame)
+
+
+@pytest.fixture(params=[utils.FILE_PATH_TELEMAC_2D, utils.FILE_PATH_TELEMAC_3D], ids=['2D', '3D'])
+def file_path(request, tmp_path, monkeypatch):
+    # Work on a copy of the sample (statistics indices are saved next to the file)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return shutil.copy(request.param, tmp_path)
+
+
+@pytest.mark.parametrize("use_memmap", [False, True], ids=['fromfile', 'memmap'])
+def test_refresh_serafin(file_path, use_memmap):
+    file = Serafin(file_path, read_time=True, use_memmap=use_memmap)
+    nb_pdt = file.nb_pdt
+    last = file.read(nb_pdt - 1, is_time=False).copy()
+    assert file.refresh() == 0
+
+    new_time = float(file.temps[-1] + (file.temps[-1] - file.temps[-2]))
+    append_time_point(file_path, new_time)
+
+    assert file.refresh() == 1
+    assert file.nb_pdt == nb_pdt + 1
+    assert len(file.temps) == nb_pdt + 1 and np.isclose(file.temps[-1], new_time)
+    assert np.array_equal(file.get_offsets(file.nb_pdt), [file.get_offset(pos) for pos in range(file.nb_pdt)])
+    assert file.get_offset(nb_pdt) == int(file.entete_[0]) + nb_pdt * int(file.taille_pdt_[0])
+
+    assert np.array_equal(file.read(nb_pdt, is_time=False), last)
+    assert np.array_equal(file.read(file.temps[-1]), last)
+    assert np.array_equal(file.read_frames([nb_pdt])[0], last)
+    assert file.refresh() == 0
+
+    # An incomplete time point is ignored
+    with open(file_path, "ab") as output:
+        output.write(b"\0" * 8)
+    assert file.refresh() == 0 and file.nb_pdt == nb_pdt + 1
+
+    file.close()
+
+
+def test_refresh_telemac_file_data(file_path):
+    file_data = TelemacFileData(file_path)
+    nb_time_points = file_data.nb_time_points
+
+    # Compute the statistics index
+    for _processed in file_data.statistics.compute(file_data.file):
+        pass
+    assert file_data.statistics.is_ok()
+
+    append_time_point(file_path, float(file_data.file.temps[-1]) + 1.0)
+    assert file_data.refresh() == 1
+    assert file_data.nb_time_points == nb_time_points + 1
+
+    # Value ranges of the statistics index do not cover the new time point
+    assert not file_data.statistics.is_ok()
+
+    file_data.update_data(nb_time_points)
+    last = file_data.file.read(nb_time_points - 1, is_time=False)
+    assert np.array_equal(file_data.get_point_data(0), last[0].astype(file_data.dtype))
+
+
+def test_follow_telemac_streaming_sequence(file_path):
+    file_data = TelemacFileData(file_path)
+    nb_time_points = file_data.nb_time_points
+
+    # Sequence which uses all the time points, sequence which uses a part of them
+    sequences = [SimpleNamespace(length=nb_time_points, max=nb_time_points),
+                 SimpleNamespace(length=2, max=nb_time_points)]
+    objects = [SimpleNamespace(nimphs=SimpleNamespace(settings=SimpleNamespace(telemac=SimpleNamespace(
+        s_sequence=sequence)))) for sequence in sequences]
+
+    assert follow_telemac_streaming_sequence(objects[0], file_data) == 0
+
+    append_time_point(file_path, float(file_data.file.temps[-1]) + 1.0)
+    assert follow_telemac_streaming_sequence(objects[0], file_data) == 1
+    assert sequences[0].max == nb_time_points + 1 and sequences[0].length == nb_time_points + 1
+
+    append_time_point(file_path, float(file_data.file.temps[-1]) + 1.0)
+    assert follow_telemac_streaming_sequence(objects[1], file_data) == 1
+    assert sequences[1].max == nb_time_points + 2 and sequences[1].length == 2
@@ -0,0 +1,66 @@
+# <pep8 compliant>
+import numpy as np
+
+from nimphs.properties.utils.frame_cache import FrameCache
+
+
+def frame(value: int) -> np.ndarray:
+    """
+    Generate a frame of 100 bytes.
+
+    Args:
+        value (int): value of the frame
+
+    Returns:
+        np.ndarray: frame
+    """
+
+    return np.full(25, value, dtype=np.float32)
+
+
+def test_frame_cache_eviction():
+    cache = FrameCache(max_size=300)
+    assert cache.is_enabled()
+
+    for key in range(3):
+        cache.put(key, frame(key))
+    assert len(cache) == 3 and cache.size == 300
+
+    # Use 0, then add 3: 1 is the least recently used frame
+    assert np.array_equal(cache.get(0), frame(0))
+    cache.put(3, frame(3))
+    assert len(cache) == 3 and cache.size == 300
+    assert 1 not in cache
+    assert all(key in cache for key in [0, 2, 3])
+
+    # Replace a frame with a larger one: the least recently used frame is evicted
+    cache.put(3, np.zeros(50, dtype=np.float32))
+    assert len(cache) == 2 and cache.size == 300
+    assert 2 not in cache and 0 in cache and 3 in cache
+
+    # A frame as large as the limit evicts all the other frames
+    cache.put(4, np.zeros(75, dtype=np.float32))
+    assert len(cache) == 1 and cache.size == 300
+
+    assert cache.get(1) is None
+    assert cache.hits == 1 and cache.misses == 1
+    assert cache.hit_rate() == 0.5
+
+
+def test_frame_cache_limits():
+    # Frames larger than the limit are not cached
+    cache = FrameCache(max_size=50)
+    cache.put(0, frame(0))
+    assert len(cache) == 0 and cache.size == 0
+
+    # Disabled cache
+    cache = FrameCache()
+    assert not cache.is_enabled()
+    cache.put(0, frame(0))
+    assert cache.get(0) is None
+
+    cache = FrameCache(max_size=100)
+    cache.put(0, frame(0))
+    cache.get(0)
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0 and cache.hits == 0 and cache.misses == 0
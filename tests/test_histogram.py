@@ -0,0 +1,80 @@
+# <pep8 compliant>
+import numpy as np
+
+from nimphs.properties.utils.histogram import StreamingHistogram
+
+PERCENTILES = [0.0, 1.0, 5.0, 25.0, 50.0, 75.0, 95.0, 99.0, 100.0]
+
+
+def get_expected(values: np.ndarray, percentile: float) -> float:
+    """
+    Get the value of the given percentile (value of rank floor((n - 1) * percentile / 100), no interpolation).
+
+    Args:
+        values (np.ndarray): values
+        percentile (float): percentile
+
+    Returns:
+        float: value
+    """
+
+    values = np.sort(values)
+    return float(values[int(np.floor((len(values) - 1) * percentile / 100.0))])
+
+
+def check_percentiles(histogram: StreamingHistogram, values: np.ndarray) -> None:
+    """
+    Check that the percentiles of the histogram approximate the percentiles of the values (constant relative error).
+
+    Args:
+        histogram (StreamingHistogram): histogram
+        values (np.ndarray): values added to the histogram
+    """
+
+    for percentile, value in zip(PERCENTILES, histogram.get_percentiles(PERCENTILES)):
+        expected = get_expected(values, percentile)
+        assert abs(value - expected) <= StreamingHistogram.RELATIVE_ACCURACY * abs(expected) * 1.001
+
+
+def test_histogram_percentiles():
+    rng = np.random.default_rng(0)
+    values = np.concatenate((rng.normal(10.0, 3.0, 50000), rng.lognormal(0.0, 2.0, 50000), -rng.random(20000),
+                             np.zeros(1000)))
+
+    histogram = StreamingHistogram()
+    # Update by chunks, in any order
+    for chunk in np.array_split(rng.permutation(values), 7):
+        histogram.update(chunk)
+
+    assert histogram.total() == len(values)
+    assert histogram.zeros == 1000
+    check_percentiles(histogram, values)
+
+    # Ranges without outliers
+    mini, maxi = histogram.get_range(5.0)
+    assert (mini, maxi) == tuple(histogram.get_percentiles([5.0, 95.0]))
+    assert values.min() <= mini <= maxi <= values.max()
+
+    # Restore a saved histogram
+    restored = StreamingHistogram(histogram.counts, histogram.offsets, histogram.zeros)
+    assert restored.get_percentiles(PERCENTILES) == histogram.get_percentiles(PERCENTILES)
+
+
+def test_histogram_limits():
+    histogram = StreamingHistogram()
+    assert all(np.isnan(histogram.get_percentiles([0.0, 50.0])))
+
+    # Non-finite values are ignored
+    histogram.update(np.array([np.nan, np.inf, -np.inf, 2.0, -3.0]))
+    assert histogram.total() == 2
+    assert abs(histogram.get_percentiles([0.0])[0] + 3.0) <= 3.0 * StreamingHistogram.RELATIVE_ACCURACY
+    assert abs(histogram.get_percentiles([100.0])[0] - 2.0) <= 2.0 * StreamingHistogram.RELATIVE_ACCURACY
+
+    # Values over too many orders of magnitude: the smallest magnitudes are merged, the largest stay accurate
+    values = np.logspace(-25, 25, 10001)
+    histogram = StreamingHistogram()
+    histogram.update(values)
+    assert histogram.total() == len(values)
+    for percentile, value in zip([95.0, 99.0, 100.0], histogram.get_percentiles([95.0, 99.0, 100.0])):
+        expected = get_expected(values, percentile)
+        assert abs(value - expected) <= StreamingHistogram.RELATIVE_ACCURACY * expected * 1.001
@@ -0,0 +1,139 @@
+# <pep8 compliant>
+import os
+import sys
+import pytest
+import numpy as np
+
+# Make helpers module available in this file
+sys.path.append(os.path.abspath("."))
+from helpers import utils
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.telemac.partitioned_serafin import PartitionedSerafin, open_telemac_file, get_partition_paths
+from nimphs.properties.telemac.columnar_file import TelemacColumnarFile, convert_telemac_file
+
+
+def write_partitions(file: Serafin, folder: str, nb_partitions: int) -> list[str]:
+    """
+    Split a TELEMAC result in subdomains (bands of triangles along the x axis), as done by the partitioner of TELEMAC.
+
+    Nodes on the interfaces between subdomains are written in each subdomain which has them. Global numbers of the
+    nodes (1-based) are written in the IPOBO array.
+
+    Args:
+        file (Serafin): TELEMAC result (with the 2D mesh information)
+        folder (str): output folder
+        nb_partitions (int): number of subdomains
+
+    Returns:
+        list[str]: paths to the partition files
+    """
+
+    nb_planes = max(file.nplan, 1)
+    nelem2d = len(file.ikle2d)
+    ikle = np.asarray(file.ikle).reshape((file.nelem, file.ndp)) - 1
+    frames = file.get_frames_view()
+
+    # Subdomain of each triangle, from the position of its center
+    centers = file.x[:file.npoin2d][file.ikle2d].mean(axis=1)
+    bounds = np.quantile(centers, np.linspace(0, 1, nb_partitions + 1))
+    domains = np.clip(np.searchsorted(bounds, centers, side='right') - 1, 0, nb_partitions - 1)
+
+    paths = []
+    for id in range(nb_partitions):
+        triangles = np.flatnonzero(domains == id)
+        nodes = (np.arange(nb_planes)[:, np.newaxis] * file.npoin2d + np.unique(file.ikle2d[triangles])).ravel()
+        elements = np.concatenate([triangles + plane * nelem2d for plane in range(max(nb_planes - 1, 1))])
+
+        local = np.full(file.npoin, -1)
+        local[nodes] = np.arange(len(nodes))
+
+        path = os.path.join(folder, f"{os.path.basename(file.name[0])}{nb_partitions - 1:05d}-{id:05d}")
+        partition = Serafin(path, mode='wb')
+        partition.copy_info(file)
+        partition.nelem, partition.npoin = len(elements), len(nodes)
+        partition.ikle = (local[ikle[elements]] + 1).astype(np.int32)
+        partition.ipobo = (nodes + 1).astype(np.int32)
+        partition.x, partition.y = file.x[nodes], file.y[nodes]
+        partition.write_header()
+        for time_point in range(file.nb_pdt):
+            partition.write_frame(file.temps[time_point], frames[time_point][:, nodes])
+        partition.close()
+        paths.append(path)
+
+    return paths
+
+
+@pytest.fixture(params=[utils.FILE_PATH_TELEMAC_2D, utils.FILE_PATH_TELEMAC_3D], ids=['2D', '3D'])
+def result(request, tmp_path):
+    file = Serafin(request.param, read_time=True, use_memmap=True)
+    file.get_2d()
+    paths = write_partitions(file, str(tmp_path), 3)
+    yield file, paths
+    file.close()
+
+
+def test_open_partitioned_serafin(result):
+    file, paths = result
+
+    assert get_partition_paths(file.name[0]) == []
+    assert get_partition_paths(paths[1]) == paths
+    partitioned = open_telemac_file(paths[0])
+    assert isinstance(partitioned, PartitionedSerafin)
+    partitioned.close()
+
+    os.remove(paths[-1])
+    with pytest.raises(IOError):
+        get_partition_paths(paths[0])
+
+
+def test_stitch_partitioned_serafin(result):
+    file, paths = result
+    partitioned = PartitionedSerafin(paths)
+
+    assert len(partitioned.partitions) == 3
+    assert partitioned.npoin == file.npoin and partitioned.npoin2d == file.npoin2d
+    assert partitioned.nb_pdt == file.nb_pdt and partitioned.nbvar == file.nbvar
+    assert np.array_equal(partitioned.temps, file.temps)
+    assert np.array_equal(partitioned.x, file.x) and np.array_equal(partitioned.y, file.y)
+
+    # Elements are ordered by subdomain
+    def sort(elements: np.ndarray, nb_corners: int) -> np.ndarray:
+        elements = np.asarray(elements).reshape((-1, nb_corners))
+        return elements[np.lexsort(elements.T)]
+
+    assert np.array_equal(sort(partitioned.ikle2d, 3), sort(file.ikle2d, 3))
+    assert np.array_equal(sort(partitioned.ikle, file.ndp), sort(file.ikle, file.ndp))
+
+    frames = file.read_frames(range(file.nb_pdt))
+    for max_workers in [None, 1]:
+        stitched = partitioned.read_frames(range(file.nb_pdt), max_workers=max_workers)
+        assert np.array_equal(stitched, frames)
+
+    assert np.array_equal(partitioned.read(file.temps[4]), frames[4])
+    assert np.array_equal(np.array(partitioned.read_vars(2, [1], is_time=False)), frames[2, [1]])
+    assert np.array_equal(partitioned.get_frames_view()[3:5], frames[3:5])
+
+    nodes = np.random.default_rng(0).choice(file.npoin, 50, replace=False)
+    series = partitioned.read_time_series(nodes, list_var=[0, file.nbvar - 1], start=2, end=8)
+    assert np.array_equal(series, frames[2:8][:, [0, file.nbvar - 1]][:, :, nodes])
+
+    partitioned.close()
+
+
+def test_convert_partitioned_serafin(result):
+    file, paths = result
+    list(convert_telemac_file(paths[0], block_size=4))
+
+    columnar = TelemacColumnarFile.open(paths[0])
+    assert columnar is not None and columnar.npoin == file.npoin
+    assert np.array_equal(columnar.read_frames(range(file.nb_pdt)), file.read_frames(range(file.nb_pdt)))
+
+    # The store is outdated when any of the partition files changes
+    stat = os.stat(paths[-1])
+    os.utime(paths[-1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert TelemacColumnarFile.open(paths[0]) is None
+
+    list(convert_telemac_file(paths[0], block_size=4))
+    assert TelemacColumnarFile.open(paths[0]) is not None
+    os.remove(paths[1])
+    assert TelemacColumnarFile.open(paths[0]) is None
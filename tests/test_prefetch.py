@@ -0,0 +1,89 @@
+# <pep8 compliant>
+import time
+import threading
+
+from nimphs.properties.utils.prefetch import Prefetcher, get_next_time_points
+
+
+def test_prefetcher_hits_and_misses():
+    gate = threading.Event()
+
+    def load(time_point: int) -> int:
+        """
+        Read a time point (the time point 2 waits for the gate).
+
+        Args:
+            time_point (int): time point
+
+        Returns:
+            int: data of the time point
+        """
+
+        if time_point == 2:
+            gate.wait()
+        return time_point * 10
+
+    prefetcher = Prefetcher(load, signature=("A",), max_workers=1)
+    prefetcher.schedule([1, 2])
+
+    # Time point 2 is still being read: wait for it
+    threading.Timer(0.05, gate.set).start()
+    assert prefetcher.get(2) == 20
+    assert prefetcher.hits == 0 and prefetcher.misses == 1
+
+    # Time point 1 has been read before 2 (single worker)
+    assert prefetcher.get(1) == 10
+    assert prefetcher.hits == 1 and prefetcher.misses == 1
+
+    # Not prefetched, repeated requests (interpolation) are counted once
+    assert prefetcher.get(7) is None
+    assert prefetcher.get(7) is None
+    assert prefetcher.misses == 2
+    assert abs(prefetcher.hit_rate() - 1 / 3) < 1e-9
+
+    prefetcher.shutdown()
+
+
+def test_prefetcher_shutdown():
+    gate, started, loaded = threading.Event(), threading.Event(), []
+
+    def load(time_point: int) -> int:
+        """
+        Read a time point (waits for the gate).
+
+        Args:
+            time_point (int): time point
+
+        Returns:
+            int: data of the time point
+        """
+
+        started.set()
+        gate.wait()
+        loaded.append(time_point)
+        return time_point
+
+    prefetcher = Prefetcher(load, max_workers=1)
+    prefetcher.schedule([0, 1, 2])
+    assert started.wait(timeout=5)
+
+    # Pending requests are cancelled, the running one ends
+    prefetcher.shutdown()
+    gate.set()
+    time.sleep(0.1)
+    assert loaded == [0]
+    assert prefetcher.get(1) is None
+
+
+def test_get_next_time_points():
+    assert get_next_time_points(2, 1, 3, 10) == [3, 4, 5]
+    assert get_next_time_points(5, -1, 2, 10) == [4, 3]
+
+    # Wrap around at the end of the sequence (playback loops)
+    assert get_next_time_points(8, 1, 3, 10) == [9, 0, 1]
+    assert get_next_time_points(1, -1, 3, 10) == [0, 9, 8]
+
+    # Sequences shorter than the number of time points to prefetch
+    assert get_next_time_points(1, 1, 5, 3) == [2, 0]
+    assert get_next_time_points(0, 1, 5, 1) == []
+    assert get_next_time_points(0, 1, 5, 0) == []
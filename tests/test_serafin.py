@@ -0,0 +1,234 @@
+# <pep8 compliant>
+import os
+import sys
+import pytest
+import numpy as np
+
+# Make helpers module available in this file
+sys.path.append(os.path.abspath("."))
+from helpers import utils
+from nimphs.properties.telemac.serafin import Serafin, get_time_position
+
+
+def read_records(file_path: str) -> list[bytes]:
+    """
+    Read all the records of a Fortran sequential file, without the Serafin reader.
+
+    Args:
+        file_path (str): path to the file
+
+    Returns:
+        list[bytes]: content of each record
+    """
+
+    data = np.fromfile(file_path, dtype=np.uint8).tobytes()
+    records, position = [], 0
+    while position < len(data):
+        size = int(np.frombuffer(data, dtype='>i4', count=1, offset=position)[0])
+        records.append(data[position + 4:position + 4 + size])
+        position += size + 8
+
+    return records
+
+
+def read_reference(file_path: str) -> dict:
+    """
+    Decode a big endian, single precision Serafin file record by record.
+
+    Args:
+        file_path (str): path to the file
+
+    Returns:
+        dict: 'ikle', 'x', 'y' and 'frames' (array of shape (nb_pdt, nbvar, npoin))
+    """
+
+    records = iter(read_records(file_path))
+    next(records)  # Title
+    nbvar = int(np.frombuffer(next(records), dtype='>i4')[0])
+    for _ in range(nbvar):
+        next(records)  # Names of the variables
+    date = np.frombuffer(next(records), dtype='>i4')
+    if date[-1] == 1:
+        next(records)  # Date
+    nelem, npoin, ndp, _ = np.frombuffer(next(records), dtype='>i4')
+
+    ikle = np.frombuffer(next(records), dtype='>i4').reshape(nelem, ndp)
+    next(records)  # IPOBO
+    x = np.frombuffer(next(records), dtype='>f4')
+    y = np.frombuffer(next(records), dtype='>f4')
+
+    frames = []
+    for _ in records:  # Time
+        frames.append([np.frombuffer(next(records), dtype='>f4') for _ in range(nbvar)])
+
+    return {"ikle": ikle, "x": x, "y": y, "npoin": npoin, "frames": np.array(frames, dtype=np.float32)}
+
+
+@pytest.fixture(params=[utils.FILE_PATH_TELEMAC_2D, utils.FILE_PATH_TELEMAC_3D], ids=['2D', '3D'])
+def file_path(request):
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=['fromfile', 'memmap'])
+def use_memmap(request):
+    return request.param
+
+
+def test_header_serafin(file_path, use_memmap):
+    reference = read_reference(file_path)
+    file = Serafin(file_path, read_time=True, use_memmap=use_memmap)
+
+    assert file.IKLE[0].dtype == np.int32
+    assert file.X[0].dtype == np.float32
+    assert file.Y[0].dtype == np.float32
+
+    assert file.NPOIN[0] == reference["npoin"]
+    assert file.nb_pdt == len(reference["frames"])
+    assert np.array_equal(file.IKLE[0].reshape(reference["ikle"].shape), reference["ikle"])
+    assert np.array_equal(file.X[0], reference["x"])
+    assert np.array_equal(file.Y[0], reference["y"])
+
+    file.close()
+
+
+def test_read_serafin(file_path, use_memmap):
+    reference = read_reference(file_path)
+    file = Serafin(file_path, read_time=True, use_memmap=use_memmap)
+
+    for pos in range(file.nb_pdt):
+        var = file.read(pos, is_time=False)
+        assert var.shape == (file.nbvar, file.NPOIN[0])
+        assert var.dtype.newbyteorder('=') == np.float32
+        assert np.array_equal(var, reference["frames"][pos])
+
+    file.close()
+
+
+def test_read_memmap_and_fromfile_serafin(file_path):
+    fromfile = Serafin(file_path, read_time=True, use_memmap=False)
+    memmap = Serafin(file_path, read_time=True, use_memmap=True)
+
+    assert np.array_equal(fromfile.IKLE[0], memmap.IKLE[0])
+    assert np.array_equal(fromfile.X[0], memmap.X[0])
+    assert np.array_equal(fromfile.temps, memmap.temps)
+
+    for pos in range(fromfile.nb_pdt):
+        assert np.array_equal(fromfile.read(pos, is_time=False), memmap.read(pos, is_time=False))
+        # Read time steps as times
+        time = fromfile.temps[pos]
+        assert np.array_equal(fromfile.read(time), memmap.read(time))
+
+    fromfile.close()
+    memmap.close()
+
+
+def test_read_vars_serafin(file_path, use_memmap):
+    reference = read_reference(file_path)
+    file = Serafin(file_path, read_time=True, use_memmap=use_memmap)
+
+    list_var = [file.nbvar - 1, 0]
+    for pos in range(file.nb_pdt):
+        var = file.read_vars(pos, list_var, is_time=False)
+        assert len(var) == len(list_var)
+        for values, pos_var in zip(var, list_var):
+            assert np.array_equal(values, reference["frames"][pos, pos_var])
+
+    # Read variables by name
+    var = file.read_vars(file.temps[-1], [file.nomvar[1]])
+    assert np.array_equal(var[0], reference["frames"][-1, 1])
+
+    file.close()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_read_frames_serafin(file_path, max_workers):
+    reference = read_reference(file_path)
+    file = Serafin(file_path, read_time=True)
+
+    list_time = [file.nb_pdt - 1, 0, 2]
+    frames = file.read_frames(list_time, max_workers=max_workers)
+    assert frames.shape == (len(list_time), file.nbvar, file.NPOIN[0])
+    assert np.array_equal(frames, reference["frames"][list_time])
+
+    # Selection of variables, output buffer
+    list_var = [file.nbvar - 1, 0]
+    out = np.zeros((len(list_time), len(list_var), file.NPOIN[0]), dtype=np.float32)
+    frames = file.read_frames(list_time, list_var=list_var, out=out, max_workers=max_workers)
+    assert frames is out
+    assert np.array_equal(out, reference["frames"][list_time][:, list_var])
+
+    with pytest.raises(ValueError):
+        file.read_frames(list_time, out=np.zeros((1, 1, 1), dtype=np.float32))
+
+    file.close()
+
+
+def test_read_time_series_serafin(file_path):
+    reference = read_reference(file_path)
+    file = Serafin(file_path, read_time=True)
+
+    nodes = [0, file.NPOIN[0] - 1, 10, 10]
+    series = file.read_time_series(nodes)
+    assert series.shape == (file.nb_pdt, file.nbvar, len(nodes))
+    assert np.array_equal(series, reference["frames"][:, :, nodes])
+
+    # Range of times, selection of variables, output buffer of another type
+    list_var = [file.nbvar - 1]
+    out = np.zeros((3, len(list_var), len(nodes)), dtype=np.float64)
+    series = file.read_time_series(nodes, list_var=list_var, start=2, end=5, out=out)
+    assert series is out
+    assert np.array_equal(out, reference["frames"][2:5][:, list_var][:, :, nodes])
+
+    with pytest.raises(IndexError):
+        file.read_time_series([file.NPOIN[0]])
+
+    file.close()
+
+
+def test_read_nodes_serafin(file_path):
+    reference = read_reference(file_path)
+    file = Serafin(file_path, read_time=True)
+
+    # Positions of the nodes in bytes in a variable block
+    nodes = np.array([0, file.NPOIN[0] - 1, 10, 10])
+    positions = list(nodes * file.precision[1])
+
+    for pos in range(file.nb_pdt):
+        var = file.read_nodes(pos, positions, is_time=False)
+        assert var.shape == (file.nbvar, len(nodes)) and var.dtype == np.float64
+        assert np.array_equal(var, reference["frames"][pos][:, nodes])
+
+    # All the variables are read (probe indexes the output by position of variable)
+    var = file.read_nodes(file.temps[3], positions, var2del=[0])
+    assert np.array_equal(var, reference["frames"][3][:, nodes])
+
+    # Continuous reading of time steps
+    assert np.array_equal(file.read_nodes(1, positions, is_time=False, continuous_time=True),
+                          reference["frames"][1][:, nodes])
+    assert np.array_equal(file.read_nodes(1, positions, is_time=False, continuous_time=True, valech=2),
+                          reference["frames"][3][:, nodes])
+
+    file.close()
+
+
+def test_time_positions_serafin(file_path):
+    file = Serafin(file_path, read_time=True)
+
+    # Each offset points to the record of the time of the time step
+    offsets = file.get_offsets(file.nb_pdt)
+    assert offsets.dtype == np.int64
+    for pos, offset in enumerate(offsets):
+        assert file.get_offset(pos) == offset
+        # Note: times are reconstructed from the time step (see get_temps)
+        assert np.isclose(np.fromfile(file_path, dtype='>f4', count=1, offset=int(offset) + 4)[0], file.temps[pos])
+
+    for pos, time in enumerate(file.temps):
+        assert file.get_position(time) == pos
+        assert file.get_position(pos, is_time=False) == pos
+        # Times are compared with a tolerance
+        assert get_time_position(file.temps, time + 1e-9) == pos
+
+    with pytest.raises(IndexError):
+        file.get_position(file.temps[-1] + 1000.0)
+
+    file.close()
@@ -0,0 +1,91 @@
+# <pep8 compliant>
+import os
+import sys
+import shutil
+import pytest
+import numpy as np
+
+# Make helpers module available in this file
+sys.path.append(os.path.abspath("."))
+from helpers import utils
+from nimphs.properties.telemac.serafin import Serafin
+from nimphs.properties.telemac.statistics_index import TelemacStatisticsIndex
+
+
+@pytest.fixture(params=[utils.FILE_PATH_TELEMAC_2D, utils.FILE_PATH_TELEMAC_3D], ids=['2D', '3D'])
+def file_path(request, tmp_path, monkeypatch):
+    # Index files are saved next to the file: work on a copy of the sample
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return shutil.copy(request.param, tmp_path)
+
+
+def test_compute_statistics_index(file_path):
+    file = Serafin(file_path, read_time=True, use_memmap=True)
+    file.get_2d()
+
+    index = TelemacStatisticsIndex(file_path)
+    assert not index.is_ok()
+    processed = list(index.compute(file, max_workers=4))
+    assert processed[-1] == file.nb_pdt
+    assert index.is_ok()
+
+    nb_planes = max(file.nplan, 1)
+    frames = file.read_frames(range(file.nb_pdt))
+    for var, name in enumerate(index.names):
+        values = frames[:, var].reshape(file.nb_pdt, nb_planes, -1)
+        assert index.get_range(name) == (values.min(), values.max())
+        assert index.get_range(name, time_points=[0, 2]) == (values[[0, 2]].min(), values[[0, 2]].max())
+        assert index.get_range(name, plane=nb_planes - 1) == (values[:, -1].min(), values[:, -1].max())
+
+        # Ranges without outliers stay in the actual value range
+        low, high = index.get_percentile_range(name, 5.0)
+        assert values.min() <= low <= high <= values.max()
+
+    file.close()
+
+
+def test_save_and_load_statistics_index(file_path):
+    file = Serafin(file_path, read_time=True, use_memmap=True)
+    file.get_2d()
+
+    index = TelemacStatisticsIndex(file_path)
+    for _processed in index.compute(file):
+        pass
+    file.close()
+
+    assert index.save() == index.get_index_paths()[0]
+
+    loaded = TelemacStatisticsIndex(file_path)
+    assert loaded.load()
+    assert loaded.names == index.names
+    assert np.array_equal(loaded.minima, index.minima)
+    assert np.array_equal(loaded.maxima, index.maxima)
+    for name in index.names:
+        assert loaded.get_percentile_range(name, 5.0) == index.get_percentile_range(name, 5.0)
+
+    # The index is outdated once the file has changed
+    with open(file_path, "ab") as file:
+        file.write(b"\0")
+    assert not TelemacStatisticsIndex(file_path).load()
+
+
+def test_statistics_index_without_time_points(file_path):
+    # Keep the header only (simulation which has just started)
+    file = Serafin(file_path, read_time=True)
+    header_size = int(file.entete_[0])
+    file.close()
+    with open(file_path, "r+b") as output:
+        output.truncate(header_size)
+
+    file = Serafin(file_path, read_time=True, use_memmap=True)
+    file.get_2d()
+    assert file.nb_pdt == 0
+
+    index = TelemacStatisticsIndex(file_path)
+    assert list(index.compute(file)) == []
+    assert index.names == [name[:16].rstrip() for name in file.nomvar]
+    assert index.minima.shape == (0, file.nbvar, max(file.nplan, 1))
+    assert not index.is_ok()
+    assert index.save() is None
+
+    file.close()
@@ -0,0 +1,90 @@
+# <pep8 compliant>
+import pytest
+import pyvista
+import numpy as np
+
+from nimphs.properties.openfoam.surface_cache import OpenfoamSurfaceCache
+
+
+def generate_mesh(time: float) -> pyvista.UnstructuredGrid:
+    """
+    Generate a hexahedral 'internalMesh' with point and cell data which depend on the given time.
+
+    Args:
+        time (float): time
+
+    Returns:
+        pyvista.UnstructuredGrid: mesh
+    """
+
+    mesh = pyvista.ImageData(dimensions=(5, 4, 3)).cast_to_unstructured_grid()
+    mesh.point_data["p"] = np.sin(mesh.points[:, 0] + time) + mesh.points[:, 2]
+    mesh.point_data["U"] = mesh.points * time
+    mesh.cell_data["p"] = np.arange(mesh.n_cells, dtype=np.float64) * time
+    mesh.cell_data["alpha"] = np.cos(np.arange(mesh.n_cells) + time)
+
+    return mesh
+
+
+def extract_surface(mesh: pyvista.UnstructuredGrid, triangulate: bool) -> pyvista.PolyData:
+    """
+    Extract the surface of the given mesh, as done when generating the vertices of OpenFOAM objects.
+
+    Args:
+        mesh (pyvista.UnstructuredGrid): mesh
+        triangulate (bool): triangulate the surface
+
+    Returns:
+        pyvista.PolyData: surface
+    """
+
+    surface = mesh.extract_surface(nonlinear_subdivision=0)
+    if triangulate:
+        surface.triangulate(inplace=True)
+        surface.compute_normals(inplace=True, consistent_normals=False, split_vertices=True)
+
+    return surface
+
+
+@pytest.mark.parametrize("triangulate", [False, True])
+def test_surface_cache(triangulate):
+    cache = OpenfoamSurfaceCache()
+    mesh = generate_mesh(0.0)
+    assert cache.get(mesh, triangulate) is None
+
+    first = extract_surface(mesh, triangulate)
+    cache.put(mesh, first, triangulate)
+    first_values = np.array(first.cell_data["alpha"])
+
+    # Same mesh, new values: point and cell data are sampled from the new mesh
+    mesh = generate_mesh(1.5)
+    cached = cache.get(mesh, triangulate)
+    fresh = extract_surface(mesh, triangulate)
+    assert cached is not None
+    assert np.array_equal(cached.points, fresh.points)
+    for name in ["p", "U"]:
+        assert np.array_equal(cached.point_data[name], fresh.point_data[name])
+    for name in ["p", "alpha"]:
+        assert np.array_equal(cached.cell_data[name], fresh.cell_data[name])
+
+    # Surfaces returned earlier are not modified
+    assert np.array_equal(first.cell_data["alpha"], first_values)
+
+    # Other triangulation state, moved points
+    assert cache.get(mesh, not triangulate) is None
+    mesh.points[:, 2] += 1.0
+    assert cache.get(mesh, triangulate) is None
+
+
+def test_surface_cache_without_cell_ids():
+    cache = OpenfoamSurfaceCache()
+    mesh = generate_mesh(0.0)
+
+    surface = extract_surface(mesh, False)
+    surface.cell_data.remove(OpenfoamSurfaceCache.ORIGINAL_CELL_IDS)
+    cache.put(mesh, surface, False)
+
+    # Outdated cell data are removed from the cached surface
+    cached = cache.get(generate_mesh(1.0), False)
+    assert "alpha" not in cached.cell_data.keys() and "p" not in cached.cell_data.keys()
+    assert "alpha" in surface.cell_data.keys()